@@ -0,0 +1,427 @@
+import os
+import json
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# Size, in degrees, of the lookup cells used to index cached squares. A
+# what3words square is about 3m across, so every square touches only a
+# handful of cells and every cell holds only a handful of squares.
+CELL_SIZE = 0.0001
+
+# Height, in degrees of latitude, of a what3words square (about 3m)
+SQUARE_SIZE = 0.000027
+
+
+def normalizeWords(words):
+    """
+    Returns a what3words address in the form used as key: without surrounding
+    whitespace or leading slashes, and in lower case.
+    """
+    return words.strip().lstrip('/').lower()
+
+
+def squareBounds(square):
+    """
+    Returns the (south, west, north, east) bounds of a what3words square.
+
+    :param square: The 'square' element of a what3words API response
+    :return: A tuple (south, west, north, east)
+    """
+    return (square['southwest']['lat'], square['southwest']['lng'],
+            square['northeast']['lat'], square['northeast']['lng'])
+
+
+def cellFor(lat, lng, cellSize=CELL_SIZE):
+    """
+    Returns the index of the lookup cell containing the given coordinates.
+    """
+    return int(math.floor(lat / cellSize)), int(math.floor(lng / cellSize))
+
+
+def squareCellFor(lat, lng):
+    """
+    Quantizes coordinates to a cell about the size of a what3words square.
+
+    Points in the same cell usually, but not always, fall in the same square, so
+    the cell only decides which points are worth requesting first.
+    """
+    lngSize = SQUARE_SIZE / max(math.cos(math.radians(lat)), 0.01)
+    return int(math.floor(lat / SQUARE_SIZE)), int(math.floor(lng / lngSize))
+
+
+def cellsForSquare(square, cellSize=CELL_SIZE):
+    """
+    Returns the indices of all the lookup cells touched by a what3words square.
+    """
+    south, west, north, east = squareBounds(square)
+    minLat, minLng = cellFor(south, west, cellSize)
+    maxLat, maxLng = cellFor(north, east, cellSize)
+    return [(i, j) for i in range(minLat, maxLat + 1) for j in range(minLng, maxLng + 1)]
+
+
+def squareContains(square, lat, lng):
+    """
+    Checks whether the given coordinates fall inside a what3words square.
+    """
+    south, west, north, east = squareBounds(square)
+    return south <= lat < north and west <= lng < east
+
+
+class SquareIndex(object):
+    """
+    In-memory spatial index of the what3words squares returned by the API.
+
+    Squares are bucketed in a grid of lookup cells, so finding the square that
+    contains a coordinate only has to check the few squares sharing its cell.
+    Once `maxSquares` squares are indexed, the least recently used ones are
+    dropped.
+    """
+
+    def __init__(self, maxSquares=100000):
+        self.maxSquares = maxSquares
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._squares = OrderedDict()  # words -> (language, cells, result)
+        self._cells = {}  # (language, cell_lat, cell_lng) -> list of results
+
+    def __len__(self):
+        return len(self._squares)
+
+    def find(self, lat, lng, language):
+        """
+        Returns the indexed conversion whose square contains the given coordinates.
+
+        :param lat: Latitude of the point
+        :param lng: Longitude of the point
+        :param language: The language of the what3words address
+        :return: The conversion, or None if no indexed square contains the point
+        """
+        key = ((language or '').lower(),) + cellFor(lat, lng)
+        with self._lock:
+            for result in self._cells.get(key, ()):
+                if squareContains(result['square'], lat, lng):
+                    self._squares.move_to_end(result['words'].lower())
+                    self.hits += 1
+                    return result
+            self.misses += 1
+            return None
+
+    def findWords(self, words):
+        """
+        Returns the indexed conversion for a what3words address.
+        """
+        words = normalizeWords(words)
+        with self._lock:
+            entry = self._squares.get(words)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._squares.move_to_end(words)
+            self.hits += 1
+            return entry[2]
+
+    def add(self, result):
+        """
+        Adds a conversion returned by the convert-to-3wa or convert-to-coordinates endpoints.
+        """
+        words = result['words'].lower()
+        language = result.get('language', '').lower()
+        with self._lock:
+            if words in self._squares:
+                self._squares.move_to_end(words)
+                return
+            cells = [(language, i, j) for i, j in cellsForSquare(result['square'])]
+            for cell in cells:
+                self._cells.setdefault(cell, []).append(result)
+            self._squares[words] = (language, cells, result)
+            while len(self._squares) > self.maxSquares:
+                self._discard(*self._squares.popitem(last=False))
+
+    def _discard(self, words, entry):
+        language, cells, result = entry
+        for cell in cells:
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                bucket.remove(result)
+                if not bucket:
+                    del self._cells[cell]
+
+    def clear(self):
+        with self._lock:
+            self._squares.clear()
+            self._cells.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class AutosuggestCache(object):
+    """
+    In-memory cache of autosuggest responses.
+
+    Responses are keyed by all the parameters of the request (the input text,
+    the language and the focus and clip options), so typing back text that was
+    already looked up, e.g. after a backspace, is answered without a request.
+    Entries expire after `ttl` seconds, and the least recently used ones are
+    dropped once `maxEntries` responses are cached.
+    """
+
+    def __init__(self, maxEntries=5000, ttl=86400, clock=time.monotonic):
+        self.maxEntries = maxEntries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (time, response)
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(params):
+        """
+        Returns the cache key of an autosuggest request, from its query parameters without the API key.
+        """
+        return tuple(sorted((k, str(v)) for k, v in params.items() if k != 'key'))
+
+    def get(self, key):
+        """
+        Returns the cached response for a key, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._clock() - entry[0] > self.ttl:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, response):
+        with self._lock:
+            self._entries[key] = (self._clock(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxEntries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class W3WCache(object):
+    """
+    Persistent cache of what3words conversions, stored in a SQLite database.
+
+    Each cached conversion is stored once, together with the bounds of its
+    3m square, so it can answer both convert-to-3wa lookups (any coordinate
+    inside the square, in the same language) and convert-to-coordinates
+    lookups (the 3 word address itself).
+
+    Entries older than `ttl` seconds are discarded when read, and the least
+    recently used entries are evicted once the cache holds more than
+    `maxEntries` squares.
+
+    Once closed, the cache behaves as an empty one that stores nothing, so
+    clients still holding it in other threads keep working.
+    """
+
+    # Number of writes between two checks of the cache size
+    PRUNE_INTERVAL = 1000
+
+    def __init__(self, path, maxEntries=1000000, ttl=30 * 86400):
+        self.path = path
+        self.maxEntries = maxEntries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._touched = {}
+        self._writes = 0
+
+        folder = os.path.dirname(path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._createTables()
+
+    def _createTables(self):
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS squares (
+                    words TEXT PRIMARY KEY,
+                    language TEXT NOT NULL,
+                    south REAL NOT NULL,
+                    west REAL NOT NULL,
+                    north REAL NOT NULL,
+                    east REAL NOT NULL,
+                    payload TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL
+                )""")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS cells (
+                    language TEXT NOT NULL,
+                    cell_lat INTEGER NOT NULL,
+                    cell_lng INTEGER NOT NULL,
+                    words TEXT NOT NULL REFERENCES squares(words) ON DELETE CASCADE
+                )""")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS cells_lookup ON cells(language, cell_lat, cell_lng)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS cells_words ON cells(words)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS squares_accessed ON squares(accessed)")
+
+    def _hit(self, words, payload, created):
+        if self.ttl and created < time.time() - self.ttl:
+            self._conn.execute("DELETE FROM squares WHERE words = ?", (words,))
+            self._conn.commit()
+            self.misses += 1
+            return None
+        self._touched[words] = time.time()
+        self.hits += 1
+        return json.loads(payload)
+
+    def getSquare(self, lat, lng, language):
+        """
+        Returns the cached conversion for the square containing the given coordinates.
+
+        :param lat: Latitude of the point
+        :param lng: Longitude of the point
+        :param language: The language of the what3words address
+        :return: The cached conversion, or None if it is not in the cache
+        """
+        cellLat, cellLng = cellFor(lat, lng)
+        with self._lock:
+            if self._conn is None:
+                self.misses += 1
+                return None
+            row = self._conn.execute("""
+                SELECT s.words, s.payload, s.created FROM cells c
+                JOIN squares s ON s.words = c.words
+                WHERE c.language = ? AND c.cell_lat = ? AND c.cell_lng = ?
+                AND s.south <= ? AND s.north > ? AND s.west <= ? AND s.east > ?
+                LIMIT 1""",
+                ((language or '').lower(), cellLat, cellLng, lat, lat, lng, lng)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            return self._hit(*row)
+
+    def getWords(self, words):
+        """
+        Returns the cached conversion for a what3words address.
+
+        :param words: The what3words address
+        :return: The cached conversion, or None if it is not in the cache
+        """
+        words = normalizeWords(words)
+        with self._lock:
+            if self._conn is None:
+                self.misses += 1
+                return None
+            row = self._conn.execute(
+                "SELECT words, payload, created FROM squares WHERE words = ?", (words,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            return self._hit(*row)
+
+    def put(self, result):
+        """
+        Stores a conversion returned by the convert-to-3wa or convert-to-coordinates endpoints.
+
+        :param result: The conversion, as returned by what3words.convertTo3wa or
+        what3words.convertToCoordinates
+        """
+        self.putMany([result])
+
+    def putMany(self, results):
+        """
+        Stores several conversions in a single transaction.
+        """
+        now = time.time()
+        with self._lock:
+            if self._conn is None:
+                return
+            with self._conn:
+                for result in results:
+                    words = result['words'].lower()
+                    language = result.get('language', '').lower()
+                    south, west, north, east = squareBounds(result['square'])
+                    self._conn.execute("DELETE FROM squares WHERE words = ?", (words,))
+                    self._conn.execute(
+                        "INSERT INTO squares VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (words, language, south, west, north, east, json.dumps(result), now, now))
+                    self._conn.executemany(
+                        "INSERT INTO cells VALUES (?, ?, ?, ?)",
+                        [(language, i, j, words) for i, j in cellsForSquare(result['square'])])
+                    self._writes += 1
+                self._flushTouched()
+            if self._writes >= self.PRUNE_INTERVAL:
+                self._writes = 0
+                self._prune()
+
+    def _flushTouched(self):
+        if self._touched:
+            self._conn.executemany("UPDATE squares SET accessed = ? WHERE words = ?",
+                                   [(t, w) for w, t in self._touched.items()])
+            self._touched = {}
+
+    def _prune(self):
+        with self._conn:
+            self._flushTouched()
+            if self.ttl:
+                self._conn.execute("DELETE FROM squares WHERE created < ?", (time.time() - self.ttl,))
+            count = self._conn.execute("SELECT COUNT(*) FROM squares").fetchone()[0]
+            if self.maxEntries and count > self.maxEntries:
+                self._conn.execute("""
+                    DELETE FROM squares WHERE words IN (
+                        SELECT words FROM squares ORDER BY accessed LIMIT ?)""",
+                    (count - self.maxEntries,))
+
+    def prune(self):
+        """
+        Removes expired entries and evicts the least recently used ones above the size limit.
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._prune()
+
+    def clear(self):
+        """
+        Removes all entries from the cache and resets the counters.
+        """
+        with self._lock:
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM squares")
+            self._touched = {}
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Returns the hit/miss counters and the number of cached squares.
+        """
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM squares").fetchone()[0] if self._conn is not None else 0
+        return {'hits': self.hits, 'misses': self.misses, 'entries': count}
+
+    def close(self):
+        with self._lock:
+            if self._conn is None:
+                return
+            with self._conn:
+                self._flushTouched()
+            self._conn.close()
+            self._conn = None
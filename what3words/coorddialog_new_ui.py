@@ -1,16 +1,16 @@
 import os
 import re
 import csv
+import time
 import webbrowser
 
 import urllib
 
-from PyQt5.QtWidgets import QTableWidgetItem, QHeaderView, QSizePolicy, QApplication, QDockWidget, QListWidget, QListWidgetItem, QFileDialog, QMessageBox, QMenu, QAction, QDialog, QVBoxLayout, QLabel, QComboBox, QDialogButtonBox
+from PyQt5.QtWidgets import QHeaderView, QSizePolicy, QApplication, QDockWidget, QListWidget, QListWidgetItem, QFileDialog, QMessageBox, QMenu, QAction, QDialog, QVBoxLayout, QLabel, QComboBox, QDialogButtonBox
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QIcon
 
-from qgis.core import Qgis, QgsWkbTypes, QgsPointXY, QgsCoordinateReferenceSystem, QgsCoordinateTransform, QgsProject, QgsFeature, QgsGeometry, QgsRectangle
-from qgis.gui import QgsVertexMarker
+from qgis.core import Qgis, QgsApplication, QgsMessageLog, QgsWkbTypes, QgsPointXY, QgsCoordinateReferenceSystem, QgsCoordinateTransform, QgsProject, QgsFeature, QgsGeometry, QgsRectangle
 from qgis.utils import iface
 
 from qgiscommons2.settings import pluginSetting
@@ -22,10 +22,22 @@ from what3words.grid import W3WGridManager
 from what3words.shared_layer_point import W3WPointLayerManager
 from what3words.w3w import what3words, GeoCodeException
 from what3words.ui.coorddialog_ui import Ui_discoverToWhat3words 
-from what3words.utils import get_w3w_instance
+from what3words.utils import get_w3w_instance, invalidate_w3w_instance, get_transform
+from what3words.csvimport import W3WCsvImportTask
+from what3words.markers import W3WMarkerLayer
+from what3words.tablemodel import W3WPointTableModel
+from what3words.pointstore import COLUMNS
+from what3words.latency import LatencyStats
 
 ICON_PATH = os.path.join(os.path.dirname(__file__), "icons")
 
+# Minimum time, in milliseconds, between two table updates while importing a CSV file
+IMPORT_UPDATE_INTERVAL = 250
+# Time, in milliseconds, the search box must stay unchanged before suggestions are requested
+SUGGEST_DEBOUNCE_INTERVAL = 150
+# Number of suggestion lists shown between two reports of the autosuggest latency percentiles
+LATENCY_REPORT_INTERVAL = 50
+
 class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
     settingsButtonClicked = pyqtSignal(bool)
 
@@ -40,13 +52,30 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
         self.mapToolForMapsite = W3WMapTool(self.canvas, self)
         self.mapToolForMapsite.w3wAddressCapturedForMapsite.connect(self.openMapsiteInBrowser)
         self.gridManager = None 
-        self.storedMarkers = []  # List to store markers on the map
-
-        # Initialize the W3W API instance
-        self.refreshW3WInstance()
+        self.markers = W3WMarkerLayer(self.canvas)  # Points shown on the map, drawn as a single item
+
+        # CSV import running in the background, and its rows waiting to be added to the table
+        self.importTask = None
+        self.importedRows = []
+        self.importTimer = QTimer(self)
+        self.importTimer.setSingleShot(True)
+        self.importTimer.timeout.connect(self.flushImportedRows)
+
+        # The W3W API instance is created on first use, so opening the plugin needs no settings or network
+        self.w3w = None
+
+        # Autosuggest requests are sent once typing pauses. Each one gets a sequence number,
+        # so replies to text that has changed since are ignored.
+        self.suggestTimer = QTimer(self)
+        self.suggestTimer.setSingleShot(True)
+        self.suggestTimer.timeout.connect(self.suggestW3W)
+        self.suggestRequest = None  # (client, W3WPendingRequest) of the request in flight
+        self.suggestSequence = 0
+        self.lastKeystroke = 0
+        self.suggestLatency = LatencyStats()
 
         # Connect signals from the map tool to the respective functions
-        self.canvas.extentsChanged.connect(self.updateMarkers)
+        self.canvas.destinationCrsChanged.connect(self.updateMarkers)
         self.canvas.extentsChanged.connect(self.redrawHighlight)
         self.settingsButton.clicked.connect(self.openSettingsDialog)
         self.settingsDialog = None  # To track the settings dialog
@@ -83,8 +112,13 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
         self.settingsButton.clicked.connect(self.openSettingsDialog)
         self.settingsButton.setCheckable(True)
 
-        self.tableWidget.itemSelectionChanged.connect(self.onTableItemSelected)
-        self.tableWidget.setEditTriggers(QHeaderView.NoEditTriggers)
+        # The table shows a W3WPointTableModel, so points are stored as numbers and only visible cells are rendered
+        self.pointModel = W3WPointTableModel(self)
+        self.tableView.setModel(self.pointModel)
+        self.tableView.selectionModel().selectionChanged.connect(self.onTableItemSelected)
+        self.tableView.setEditTriggers(QHeaderView.NoEditTriggers)
+        self.tableView.setSortingEnabled(True)
+        self.tableView.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
 
         self.showAllMarkersCheckBox.setChecked(True)
         self.showAllMarkersCheckBox.stateChanged.connect(self.toggleMarkerDisplay)
@@ -96,7 +130,7 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
         self.clearAll.clicked.connect(self.clearAllRows)
 
         # Connect text change in the input field to suggestions
-        self.addLineEdit.textChanged.connect(self.suggestW3W)
+        self.addLineEdit.textChanged.connect(self.onSearchTextChanged)
         self.listWidget = QListWidget(self.dockWidgetContents)
         self.listWidget.setVisible(False) 
         self.listWidget.itemClicked.connect(self.onSuggestionSelected)
@@ -106,15 +140,13 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
         # Add the listWidget just below the inputField
         self.inputField.addWidget(self.listWidget, 1, 0, 1, 2)
 
-        # Set up the table widget
-        self.tableWidget.setColumnCount(6)
-        self.tableWidget.setHorizontalHeaderLabels(["what3words", "Latitude", "Longitude", "Nearest Place", "Country", "Language"])
-        header = self.tableWidget.horizontalHeader()
+        # Set up the table view
+        header = self.tableView.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
        
-        # Enable custom context menu for the table widget
-        self.tableWidget.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.tableWidget.customContextMenuRequested.connect(self.showTableContextMenu)
+        # Enable custom context menu for the table view
+        self.tableView.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.tableView.customContextMenuRequested.connect(self.showTableContextMenu)
 
         # Handle dark mode styling
         self.handleDarkMode()
@@ -124,6 +156,7 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
         """
         Refreshes the what3words API instance based on the current settings.
         """
+        invalidate_w3w_instance()
         try:
             self.w3w = get_w3w_instance()
         except ValueError as e:
@@ -133,31 +166,17 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
     def addRowToTable(self, what3words, lat, lon, nearest_place, country, language):
         """
         Adds a new row to the table with what3words data.
+
+        :return: The id of the new row
         """
-        row_position = self.tableWidget.rowCount()
-        self.tableWidget.insertRow(row_position)
-        # List of columns with values and editability
-        columns = [
-            (what3words, False),  # Read-only
-            (str(lat), False),     # Read-only
-            (str(lon), False),     # Read-only
-            (nearest_place, False),# Read-only
-            (country, False),      # Read-only
-            (language, False)     # Read-only
-        ]
-
-        # Add items to the table with the appropriate editability
-        for col_index, (value, editable) in enumerate(columns):
-            item = QTableWidgetItem(value)
-            if not editable:
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)  # Make item read-only
-            self.tableWidget.setItem(row_position, col_index, item)
+        row_position = self.pointModel.rowCount()
+        row_id, = self.insertTableRows([(what3words, lat, lon, nearest_place, country, language)])
 
         # Temporarily block the selection signal to prevent triggering onTableItemSelected
-        self.tableWidget.blockSignals(True)
-        self.tableWidget.selectRow(row_position)  # Select the new row
-        self.tableWidget.scrollToItem(self.tableWidget.item(row_position, 0))  # Scroll to the new row
-        self.tableWidget.blockSignals(False)  # Re-enable the selection signal
+        self.tableView.selectionModel().blockSignals(True)
+        self.tableView.selectRow(row_position)  # Select the new row
+        self.tableView.scrollTo(self.pointModel.index(row_position, 0))  # Scroll to the new row
+        self.tableView.selectionModel().blockSignals(False)  # Re-enable the selection signal
 
         QApplication.clipboard().setText(what3words)
         iface.messageBar().pushMessage(
@@ -165,27 +184,41 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
             f"Added '{what3words}' to the table and copied to clipboard.", 
             level=Qgis.Success, duration=3
         )
+        return row_id
+
+    def insertTableRows(self, rows):
+        """
+        Appends rows to the table in one go.
+
+        :param rows: List of (what3words, lat, lon, nearest_place, country, language) tuples
+        :return: The ids of the new rows
+        """
+        return self.pointModel.appendRows(rows)
+
+    def selectedRows(self):
+        """
+        Returns the indices of the selected table rows, in ascending order.
+        """
+        return sorted(index.row() for index in self.tableView.selectionModel().selectedRows())
 
     def onTableItemSelected(self):
         """Handles the table row selection, updating markers to show only the selected row if Show All Markers is unchecked."""
-        selected_items = self.tableWidget.selectedItems()
-        if not selected_items:
+        selected_rows = self.selectedRows()
+        if not selected_rows:
             return
 
         # Retrieve latitude and longitude from the selected row
-        row = selected_items[0].row()
-        lat = float(self.tableWidget.item(row, 1).text())
-        lon = float(self.tableWidget.item(row, 2).text())
+        row = selected_rows[0]
+        lat = self.pointModel.store.lats[row]
+        lon = self.pointModel.store.lons[row]
 
         # Convert coordinates to map CRS
         point_map_crs = self.get_map_coordinate_from_lat_lon(lat, lon)
 
         # If Show All Markers is unchecked, clear all markers and add only the selected one
         if not self.showAllMarkersCheckBox.isChecked():
-            for marker in self.storedMarkers:
-                self.canvas.scene().removeItem(marker)
-            self.storedMarkers.clear()
-            self.addMarker(point_map_crs)  # Add only the marker for the selected row
+            # Show only the marker for the selected row
+            self.markers.setPoints([point_map_crs], [self.pointModel.store.ids[row]])
 
         # Highlight and center the selected point
         self.highlight(point_map_crs)
@@ -193,9 +226,8 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
         self.canvas.refresh()
 
     def get_map_coordinate_from_lat_lon(self, lat, lon):
-        epsg4326 = QgsCoordinateReferenceSystem("EPSG:4326")
         canvasCrs = self.canvas.mapSettings().destinationCrs()
-        transform = QgsCoordinateTransform(epsg4326, canvasCrs, QgsProject.instance())
+        transform = get_transform("EPSG:4326", canvasCrs)
 
         # Transform point from WGS84 to map CRS
         point_wgs84 = QgsPointXY(lon, lat)
@@ -204,7 +236,7 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
 
     def deleteSelectedRow(self):
         """Remove selected entries from the coordinate table and corresponding markers from the map."""
-        indices = [x.row() for x in self.tableWidget.selectionModel().selectedRows()]
+        indices = self.selectedRows()
         if not indices:
             iface.messageBar().pushMessage(
                 "what3words", "No rows selected to delete.", level=Qgis.Warning, duration=2
@@ -220,40 +252,26 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
 
         if reply == QMessageBox.Yes:
             # Block signals to prevent unwanted actions during deletion
-            self.tableWidget.blockSignals(True)
-            tolerance = 1e-6  # Tolerance level for precise coordinate matching
-
-            for row in sorted(indices, reverse=True):
-                # Retrieve latitude and longitude from the selected row
-                lat = float(self.tableWidget.item(row, 1).text())
-                lon = float(self.tableWidget.item(row, 2).text())
-
-                # Convert the coordinates from WGS84 to the map CRS to match marker positions accurately
-                point_map_crs = self.get_map_coordinate_from_lat_lon(lat, lon)
-
-                # Find and remove matching markers
-                markers_to_remove = [
-                    marker for marker in self.storedMarkers
-                    if abs(marker.center().x() - point_map_crs.x()) < tolerance and
-                    abs(marker.center().y() - point_map_crs.y()) < tolerance
-                ]
+            self.tableView.selectionModel().blockSignals(True)
 
-                for marker in markers_to_remove:
-                    self.canvas.scene().removeItem(marker)
-                    self.storedMarkers.remove(marker)
+            # Markers added from the map have no row id, so they are matched by their position in the map CRS
+            if self.markers.hasUnkeyedPoints():
+                store = self.pointModel.store
+                self.markers.removePoints([self.get_map_coordinate_from_lat_lon(store.lats[row], store.lons[row])
+                                           for row in indices])
 
-                # Remove the row from the table
-                self.tableWidget.removeRow(row)
+            # Remove the rows from the table, and the markers of those rows
+            self.markers.removeIds(self.pointModel.removeRowIndices(indices))
 
             # Unblock signals and clear selection
-            self.tableWidget.blockSignals(False)
-            self.tableWidget.clearSelection()
+            self.tableView.selectionModel().blockSignals(False)
+            self.tableView.clearSelection()
 
     def clearAllRows(self):
         """
         Deletes all rows from the table, but only if there are records.
         """
-        if self.tableWidget.rowCount() == 0:
+        if self.pointModel.rowCount() == 0:
             iface.messageBar().pushMessage(
                 "what3words", "No records to clear.", level=Qgis.Warning, duration=2
             )
@@ -265,10 +283,10 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
         )
 
         if reply == QMessageBox.Yes:
-            self.tableWidget.blockSignals(True)
+            self.tableView.selectionModel().blockSignals(True)
             self.removeMarkers()
-            self.tableWidget.setRowCount(0)
-            self.tableWidget.blockSignals(False)
+            self.pointModel.clear()
+            self.tableView.selectionModel().blockSignals(False)
 
     ## Context menu handling
     def showTableContextMenu(self, position):
@@ -293,30 +311,30 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
         menu.addAction(flashFeatureAction)
 
         # Show the context menu at the cursor position
-        menu.exec_(self.tableWidget.viewport().mapToGlobal(position))
+        menu.exec_(self.tableView.viewport().mapToGlobal(position))
 
     # Define actions for context menu
     def selectAllRows(self):
         """Selects all rows in the table."""
-        self.tableWidget.selectAll()
+        self.tableView.selectAll()
 
     def copyCellContent(self):
         """Copies the content of the selected cell to the clipboard."""
-        selected_item = self.tableWidget.currentItem()
-        if selected_item:
-            QApplication.clipboard().setText(selected_item.text())
+        selected_index = self.tableView.currentIndex()
+        if selected_index.isValid():
+            QApplication.clipboard().setText(selected_index.data())
             iface.messageBar().pushMessage("Copied", "Cell content copied to clipboard.", level=Qgis.Success, duration=2)
 
     def zoomToSelectedFeature(self):
         """Zooms to the feature associated with the selected row."""
-        selected_items = self.tableWidget.selectedItems()
-        if not selected_items:
+        selected_rows = self.selectedRows()
+        if not selected_rows:
             iface.messageBar().pushMessage("No Selection", "Please select a row.", level=Qgis.Warning, duration=2)
             return
 
-        row = selected_items[0].row()
-        lat = float(self.tableWidget.item(row, 1).text())
-        lon = float(self.tableWidget.item(row, 2).text())
+        row = selected_rows[0]
+        lat = self.pointModel.store.lats[row]
+        lon = self.pointModel.store.lons[row]
         center = self.get_map_coordinate_from_lat_lon(lat, lon)
 
         # Zoom to the feature
@@ -327,14 +345,14 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
 
     def flashSelectedFeature(self):
         """Flashes the feature associated with the selected row."""
-        selected_items = self.tableWidget.selectedItems()
-        if not selected_items:
+        selected_rows = self.selectedRows()
+        if not selected_rows:
             iface.messageBar().pushMessage("No Selection", "Please select a row.", level=Qgis.Warning, duration=2)
             return
 
-        row = selected_items[0].row()
-        lat = float(self.tableWidget.item(row, 1).text())
-        lon = float(self.tableWidget.item(row, 2).text())
+        row = selected_rows[0]
+        lat = self.pointModel.store.lats[row]
+        lon = self.pointModel.store.lons[row]
         center = self.get_map_coordinate_from_lat_lon(lat, lon)
 
         # Flash the feature
@@ -427,7 +445,7 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
         """
         Saves all records from the table to a new layer. If there are no records, shows an error message.
         """
-        if self.tableWidget.rowCount() == 0:
+        if self.pointModel.rowCount() == 0:
             iface.messageBar().pushMessage(
                 "what3words", "No records in the table to save.", level=Qgis.Warning, duration=2
             )
@@ -445,13 +463,7 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
 
         # Loop through each row in the table and save to the layer
         features = []
-        for row in range(self.tableWidget.rowCount()):
-            what3words = self.tableWidget.item(row, 0).text()
-            latitude = float(self.tableWidget.item(row, 1).text())
-            longitude = float(self.tableWidget.item(row, 2).text())
-            nearest_place = self.tableWidget.item(row, 3).text()
-            country = self.tableWidget.item(row, 4).text()
-            language = self.tableWidget.item(row, 5).text()
+        for what3words, latitude, longitude, nearest_place, country, language in self.pointModel.store.rows():
 
             # Create the data structure for the point feature
             feature = QgsFeature()
@@ -492,28 +504,58 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
             iface.messageBar().pushMessage("what3words", f"Error saving to layer: {str(e)}", level=Qgis.Warning, duration=2)
 
     ## Suggestions handling
-    def suggestW3W(self, text):
-        """Fetches autosuggest suggestions for a partial what3words address."""
+    def onSearchTextChanged(self, text):
+        """Hides the outdated suggestions and waits for typing to pause before requesting new ones."""
+        self.lastKeystroke = time.perf_counter()
+        self.cancelSuggestions()
         self.listWidget.clear()
         self.listWidget.setVisible(False)
+        self.suggestTimer.start(SUGGEST_DEBOUNCE_INTERVAL)
+
+    def cancelSuggestions(self):
+        """Stops waiting for suggestions and aborts the request in flight, if any."""
+        self.suggestTimer.stop()
+        self.suggestSequence += 1
+        if self.suggestRequest is not None:
+            client, request = self.suggestRequest
+            client.pool().abort(request)
+            self.suggestRequest = None
+
+    def suggestW3W(self, text=None):
+        """Requests autosuggest suggestions for a partial what3words address, without blocking."""
+        text = self.addLineEdit.text() if text is None else text
+        self.cancelSuggestions()
         self.w3w = get_w3w_instance()
 
         # Validate what3words address format
         if not self.w3w.is_possible_3wa(text):
             return
 
-        try:
-            suggestions = self.w3w.autosuggest(text)
+        # Cached suggestions are shown right away, and no request is left in flight
+        sequence = self.suggestSequence
+        request = self.w3w.autosuggestAsync(lambda response: self.onSuggestionsReceived(sequence, response), text)
+        self.suggestRequest = None if request is None else (self.w3w, request)
 
-            if not suggestions.get('suggestions'):
-                error_message = suggestions.get('error', {}).get('message', 'No suggestions found.')
-                iface.messageBar().pushMessage("what3words", error_message, level=Qgis.Warning, duration=2)
-                return
+    def onSuggestionsReceived(self, sequence, response):
+        """Shows the suggestions of the latest request; replies to older text are discarded."""
+        if sequence != self.suggestSequence:
+            return
+        self.suggestRequest = None
 
-            self.populateSuggestionsList(suggestions['suggestions'])
+        if isinstance(response, Exception):
+            iface.messageBar().pushMessage("what3words", f"Network error: {str(response)}", level=Qgis.Warning, duration=2)
+            return
+        if not response.get('suggestions'):
+            error_message = response.get('error', {}).get('message', 'No suggestions found.')
+            iface.messageBar().pushMessage("what3words", error_message, level=Qgis.Warning, duration=2)
+            return
 
-        except Exception as e:
-            iface.messageBar().pushMessage("what3words", f"Network error: {str(e)}", level=Qgis.Warning, duration=2)
+        self.populateSuggestionsList(response['suggestions'])
+
+        # Time from the last keystroke to the suggestions being shown, debounce included
+        self.suggestLatency.record(time.perf_counter() - self.lastKeystroke)
+        if self.suggestLatency.count % LATENCY_REPORT_INTERVAL == 0:
+            QgsMessageLog.logMessage(f"Autosuggest latency: {self.suggestLatency.summary()}", "what3words", Qgis.Info)
 
     def populateSuggestionsList(self, suggestions):
         """Populates the suggestions list widget with items from the suggestions data."""
@@ -547,13 +589,16 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
     def onSuggestionSelected(self, item):
         """Handles the event when a suggestion is selected from the list."""
         what3words = item.text().split(',')[0].replace("///", "")
+        self.addLineEdit.blockSignals(True)  # Picking a suggestion should not ask for more
         self.addLineEdit.setText(what3words)
+        self.addLineEdit.blockSignals(False)
+        self.cancelSuggestions()
         self.listWidget.setVisible(False)  # Hide the suggestions list
-        self.fetchAndDisplayDetails(what3words)
-        self.showW3WPoint()
+        row_id = self.fetchAndDisplayDetails(what3words)
+        self.showW3WPoint(row_id=row_id)
 
-    def showW3WPoint(self, selected_text=None):
-        """Show the W3W point on the map when a suggestion is selected."""
+    def showW3WPoint(self, selected_text=None, row_id=None):
+        """Show the W3W point on the map when a suggestion is selected, as the marker of the given table row."""
         try:
             if selected_text is None:
                 w3wCoord = str(self.addLineEdit.text()).replace(" ", "")
@@ -568,7 +613,7 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
             # Convert coordinates to map CRS
             center = self.get_map_coordinate_from_lat_lon(lat, lng)
             
-            self.addMarker(center)
+            self.addMarker(center, row_id)
 
             self.canvas.setCenter(center)
             self.canvas.zoomScale(591657550.5 / (2 ** self.zoom_level))
@@ -580,7 +625,7 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
             QApplication.restoreOverrideCursor()        
     
     def fetchAndDisplayDetails(self, what3words):
-        """Fetches W3W details for the selected address and displays them in the table."""
+        """Fetches W3W details for the selected address and displays them in the table, returning the id of the new row."""
         try:
             self.w3w = get_w3w_instance()
             response_json = self.w3w.convertToCoordinates(what3words)
@@ -591,7 +636,7 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
             language = response_json.get("language", "")
 
             # Add details to the table
-            self.addRowToTable(what3words, lat, lng, nearest_place, country, language)
+            return self.addRowToTable(what3words, lat, lng, nearest_place, country, language)
 
         except GeoCodeException as e:
             iface.messageBar().pushMessage("what3words", str(e), level=Qgis.Warning, duration=2)
@@ -601,8 +646,7 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
         """Returns a bounding box string in EPSG:4326 coordinates for the current map extent."""
         extent = self.canvas.extent()
         canvasCrs = self.canvas.mapSettings().destinationCrs()
-        epsg4326 = QgsCoordinateReferenceSystem("EPSG:4326")
-        transform4326 = QgsCoordinateTransform(canvasCrs, epsg4326, QgsProject.instance())
+        transform4326 = get_transform(canvasCrs, "EPSG:4326")
         bottom_left = transform4326.transform(extent.xMinimum(), extent.yMinimum())
         top_right = transform4326.transform(extent.xMaximum(), extent.yMaximum())
         return f"{bottom_left.y()},{bottom_left.x()},{top_right.y()},{top_right.x()}"
@@ -613,7 +657,7 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
         Saves the table data to a CSV file if there are records in the table.
         """
         # Check if the table has any records
-        if self.tableWidget.rowCount() == 0:
+        if self.pointModel.rowCount() == 0:
             QMessageBox.warning(self, "Error", "No records available to save.")
             return
 
@@ -632,13 +676,10 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
                     writer = csv.writer(file)
                     
                     # Write the header
-                    headers = ["what3words", "Latitude", "Longitude", "Nearest Place", "Country", "Language"]
-                    writer.writerow(headers)
+                    writer.writerow(COLUMNS)
                     
                     # Write each row of data from the table
-                    for row in range(self.tableWidget.rowCount()):
-                        row_data = [self.tableWidget.item(row, col).text() for col in range(self.tableWidget.columnCount())]
-                        writer.writerow(row_data)
+                    writer.writerows(self.pointModel.store.rows())
                 
                 QMessageBox.information(self, "Success", f"Data saved successfully to {file_path}.")
             
@@ -654,6 +695,10 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
             2. Only the latitude and longitude fields
             3. Both the what3words field and the latitude and longitude fields
         """
+        if self.importTask is not None:
+            iface.messageBar().pushMessage("what3words", "A CSV import is already running.", level=Qgis.Warning, duration=3)
+            return
+
         # Open file dialog to select CSV
         file_dialog = QFileDialog()
         file_dialog.setNameFilter("CSV Files (*.csv)")
@@ -662,75 +707,88 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
         csv_path = file_dialog.selectedFiles()[0]
 
         try:
-            # Read the CSV file
+            # Read only the header here; the rows are streamed by the import task
             with open(csv_path, 'r', encoding='utf-8-sig') as csv_file:  # Handle BOM in UTF-8 files
-                reader = csv.DictReader(csv_file)
-
-                # Get field names from the CSV
-                fieldnames = reader.fieldnames
-                if not fieldnames:
-                    QMessageBox.warning(self, "Error", "The CSV file has no headers.")
-                    return
-
-                # Ask the user to map fields
-                w3w_column, lat_column, lon_column = self.askUserToMapFields(fieldnames)
-
-                # Stop processing if the user canceled the dialog
-                if w3w_column is None and lat_column is None and lon_column is None:
-                    return
-
-                # Validate field mapping
-                if not w3w_column and not (lat_column and lon_column):
-                    QMessageBox.warning(
-                        self, "Error",
-                        "You must map at least one of the following:\n"
-                        "1. The what3words address field\n"
-                        "2. Both latitude and longitude fields."
-                    )
-                    return
-
-                # Process each row
-                for row in reader:
-                    # Handle what3words addresses
-                    if w3w_column and row[w3w_column].strip():
-                        try:
-                            self.fetchAndDisplayDetails(row[w3w_column].strip())
-                        except GeoCodeException as e:
-                            iface.messageBar().pushMessage(
-                                "what3words", f"Error processing row with what3words address '{row[w3w_column]}': {str(e)}",
-                                level=Qgis.Warning, duration=3
-                            )
-
-                    # Handle latitude and longitude
-                    if lat_column and lon_column and row[lat_column].strip() and row[lon_column].strip():
-                        try:
-                            lat = float(row[lat_column].strip())
-                            lon = float(row[lon_column].strip())
-                            self.w3w = get_w3w_instance()
-                            response = self.w3w.convertTo3wa(lat, lon)
-                            self.addRowToTable(
-                                what3words=response['words'],
-                                lat=lat,
-                                lon=lon,
-                                nearest_place=response.get('nearestPlace', ''),
-                                country=response.get('country', ''),
-                                language=response.get('language', '')
-                            )
-                            point_map_crs = self.get_map_coordinate_from_lat_lon(lat, lon)
-                            self.addMarker(point_map_crs)
-                        except (ValueError, GeoCodeException) as e:
-                            iface.messageBar().pushMessage(
-                                "what3words", f"Error processing row with coordinates ({lat}, {lon}): {str(e)}",
-                                level=Qgis.Warning, duration=3
-                            )
-                    elif not w3w_column:
-                        iface.messageBar().pushMessage(
-                            "what3words", "Skipping invalid row in CSV. Missing or invalid data.",
-                            level=Qgis.Warning, duration=3
-                        )
+                fieldnames = csv.DictReader(csv_file).fieldnames
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to import CSV: {str(e)}")
+            return
+
+        # Get field names from the CSV
+        if not fieldnames:
+            QMessageBox.warning(self, "Error", "The CSV file has no headers.")
+            return
+
+        # Ask the user to map fields
+        w3w_column, lat_column, lon_column = self.askUserToMapFields(fieldnames)
+
+        # Stop processing if the user canceled the dialog
+        if w3w_column is None and lat_column is None and lon_column is None:
+            return
+
+        # Validate field mapping
+        if not w3w_column and not (lat_column and lon_column):
+            QMessageBox.warning(
+                self, "Error",
+                "You must map at least one of the following:\n"
+                "1. The what3words address field\n"
+                "2. Both latitude and longitude fields."
+            )
+            return
+
+        # Resolve the rows in the background; progress and cancel are available in the task manager
+        self.importTask = W3WCsvImportTask(csv_path, w3w_column, lat_column, lon_column)
+        self.importTask.rowsImported.connect(self.queueImportedRows)
+        self.importTask.taskCompleted.connect(self.importFinished)
+        self.importTask.taskTerminated.connect(self.importFinished)
+        QgsApplication.taskManager().addTask(self.importTask)
+        iface.messageBar().pushMessage("what3words", "Importing CSV file in the background.", level=Qgis.Info, duration=3)
+
+    def queueImportedRows(self, rows):
+        """
+        Buffers rows resolved by the import task; they are added to the table at most every IMPORT_UPDATE_INTERVAL ms.
+        """
+        self.importedRows.extend(rows)
+        if not self.importTimer.isActive():
+            self.importTimer.start(IMPORT_UPDATE_INTERVAL)
 
+    def flushImportedRows(self):
+        """
+        Adds the buffered imported rows to the table and their markers to the map.
+        """
+        rows, self.importedRows = self.importedRows, []
+        if not rows:
+            return
+        ids = self.insertTableRows([(row['words'], row['lat'], row['lon'], row['nearestPlace'], row['country'], row['language'])
+                                    for row in rows])
+        if self.showAllMarkersCheckBox.isChecked():
+            self.markers.addPoints([self.get_map_coordinate_from_lat_lon(row['lat'], row['lon']) for row in rows], ids)
+        self.tableView.scrollToBottom()
+
+    def importFinished(self):
+        """
+        Adds the last imported rows and reports the outcome of the import.
+        """
+        task, self.importTask = self.importTask, None
+        self.importTimer.stop()
+        self.flushImportedRows()
+        if task is None:
+            return
+
+        for error in task.errors:
+            QgsMessageLog.logMessage(error, "what3words", Qgis.Warning)
+        if task.exception is not None:
+            iface.messageBar().pushMessage("what3words", f"Failed to import CSV: {str(task.exception)}",
+                                           level=Qgis.Critical, duration=5)
+        elif task.isCanceled():
+            iface.messageBar().pushMessage("what3words", f"CSV import canceled after {task.imported} rows.",
+                                           level=Qgis.Warning, duration=5)
+        elif task.skipped:
+            iface.messageBar().pushMessage(
+                "what3words", f"Imported {task.imported} rows; {task.skipped} rows could not be processed "
+                              "(see the what3words log for details).", level=Qgis.Warning, duration=5)
+        else:
+            iface.messageBar().pushMessage("what3words", f"Imported {task.imported} rows.", level=Qgis.Success, duration=3)
 
     def askUserToMapFields(self, fieldnames):
         """
@@ -885,71 +943,53 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
         if hasattr(self, 'highlighted_point') and self.highlighted_point:
             self.highlight(self.highlighted_point)
             
-    def addMarker(self, point):
+    def addMarker(self, point, row_id=None):
         """
-        Adds a marker to the map and stores it in `storedMarkers`.
+        Adds a marker to the map. If Show All Markers is unchecked, it replaces the marker shown.
+
+        :param row_id: Id of the table row of the point, so the marker is removed with the row
         """
-        if not self.showAllMarkersCheckBox.isChecked():
-            for marker in self.storedMarkers:
-                self.canvas.scene().removeItem(marker)
-
-        marker = QgsVertexMarker(self.canvas)
-        marker.setIconType(QgsVertexMarker.ICON_CROSS)
-        marker.setColor(Qt.red)
-        marker.setIconSize(18)
-        marker.setPenWidth(2)
-        marker.setCenter(point)
-        self.canvas.scene().addItem(marker) 
-        self.storedMarkers.append(marker)
+        ids = None if row_id is None else [row_id]
+        if self.showAllMarkersCheckBox.isChecked():
+            self.markers.addPoints([point], ids)
+        else:
+            self.markers.setPoints([point], ids)
 
     def updateMarkers(self):
         """
-        Refreshes the positions of the markers to ensure they stay accurate
-        during map panning or zooming.
+        Redraws the markers of all the table rows, e.g. after the map CRS changes.
+        Panning and zooming need no update, as the marker layer follows the canvas.
         """
         if not self.showAllMarkersCheckBox.isChecked():
             return  # Do nothing if Show All Markers is unchecked
 
-        # Clear all current markers
-        for marker in self.storedMarkers:
-            self.canvas.scene().removeItem(marker)
-
-        self.storedMarkers.clear()
-
-        # Re-add all markers based on the table data
-        for row in range(self.tableWidget.rowCount()):
-            lat = float(self.tableWidget.item(row, 1).text())
-            lon = float(self.tableWidget.item(row, 2).text())
-            point_map_crs = self.get_map_coordinate_from_lat_lon(lat, lon)
-            self.addMarker(point_map_crs)
+        canvasCrs = self.canvas.mapSettings().destinationCrs()
+        transform = get_transform("EPSG:4326", canvasCrs)
+        store = self.pointModel.store
+        self.markers.setPoints([transform.transform(QgsPointXY(lon, lat)) for lat, lon in store.coordinates()],
+                               list(store.ids))
         
     def clearMarkers(self):
         """
-        Hides all markers from the map view without removing them from storedMarkers,
+        Hides all markers from the map view without removing the table rows,
         allowing them to be restored if Show All Markers is rechecked.
         """
         self.showAllMarkersCheckBox.setChecked(False)
         # Hide all markers from the map
-        for marker in self.storedMarkers:
-            if marker is not None:
-                self.canvas.scene().removeItem(marker)
+        self.markers.clear()
             
-        # Clear any selections in the table widget to avoid triggering item selection events
-        self.tableWidget.blockSignals(True)
-        self.tableWidget.clearSelection()
-        self.tableWidget.blockSignals(False)
+        # Clear any selections in the table to avoid triggering item selection events
+        self.tableView.selectionModel().blockSignals(True)
+        self.tableView.clearSelection()
+        self.tableView.selectionModel().blockSignals(False)
 
         iface.messageBar().pushMessage("what3words", "Markers hidden from the map. Use 'Show All Markers' to display them again.", level=Qgis.Info, duration=2)
     
     def removeMarkers(self):
         """
-        Removes all markers from the map and clears the storedMarkers list.
+        Removes all markers from the map.
         """
-        if hasattr(self, 'storedMarkers') and self.storedMarkers:
-            for marker in self.storedMarkers:
-                if marker:
-                    self.canvas.scene().removeItem(marker)
-            self.storedMarkers.clear()                 
+        self.markers.clear()
 
     def toggleMarkerDisplay(self):
         """
@@ -960,18 +1000,15 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
             self.updateMarkers()
         else:
             # Hide all markers and show only the selected one if any row is selected
-            for marker in self.storedMarkers:
-                self.canvas.scene().removeItem(marker)
-            self.storedMarkers.clear()
-
-            # Check if a row is selected in the table
-            selected_items = self.tableWidget.selectedItems()
-            if selected_items:
-                row = selected_items[0].row()
-                lat = float(self.tableWidget.item(row, 1).text())
-                lon = float(self.tableWidget.item(row, 2).text())
-                point_map_crs = self.get_map_coordinate_from_lat_lon(lat, lon)
-                self.addMarker(point_map_crs)  # Add marker only for the selected row
+            points, ids = [], []
+            selected_rows = self.selectedRows()
+            if selected_rows:
+                row = selected_rows[0]
+                lat = self.pointModel.store.lats[row]
+                lon = self.pointModel.store.lons[row]
+                points.append(self.get_map_coordinate_from_lat_lon(lat, lon))  # Marker only for the selected row
+                ids.append(self.pointModel.store.ids[row])
+            self.markers.setPoints(points, ids)
     
     ## Dock widget handling
     def closeEvent(self, event):
@@ -983,8 +1020,13 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
         self.canvas.unsetMapTool(self.mapTool)
         self.canvas.unsetMapTool(self.mapToolForMapsite)
 
+        # Stop any pending autosuggest request
+        self.cancelSuggestions()
+        if len(self.suggestLatency):
+            QgsMessageLog.logMessage(f"Autosuggest latency: {self.suggestLatency.summary()}", "what3words", Qgis.Info)
+
         # Disconnect the extentsChanged signal
-        self.canvas.extentsChanged.disconnect(self.updateMarkers)
+        self.canvas.destinationCrsChanged.disconnect(self.updateMarkers)
         self.canvas.extentsChanged.disconnect(self.redrawHighlight)
 
         # Uncheck the coordDialogAction button
@@ -998,11 +1040,11 @@ class W3WCoordInputDialog(QDockWidget, Ui_discoverToWhat3words):
                 self.gridManager.enableGrid(False)  # Disable the grid if it's enabled
 
         # Clear table selection
-        if hasattr(self, 'tableWidget') and self.tableWidget:
-            self.tableWidget.clearSelection()
+        if hasattr(self, 'tableView') and self.tableView:
+            self.tableView.clearSelection()
 
         # Hide all markers
-        if hasattr(self, 'storedMarkers') and self.storedMarkers:
+        if len(self.markers):
             self.clearMarkers()
 
         # Call the base class closeEvent
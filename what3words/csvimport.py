@@ -0,0 +1,118 @@
+import csv
+import os
+from itertools import islice
+
+from qgis.core import QgsTask
+from qgis.PyQt.QtCore import pyqtSignal
+
+from what3words.utils import get_w3w_instance
+
+# Number of CSV rows read and resolved at a time
+IMPORT_CHUNK_SIZE = 200
+# Maximum number of error messages kept for the final report
+MAX_REPORTED_ERRORS = 20
+
+
+class W3WCsvImportTask(QgsTask):
+    """
+    Imports a CSV file of what3words addresses and/or coordinates in the background.
+
+    Rows are read in chunks as the file is parsed, and the addresses and
+    coordinates of each chunk are resolved with concurrent requests. Each
+    resolved chunk is handed to the GUI thread through `rowsImported`, as a list
+    of dicts with 'words', 'lat', 'lon', 'nearestPlace', 'country' and 'language'.
+    """
+
+    rowsImported = pyqtSignal(list)
+
+    def __init__(self, path, w3w_column=None, lat_column=None, lon_column=None, chunkSize=IMPORT_CHUNK_SIZE):
+        super().__init__("Importing what3words CSV file", QgsTask.CanCancel)
+        self.path = path
+        self.w3w_column = w3w_column
+        self.lat_column = lat_column
+        self.lon_column = lon_column
+        self.chunkSize = chunkSize
+        self.imported = 0
+        self.skipped = 0
+        self.errors = []
+        self.exception = None
+
+    def run(self):
+        try:
+            w3w = get_w3w_instance()
+            size = os.path.getsize(self.path) or 1
+            with open(self.path, 'r', encoding='utf-8-sig') as csv_file:  # Handle BOM in UTF-8 files
+                reader = csv.DictReader(csv_file)
+                while not self.isCanceled():
+                    rows = list(islice(reader, self.chunkSize))
+                    if not rows:
+                        break
+                    results = self.resolveRows(w3w, rows)
+                    self.imported += len(results)
+                    if results:
+                        self.rowsImported.emit(results)
+                    self.setProgress(min(100.0, csv_file.buffer.tell() * 100.0 / size))
+            return not self.isCanceled()
+        except Exception as e:
+            self.exception = e
+            return False
+
+    def resolveRows(self, w3w, rows):
+        """
+        Resolves the addresses and coordinates of a chunk of rows.
+
+        :return: The list of imported rows, in the order of the file
+        """
+        parsed = [self.parseRow(row) for row in rows]
+        located = iter(w3w.convertToCoordinatesMany([words for words, point in parsed if words]))
+        converted = iter(w3w.convertTo3waMany([point for words, point in parsed if point]))
+
+        results = []
+        for words, point in parsed:
+            if words:
+                result = next(located)
+                if isinstance(result, Exception):
+                    self.error(f"Error processing row with what3words address '{words}': {result}")
+                else:
+                    results.append(self.importedRow(words, result['coordinates']['lat'],
+                                                    result['coordinates']['lng'], result))
+            if point:
+                result = next(converted)
+                if isinstance(result, Exception):
+                    self.error(f"Error processing row with coordinates ({point[0]}, {point[1]}): {result}")
+                else:
+                    results.append(self.importedRow(result['words'], point[0], point[1], result))
+        return results
+
+    def parseRow(self, row):
+        """
+        Returns the (what3words address, (lat, lon)) mapped in a CSV row, either of them possibly None.
+        """
+        words = (row.get(self.w3w_column) or '').strip() if self.w3w_column else ''
+        point = None
+        if self.lat_column and self.lon_column:
+            lat = (row.get(self.lat_column) or '').strip()
+            lon = (row.get(self.lon_column) or '').strip()
+            if lat and lon:
+                try:
+                    point = (float(lat), float(lon))
+                except ValueError as e:
+                    self.error(f"Error processing row with coordinates ({lat}, {lon}): {e}")
+            elif not self.w3w_column:
+                self.error("Skipping invalid row in CSV. Missing or invalid data.")
+        return words or None, point
+
+    def importedRow(self, words, lat, lon, result):
+        return {
+            'words': words,
+            'lat': lat,
+            'lon': lon,
+            'nearestPlace': result.get('nearestPlace', ''),
+            'country': result.get('country', ''),
+            'language': result.get('language', '')
+        }
+
+    def error(self, message):
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
@@ -1,17 +1,30 @@
 import os
 import json
+import time
+from functools import partial
 
-from qgis.core import (Qgis, QgsCoordinateReferenceSystem, QgsCoordinateTransform,
-                       QgsProject, QgsVectorLayer, QgsFeature, QgsGeometry, QgsPoint,
+from qgis.core import (Qgis, QgsMessageLog, QgsCoordinateReferenceSystem, QgsCoordinateTransform,
+                       QgsProject, QgsVectorLayer, QgsFeature, QgsGeometry, QgsPointXY,
                        QgsLineSymbol, QgsSingleSymbolRenderer, QgsMapLayer,
                        QgsField, QgsVectorFileWriter)
-from qgis.PyQt.QtCore import Qt, QVariant
-from qgis.PyQt.QtGui import QCursor
-from qgis.PyQt.QtWidgets import QApplication, QFileDialog
+from qgis.PyQt.QtCore import Qt, QVariant, QTimer
+from qgis.PyQt.QtWidgets import QFileDialog
 from qgis.utils import iface
 from qgiscommons2.settings import pluginSetting
 from what3words.w3w import GeoCodeException
-from what3words.utils import get_w3w_instance
+from what3words.utils import get_w3w_instance, get_transform, get_grid_tile_cache
+from what3words.gridtiles import tilesForExtent, tileBounds, tileBoundingBox, compactLines
+from what3words.gridgen import calibrate, gridLines, linesMatch
+from what3words.latency import LatencyStats
+
+# Maximum number of grid tiles drawn for one view
+MAX_GRID_TILES = 100
+# Time, in milliseconds, the map must stay still before the grid is refreshed
+GRID_REFRESH_DEBOUNCE_INTERVAL = 200
+# Number of grid refreshes between two reports of the map-move-to-grid latency percentiles
+LATENCY_REPORT_INTERVAL = 20
+# One in this many tiles generated locally is also requested from the API, to check the generated lines
+LOCAL_GRID_VERIFY_INTERVAL = 5
 
 
 class W3WGridManager:
@@ -24,6 +37,25 @@ class W3WGridManager:
         self.grid_enabled = False  
         self.geojson_path = os.path.join(os.path.dirname(__file__), "w3w_grid.geojson")
         self.last_grid_extent = None 
+        self.tileFeatures = {}  # Tile drawn in the grid layer -> id of its feature
+        self.gridSymbology = None  # Whether the symbology applied to the grid layer is the satellite one
+
+        # The grid is refreshed once the map stops moving, and missing tiles are requested
+        # without blocking. Requests for tiles that have left the view are aborted.
+        self.refreshTimer = QTimer()
+        self.refreshTimer.setSingleShot(True)
+        self.refreshTimer.timeout.connect(self.fetchAndDrawW3WGrid)
+        self.visibleTiles = []
+        self.pendingTiles = {}  # Tile -> (client, W3WPendingRequest)
+        self.gridErrorShown = False
+        self.extentChangedAt = None
+        self.gridLatency = LatencyStats()
+
+        # Missing tiles next to a tile returned by the API are generated from its lattice, until
+        # a generated tile differs from the API
+        self.localGrid = True
+        self.generatedTiles = {}  # Generated tile not checked against the API -> lattice
+        self.generatedCount = 0
 
     def enableGrid(self, enable=True):
         """
@@ -38,7 +70,11 @@ class W3WGridManager:
                     self.ensureGridLayer()
 
                 # Connect the signal to fetch and draw the grid
-                iface.mapCanvas().extentsChanged.connect(self.fetchAndDrawW3WGrid)
+                iface.mapCanvas().extentsChanged.connect(self.scheduleGridRefresh)
+                # The symbology depends on the basemap, so it is only checked when layers are added or removed
+                QgsProject.instance().layersAdded.connect(self.onProjectLayersChanged)
+                QgsProject.instance().layersRemoved.connect(self.onProjectLayersChanged)
+                self.extentChangedAt = time.perf_counter()
                 self.fetchAndDrawW3WGrid()
             except RuntimeError as e:
                 iface.messageBar().pushMessage(
@@ -47,9 +83,16 @@ class W3WGridManager:
                     level=Qgis.Critical, duration=5
                 )
         else:
+            self.refreshTimer.stop()
+            self.abortTileRequests()
+            self.last_grid_extent = None
+            if len(self.gridLatency):
+                QgsMessageLog.logMessage(f"Grid latency: {self.gridLatency.summary()}", "what3words", Qgis.Info)
             try:
                 # Disconnect the signal if connected
-                iface.mapCanvas().extentsChanged.disconnect(self.fetchAndDrawW3WGrid)
+                iface.mapCanvas().extentsChanged.disconnect(self.scheduleGridRefresh)
+                QgsProject.instance().layersAdded.disconnect(self.onProjectLayersChanged)
+                QgsProject.instance().layersRemoved.disconnect(self.onProjectLayersChanged)
             except TypeError:
                 # Handle the case where the signal is not connected
                 iface.messageBar().pushMessage(
@@ -82,9 +125,17 @@ class W3WGridManager:
         else:
             iface.messageBar().pushMessage("Grid", "Save operation canceled.", level=Qgis.Warning)
 
+    def scheduleGridRefresh(self):
+        """
+        Refreshes the grid once the map has stopped moving for GRID_REFRESH_DEBOUNCE_INTERVAL ms.
+        """
+        if self.extentChangedAt is None:
+            self.extentChangedAt = time.perf_counter()
+        self.refreshTimer.start(GRID_REFRESH_DEBOUNCE_INTERVAL)
+
     def fetchAndDrawW3WGrid(self):
         """
-        Fetches the What3words grid for the current map extent and draws it on the map.
+        Draws the What3words grid for the current map extent, requesting the missing tiles in the background.
         """
         if not self.grid_enabled:
             return
@@ -94,6 +145,7 @@ class W3WGridManager:
         zoom_level = self.getZoomLevel()
 
         if zoom_level < 17 or zoom_level > 25:
+            self.extentChangedAt = None
             iface.messageBar().pushMessage("what3words", 
                 "Zoom level must be between 17 and 25 to display the grid.", 
                 level=Qgis.Warning, duration=3)
@@ -104,128 +156,236 @@ class W3WGridManager:
         
         # Skip API call if the current extent matches the last grid extent
         if self.last_grid_extent == current_extent:
+            self.extentChangedAt = None
             return
             
         # Get the map canvas CRS (which might not be WGS84)
         canvasCrs = self.canvas.mapSettings().destinationCrs()
 
         # Create a transform object to convert the coordinates to WGS84 (EPSG:4326)
-        transform = QgsCoordinateTransform(canvasCrs, self.epsg4326, QgsProject.instance())
+        transform = get_transform(canvasCrs, self.epsg4326)
 
         # Transform the extent coordinates to EPSG:4326 (WGS84)
         bottom_left = transform.transform(extent.xMinimum(), extent.yMinimum())
         top_right = transform.transform(extent.xMaximum(), extent.yMaximum())
 
-        # Create the bounding box string in WGS84 for the API call
-        bounding_box = f"{bottom_left.y()},{bottom_left.x()},{top_right.y()},{top_right.x()}"
-        
-        try:
-            QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
-            self.w3w = get_w3w_instance()
-            grid_data = self.w3w.getGridSection(bounding_box)
-
-            # Check if the API response contains an error
-            if 'error' in grid_data:
-                error_code = grid_data['error']['code']
-                error_message = grid_data['error']['message']
-                iface.messageBar().pushMessage("what3words Error", 
-                    f"Error fetching grid: {error_code} - {error_message}", level=Qgis.Warning, duration=5)
+        # The grid is requested and cached by fixed tiles, so only tiles entering the view are fetched
+        tiles = tilesForExtent(bottom_left.y(), bottom_left.x(), top_right.y(), top_right.x())
+        if len(tiles) > MAX_GRID_TILES:
+            self.extentChangedAt = None
+            iface.messageBar().pushMessage("what3words",
+                "The map view is too large to display the grid. Please zoom in.",
+                level=Qgis.Warning, duration=3)
+            return
+        self.visibleTiles = tiles
+        self.last_grid_extent = current_extent
+        self.gridErrorShown = False
+
+        # Abort the requests for tiles the user has already moved away from
+        visible = set(tiles)
+        for tile in [tile for tile in self.pendingTiles if tile not in visible]:
+            client, request = self.pendingTiles.pop(tile)
+            client.pool().abort(request)
+
+        # Draw what is already known, generate what can be, then request the rest
+        tileCache = get_grid_tile_cache()
+        self.redrawGrid(tileCache)
+        missing = [tile for tile in tiles if tile not in self.tileFeatures and tile not in self.pendingTiles
+                   and tileCache.get(tile) is None]
+        if missing and self.localGrid:
+            verify = self.generateTiles(missing, tileCache)
+            missing = [tile for tile in missing if tile not in self.generatedTiles] + verify
+            self.redrawGrid(tileCache)
+        if missing:
+            try:
+                self.w3w = get_w3w_instance()
+            except ValueError as e:
+                iface.messageBar().pushMessage("what3words", str(e), level=Qgis.Warning, duration=5)
                 return
-            
-            # Ensure that the grid layer exists
-            self.ensureGridLayer()
+            for tile in missing:
+                request = self.w3w.getGridSectionAsync(partial(self.onTileFetched, tile), tileBoundingBox(tile))
+                self.pendingTiles[tile] = (self.w3w, request)
+        self.checkGridComplete()
 
-            # Get the data provider for the grid layer
-            pr = self.grid_layer.dataProvider()
+    def onTileFetched(self, tile, grid_data):
+        """
+        Caches a tile returned by the API, and draws it if it is still in view.
+        """
+        if self.pendingTiles.pop(tile, None) is None:
+            return  # Aborted, or the grid was disabled
+        if isinstance(grid_data, GeoCodeException):
+            self.showGridError(str(grid_data))
+        elif 'error' in grid_data:
+            # Check if the API response contains an error
+            error_code = grid_data['error']['code']
+            error_message = grid_data['error']['message']
+            self.showGridError(f"Error fetching grid: {error_code} - {error_message}")
+        else:
+            tileCache = get_grid_tile_cache()
+            lines = compactLines(grid_data)
+            lattice = self.generatedTiles.get(tile)
+            if lattice is not None and not linesMatch(lattice, lines, *tileBounds(tile)):
+                self.stopLocalGrid(tileCache)
+            self.generatedTiles.pop(tile, None)
+            tileCache.put(tile, lines)
+            if self.grid_enabled and tile in self.visibleTiles:
+                self.redrawGrid(tileCache)
+        self.checkGridComplete()
+
+    def generateTiles(self, tiles, tileCache):
+        """
+        Generates the lines of missing tiles from the lattice fitted to the API tiles of the same row.
 
-            # Clear any existing features in the layer (to avoid duplicates)
-            self.grid_layer.startEditing()
-            pr.deleteFeatures([f.id() for f in self.grid_layer.getFeatures()])
-            self.grid_layer.commitChanges()
-
-            # Loop through the grid lines and add them as features to the layer
-            for line in grid_data['lines']:
-                point1 = QgsPoint(line['start']['lng'], line['start']['lat'])
-                point2 = QgsPoint(line['end']['lng'], line['end']['lat'])
-
-                feature = QgsFeature()
-                feature.setGeometry(QgsGeometry.fromPolyline([point1, point2]))
-                # Set the south, west, north, and east attributes based on the bounding box
-                feature.setAttributes([bottom_left.y(), bottom_left.x(), top_right.y(), top_right.x()])
-                # Add the feature to the data provider
-                pr.addFeature(feature)
-
-            # Update the layer's extents and trigger a repaint
-            self.grid_layer.updateExtents()
-            self.applyGridSymbology()
-            # Update last fetched extent
-            self.last_grid_extent = current_extent
+        A tile is only generated if it is no further from the API tiles than the
+        number of columns they span, so the error of the fitted lattice stays
+        well within a line's tolerance. The generated lines are only cached in memory.
 
-        except GeoCodeException as e:
-            # Directly use the error message provided by GeoCodeException
-            iface.messageBar().pushMessage("what3words", str(e), level=Qgis.Warning, duration=5)
-        finally:
-            QApplication.restoreOverrideCursor()
+        :return: The generated tiles that should still be requested, to check them against the API
+        """
+        lattices = {}
+        verify = []
+        for tile in tiles:
+            row, col = tile
+            if row not in lattices:
+                lattices[row] = self.rowLattice(row, tileCache)
+            if lattices[row] is None:
+                continue
+            lattice, firstCol, lastCol = lattices[row]
+            if max(firstCol - col, col - lastCol) > lastCol - firstCol + 1:
+                continue
+            tileCache.put(tile, gridLines(lattice, *tileBounds(tile)), persist=False)
+            self.generatedTiles[tile] = lattice
+            self.generatedCount += 1
+            if self.generatedCount % LOCAL_GRID_VERIFY_INTERVAL == 1:
+                verify.append(tile)
+        return verify
+
+    def rowLattice(self, row, tileCache):
+        """
+        Fits a lattice to the lines of all the drawn tiles of the given row that came from the API.
 
-    def saveGridToLayer(self, grid_data, bottom_left, top_right):
+        :return: A tuple (lattice, first column, last column) of the tiles it was fitted to, or None if there are none
+        """
+        cols = []
+        lines = []
+        for tile in self.tileFeatures:
+            if tile[0] != row or tile in self.generatedTiles:
+                continue
+            tileLines = tileCache.get(tile)
+            if tileLines:
+                cols.append(tile[1])
+                lines.extend(tileLines)
+        lattice = calibrate(lines) if lines else None
+        if lattice is None:
+            return None
+        return lattice, min(cols), max(cols)
+
+    def stopLocalGrid(self, tileCache):
         """
-        Saves the grid data and bounding box (as south, west, north, east) to a vector layer in QGIS.
+        Stops generating tiles after one differed from the API, and replaces the generated tiles with API ones.
         """
-        # Ensure the grid layer exists
+        QgsMessageLog.logMessage("A generated grid tile differs from the API, tiles will only be requested.",
+                                 "what3words", Qgis.Warning)
+        self.localGrid = False
+        generated, self.generatedTiles = self.generatedTiles, {}
+        fids = []
+        for tile in generated:
+            tileCache.discard(tile)
+            if tile in self.tileFeatures:
+                fids.append(self.tileFeatures.pop(tile))
+        if fids and self.grid_layer:
+            self.grid_layer.dataProvider().deleteFeatures(fids)
+            self.grid_layer.triggerRepaint()
+        self.last_grid_extent = None
+        self.scheduleGridRefresh()
+
+    def redrawGrid(self, tileCache):
+        """
+        Updates the grid layer with the visible tiles that are available.
+        """
+        # Ensure that the grid layer exists
         self.ensureGridLayer()
+        self.drawTiles(self.visibleTiles, tileCache)
 
-        # Get the data provider for the grid layer
-        provider = self.grid_layer.dataProvider()
-
-        # Convert bounding box into individual lat/lng values (south, west, north, east)
-        bounds = {
-            "south": bottom_left.y(),
-            "west": bottom_left.x(),
-            "north": top_right.y(),
-            "east": top_right.x()
-        }
+        # Update the layer's extents and trigger a repaint, applying the symbology to a new layer
+        self.grid_layer.updateExtents()
+        if self.gridSymbology is None:
+            self.applyGridSymbology()
+        else:
+            self.grid_layer.triggerRepaint()
 
-        # Ensure the grid_layer has fields for south, west, north, east
-        if not self.grid_layer.fields().indexOf('south') >= 0:
-            provider.addAttributes([
-                QgsField("south", QVariant.Double),
-                QgsField("west", QVariant.Double),
-                QgsField("north", QVariant.Double),
-                QgsField("east", QVariant.Double)
-            ])
-            self.grid_layer.updateFields()  # Update layer's fields
-
-        # Check if the same bounding box has already been added
-        existing_features = [f for f in self.grid_layer.getFeatures()]
-        for feature in existing_features:
-            if (feature['south'] == bounds['south'] and feature['west'] == bounds['west'] and
-                feature['north'] == bounds['north'] and feature['east'] == bounds['east']):
-                # Skip adding the bounding box if it's already in the layer
-                return
+    def onProjectLayersChanged(self, *args):
+        """
+        Updates the grid symbology if the basemap changed.
+        """
+        if self.grid_enabled and self.grid_layer and QgsProject.instance().mapLayersByName(self.grid_layer.name()):
+            self.applyGridSymbology()
 
-        # Add new features (grid lines) and the bounding box information to the grid layer
-        for line in grid_data['lines']:
-            feature = QgsFeature()
+    def checkGridComplete(self):
+        """
+        Logs the time from the map moving to its grid being complete, once no tile is pending.
+        """
+        if self.pendingTiles or self.extentChangedAt is None:
+            return
+        self.gridLatency.record(time.perf_counter() - self.extentChangedAt)
+        self.extentChangedAt = None
+        if self.gridLatency.count % LATENCY_REPORT_INTERVAL == 0:
+            QgsMessageLog.logMessage(f"Grid latency: {self.gridLatency.summary()}", "what3words", Qgis.Info)
 
-            # Create the LineString geometry for the grid line
-            point1 = QgsPoint(line['start']['lng'], line['start']['lat'])
-            point2 = QgsPoint(line['end']['lng'], line['end']['lat'])
-            feature.setGeometry(QgsGeometry.fromPolyline([point1, point2]))
-
-            # Set the attributes for the bounding box (south, west, north, east)
-            feature.setAttributes([
-                bounds['south'],
-                bounds['west'],
-                bounds['north'],
-                bounds['east']
-            ])
+    def showGridError(self, message):
+        """
+        Shows a grid error, only once per refresh.
+        """
+        if not self.gridErrorShown:
+            self.gridErrorShown = True
+            iface.messageBar().pushMessage("what3words", message, level=Qgis.Warning, duration=5)
 
-            # Add the feature to the layer
-            provider.addFeature(feature)
+    def abortTileRequests(self):
+        """
+        Aborts all the pending tile requests.
+        """
+        pending, self.pendingTiles = self.pendingTiles, {}
+        for client, request in pending.values():
+            client.pool().abort(request)
+        self.extentChangedAt = None
 
-        # Update the layer extents and repaint
-        self.grid_layer.updateExtents()
-        self.grid_layer.triggerRepaint()
+    def drawTiles(self, tiles, tileCache):
+        """
+        Makes the grid layer show the given tiles, only adding and removing the features of the tiles that changed.
+        """
+        pr = self.grid_layer.dataProvider()
+        visible = set(tiles)
+
+        # Remove the tiles that left the view, emptying the layer at once if none is left
+        gone = [tile for tile in self.tileFeatures if tile not in visible]
+        if gone and len(gone) == len(self.tileFeatures):
+            pr.truncate()
+            self.tileFeatures = {}
+        elif gone:
+            pr.deleteFeatures([self.tileFeatures.pop(tile) for tile in gone])
+
+        # Add the tiles that entered it in a single batch, each as one MultiLineString feature
+        # with the tile bounds as south, west, north and east attributes
+        newTiles = []
+        features = []
+        for tile in tiles:
+            if tile in self.tileFeatures:
+                continue
+            lines = tileCache.get(tile)
+            if lines is None:
+                continue
+            feature = QgsFeature()
+            feature.setGeometry(QgsGeometry.fromMultiPolylineXY(
+                [[QgsPointXY(lng1, lat1), QgsPointXY(lng2, lat2)] for lat1, lng1, lat2, lng2 in lines]))
+            feature.setAttributes(list(tileBounds(tile)))
+            newTiles.append(tile)
+            features.append(feature)
+        if not features:
+            return
+        ok, added = pr.addFeatures(features)
+        if ok:
+            for tile, feature in zip(newTiles, added):
+                self.tileFeatures[tile] = feature.id()
 
     def ensureGridLayer(self):
         """
@@ -234,7 +394,9 @@ class W3WGridManager:
         # Check if the layer exists in the project
         if not self.grid_layer or not QgsProject.instance().mapLayersByName(self.grid_layer.name()):
             # The layer doesn't exist anymore or was deleted, recreate it
-            self.grid_layer = QgsVectorLayer("LineString", "what3words Grid", "memory")
+            self.grid_layer = QgsVectorLayer("MultiLineString", "what3words Grid", "memory")
+            self.tileFeatures = {}
+            self.gridSymbology = None
             
             # Define the attributes for the grid layer
             pr = self.grid_layer.dataProvider()
@@ -252,7 +414,9 @@ class W3WGridManager:
             layers = QgsProject.instance().mapLayersByName(self.grid_layer.name())
             if not layers:
                 # Recreate the layer if it's not valid anymore
-                self.grid_layer = QgsVectorLayer("LineString", "what3words Grid", "memory")
+                self.grid_layer = QgsVectorLayer("MultiLineString", "what3words Grid", "memory")
+                self.tileFeatures = {}
+                self.gridSymbology = None
                 QgsProject.instance().addMapLayer(self.grid_layer)
 
     def removeGridLayer(self):
@@ -274,6 +438,8 @@ class W3WGridManager:
     def applyGridSymbology(self):
         """
         Applies symbology to the what3words grid layer based on whether a satellite or vector map is active.
+
+        The renderer is only replaced if the kind of basemap changed since the last call.
         """
         satellite_keywords = ['satellite', 'google satellite', 'imagery', 'arcgis satellite', 'bing aerial', 'google satellite']
         is_satellite_map = False
@@ -287,6 +453,10 @@ class W3WGridManager:
                         is_satellite_map = True
                         break
 
+        if is_satellite_map == self.gridSymbology:
+            return
+        self.gridSymbology = is_satellite_map
+
         if is_satellite_map:
             color = '#ffffff'
             opacity = 0.16
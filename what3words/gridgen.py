@@ -0,0 +1,202 @@
+import bisect
+import math
+import random
+from collections import namedtuple
+
+# Coordinates in grid-section responses have 6 decimals, so each is up to this far from the true line
+ROUNDING_ERROR = 0.5e-6
+# Distance under which a line returned by the API is on a lattice line: its rounding error,
+# plus as much again twice over for the error of the lattice fitted from other rounded lines
+LINE_TOLERANCE = 3 * ROUNDING_ERROR
+# Size, in degrees, of the grid sections requested to calibrate and to verify a lattice
+SAMPLE_SIZE = 0.001
+# Ratio between the distances of two successive calibration samples from the first one.
+# Small enough for the number of steps between samples to be counted without error.
+SAMPLE_SPACING = 4
+
+# Evenly spaced lines of the what3words grid: horizontal lines at latOrigin + k * latStep,
+# vertical lines at lngOrigin + k * lngStep
+GridLattice = namedtuple('GridLattice', ['latOrigin', 'latStep', 'lngOrigin', 'lngStep'])
+
+
+def axisLattice(values, tolerance=LINE_TOLERANCE):
+    """
+    Finds the spacing of evenly spaced values.
+
+    :return: A tuple (origin, step), or None if there are less than 3 values or they are not evenly spaced
+    """
+    values = sorted(set(round(value, 9) for value in values))
+    if len(values) < 3:
+        return None
+    diffs = sorted(b - a for a, b in zip(values, values[1:]))
+    step = diffs[len(diffs) // 2]
+    if step <= tolerance:
+        return None
+
+    # Least-squares fit of value = origin + k * step, adding the values in order. Each value is given the
+    # index predicted by the fit of the values before it, so groups of lines far apart, such as those of
+    # several tiles, are fitted together. Offsets from the first value keep the sums precise.
+    base = values[0]
+    origin = 0.0
+    n = sumK = sumKK = sumV = sumKV = 0.0
+    indices = []
+    for value in values:
+        offset = value - base
+        k = round((offset - origin) / step)
+        indices.append(k)
+        n += 1
+        sumK += k
+        sumKK += k * k
+        sumV += offset
+        sumKV += k * offset
+        det = n * sumKK - sumK * sumK
+        if det > 0:
+            step = (n * sumKV - sumK * sumV) / det
+            origin = (sumV - step * sumK) / n
+
+    if step <= tolerance or any(b <= a for a, b in zip(indices, indices[1:])):
+        return None
+    if any(abs(value - base - origin - k * step) > tolerance for value, k in zip(values, indices)):
+        return None
+    return base + origin, step
+
+
+def _axisValues(lines, tolerance=LINE_TOLERANCE):
+    """
+    Splits (lat1, lng1, lat2, lng2) lines into the latitudes of horizontal lines and the longitudes of vertical ones.
+    """
+    lats = [lat1 for lat1, lng1, lat2, lng2 in lines if abs(lat1 - lat2) <= tolerance]
+    lngs = [lng1 for lat1, lng1, lat2, lng2 in lines if abs(lng1 - lng2) <= tolerance]
+    return lats, lngs
+
+
+def calibrate(lines, tolerance=LINE_TOLERANCE):
+    """
+    Derives the lattice of the grid from the lines of one or more grid sections.
+
+    :param lines: The lines of grid-section responses, as (lat1, lng1, lat2, lng2) tuples
+    :return: A GridLattice, or None if the lines are not a regular lattice
+    """
+    lats, lngs = _axisValues(lines, tolerance)
+    latAxis = axisLattice(lats, tolerance)
+    lngAxis = axisLattice(lngs, tolerance)
+    if latAxis is None or lngAxis is None:
+        return None
+    return GridLattice(latAxis[0], latAxis[1], lngAxis[0], lngAxis[1])
+
+
+def _refineStep(origin, step, sampleOrigin, sampleStep):
+    if abs(sampleStep - step) > step * 0.01:
+        return None  # Different spacing: the sample is not on the same lattice
+    count = round((sampleOrigin - origin) / step)
+    return step if count == 0 else (sampleOrigin - origin) / count
+
+
+def refine(lattice, lines, tolerance=LINE_TOLERANCE):
+    """
+    Makes the steps of a lattice more precise with the lines of a distant grid section.
+
+    The number of steps between the lattice origin and the sample is counted,
+    and the steps are recomputed over that whole distance.
+
+    :return: The refined GridLattice, or None if the sample does not fit the lattice
+    """
+    sample = calibrate(lines, tolerance)
+    if sample is None:
+        return None
+    latStep = _refineStep(lattice.latOrigin, lattice.latStep, sample.latOrigin, sample.latStep)
+    lngStep = _refineStep(lattice.lngOrigin, lattice.lngStep, sample.lngOrigin, sample.lngStep)
+    if latStep is None or lngStep is None:
+        return None
+    return GridLattice(lattice.latOrigin, latStep, lattice.lngOrigin, lngStep)
+
+
+def sampleBox(lat, lng, size=SAMPLE_SIZE):
+    """
+    Returns the (south, west, north, east) bounds of the sample whose south-west corner is at (lat, lng).
+    """
+    return (round(lat, 6), round(lng, 6), round(lat + size, 6), round(lng + size, 6))
+
+
+def calibrationSamples(south, west, north, east, size=SAMPLE_SIZE, spacing=SAMPLE_SPACING):
+    """
+    Returns the samples to request to calibrate the lattice of an extent.
+
+    The first sample is at the south-west corner of the extent and the others
+    follow the diagonal, each `spacing` times further than the previous one,
+    up to the north-east corner. Their lines should be passed in order to
+    calibrate() and then refine().
+
+    :return: A list of (south, west, north, east) bounds
+    """
+    latRange = max(0.0, north - south - size)
+    lngRange = max(0.0, east - west - size)
+    distance = max(latRange, lngRange)
+    fractions = [0.0]
+    step = size * spacing
+    while step < distance:
+        fractions.append(step / distance)
+        step *= spacing
+    if distance > 0:
+        fractions.append(1.0)
+    return [sampleBox(south + f * latRange, west + f * lngRange, size) for f in fractions]
+
+
+def verificationSamples(south, west, north, east, count, size=SAMPLE_SIZE, rng=random):
+    """
+    Returns `count` samples at random positions of an extent, to check a lattice against the API.
+    """
+    latRange = max(0.0, north - south - size)
+    lngRange = max(0.0, east - west - size)
+    return [sampleBox(south + rng.random() * latRange, west + rng.random() * lngRange, size) for _ in range(count)]
+
+
+def _axisSteps(origin, step, low, high):
+    first = math.ceil((low - origin) / step - 1e-9)
+    last = math.floor((high - origin) / step + 1e-9)
+    return range(first, last + 1)
+
+
+def _axisRange(origin, step, low, high):
+    return [round(origin + k * step, 6) for k in _axisSteps(origin, step, low, high)]
+
+
+def gridLines(lattice, south, west, north, east):
+    """
+    Generates the grid lines of an extent from a lattice.
+
+    :return: The lines, as (lat1, lng1, lat2, lng2) tuples: horizontal lines from
+    west to east, then vertical lines from south to north
+    """
+    lats = _axisRange(lattice.latOrigin, lattice.latStep, south, north)
+    lngs = _axisRange(lattice.lngOrigin, lattice.lngStep, west, east)
+    return [(lat, west, lat, east) for lat in lats] + [(south, lng, north, lng) for lng in lngs]
+
+
+def _onAxis(values, origin, step, low, high, tolerance):
+    """
+    Checks that every value is on the axis, and that every line of the axis between low and high is among the values.
+    """
+    if any(abs(value - origin - round((value - origin) / step) * step) > tolerance for value in values):
+        return False
+    ordered = sorted(values)
+    for k in _axisSteps(origin, step, low, high):
+        expected = origin + k * step
+        i = bisect.bisect_left(ordered, expected - tolerance)
+        if i == len(ordered) or ordered[i] > expected + tolerance:
+            return False
+    return True
+
+
+def linesMatch(lattice, lines, south, west, north, east, tolerance=LINE_TOLERANCE):
+    """
+    Checks the lines of a grid section returned by the API against the lines generated by a lattice.
+
+    Every line returned must be on the lattice, and every line of the lattice
+    must have been returned, except those on the edges of the section, which
+    the API and the lattice may round differently.
+    """
+    margin = 2 * tolerance
+    lats, lngs = _axisValues(lines, tolerance)
+    return (_onAxis(lats, lattice.latOrigin, lattice.latStep, south + margin, north - margin, tolerance) and
+            _onAxis(lngs, lattice.lngOrigin, lattice.lngStep, west + margin, east - margin, tolerance))
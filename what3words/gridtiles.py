@@ -0,0 +1,210 @@
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from what3words.cache import SQUARE_SIZE
+
+# Size, in degrees, of the tiles the live grid is requested and cached by.
+# A tile is 100 squares (about 300m) high, well within the area allowed for a
+# grid-section request, and tile edges fall on multiples of the square size.
+TILE_SIZE = 100 * SQUARE_SIZE
+# Approximate number of what3words squares in a tile, to express square limits in tiles
+TILE_SQUARES = 100 * 100
+# Fraction of the disk limit kept when pruning, so tiles are not pruned on every save
+PRUNE_RATIO = 0.9
+
+
+def tileFor(lat, lng, size=TILE_SIZE):
+    """
+    Returns the (row, column) index of the tile containing the given coordinates.
+    """
+    return math.floor(lat / size), math.floor(lng / size)
+
+
+def tilesForExtent(south, west, north, east, size=TILE_SIZE):
+    """
+    Returns the indices of the tiles covering an extent, row by row from the south-west.
+    """
+    firstRow, firstCol = tileFor(south, west, size)
+    lastRow, lastCol = tileFor(north, east, size)
+    return [(row, col) for row in range(firstRow, lastRow + 1) for col in range(firstCol, lastCol + 1)]
+
+
+def tileBounds(tile, size=TILE_SIZE):
+    """
+    Returns the (south, west, north, east) bounds of a tile.
+    """
+    row, col = tile
+    return (round(row * size, 9), round(col * size, 9),
+            round((row + 1) * size, 9), round((col + 1) * size, 9))
+
+
+def tileBoundingBox(tile, size=TILE_SIZE):
+    """
+    Returns the bounding box of a tile in the form used by the grid-section endpoint.
+    """
+    return "%s,%s,%s,%s" % tileBounds(tile, size)
+
+
+def compactLines(grid_data):
+    """
+    Converts the lines of a grid-section response into (lat1, lng1, lat2, lng2) tuples.
+    """
+    return [(line['start']['lat'], line['start']['lng'], line['end']['lat'], line['end']['lng'])
+            for line in grid_data.get('lines', [])]
+
+
+def endpointFolder(apiBaseUrl):
+    """
+    Returns the name of the folder holding the tiles of an API endpoint, so tiles of different endpoints are never mixed.
+    """
+    return hashlib.sha1((apiBaseUrl or '').rstrip('/').encode('utf-8')).hexdigest()[:12]
+
+
+class GridTileCache(object):
+    """
+    Cache of the grid lines of each tile.
+
+    The most recently used `maxTiles` tiles are kept in memory. If a folder is
+    given, every tile is also saved there as a small JSON file, so tiles seen in
+    previous sessions are not requested again. Tiles saved more than `ttl`
+    seconds ago are requested again, and once more than `maxDiskTiles` tiles are
+    saved the oldest ones are removed. A limit of 0 means no limit.
+    """
+
+    def __init__(self, maxTiles=512, folder=None, size=TILE_SIZE, maxDiskTiles=0, ttl=0):
+        self.maxTiles = maxTiles
+        self.folder = folder
+        self.size = size
+        self.maxDiskTiles = maxDiskTiles
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._tiles = OrderedDict()
+        self._diskTiles = None  # Number of tiles in the folder, counted on the first save
+        self._diskFolder = None
+
+    def __len__(self):
+        return len(self._tiles)
+
+    def _path(self, tile):
+        return os.path.join(self.folder, "%d_%d.json" % tile)
+
+    def get(self, tile):
+        """
+        Returns the lines of a tile, or None if they are not cached.
+        """
+        with self._lock:
+            lines = self._tiles.get(tile)
+            if lines is not None:
+                self._tiles.move_to_end(tile)
+                self.hits += 1
+                return lines
+        lines = self._load(tile)
+        if lines is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._remember(tile, lines)
+        return lines
+
+    def put(self, tile, lines, persist=True):
+        """
+        Caches the lines of a tile.
+
+        :param persist: False to only keep the lines in memory, for lines that did not come from the API
+        """
+        self._remember(tile, lines)
+        if persist:
+            self._save(tile, lines)
+
+    def discard(self, tile):
+        """
+        Removes a tile from memory, without touching the copy on disk.
+        """
+        with self._lock:
+            self._tiles.pop(tile, None)
+
+    def clear(self):
+        with self._lock:
+            self._tiles.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _remember(self, tile, lines):
+        with self._lock:
+            self._tiles[tile] = lines
+            self._tiles.move_to_end(tile)
+            while len(self._tiles) > self.maxTiles:
+                self._tiles.popitem(last=False)
+
+    def _load(self, tile):
+        if not self.folder:
+            return None
+        path = self._path(tile)
+        try:
+            if self.ttl and os.path.getmtime(path) < time.time() - self.ttl:
+                os.remove(path)
+                return None
+            with open(path, encoding='utf-8') as f:
+                return [tuple(line) for line in json.load(f)]
+        except (OSError, ValueError):
+            return None
+
+    def _save(self, tile, lines):
+        if not self.folder:
+            return
+        path = self._path(tile)
+        tmpPath = path + '.tmp'
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            isNew = not os.path.exists(path)
+            with open(tmpPath, 'w', encoding='utf-8') as f:
+                json.dump(lines, f)
+            os.replace(tmpPath, path)
+        except OSError:
+            return
+        with self._lock:
+            if self._diskFolder != self.folder:
+                self._diskFolder = self.folder
+                self._diskTiles = len(self._tileFiles())
+            elif isNew:
+                self._diskTiles += 1
+            if self.maxDiskTiles and self._diskTiles > self.maxDiskTiles:
+                self._diskTiles = self._prune(int(self.maxDiskTiles * PRUNE_RATIO))
+
+    def _tileFiles(self):
+        try:
+            return [entry for entry in os.scandir(self.folder) if entry.name.endswith('.json')]
+        except OSError:
+            return []
+
+    def _prune(self, keep):
+        """
+        Removes the expired tiles from the folder, and the oldest ones until at most `keep` are left.
+
+        :return: The number of tiles left
+        """
+        files = []
+        for entry in self._tileFiles():
+            try:
+                files.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                pass
+        files.sort(reverse=True)
+        expiry = time.time() - self.ttl if self.ttl else None
+        left = 0
+        for mtime, path in files:
+            if left < keep and (expiry is None or mtime >= expiry):
+                left += 1
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                left += 1
+        return left
@@ -0,0 +1,99 @@
+import json
+import os
+import threading
+import time
+
+# Age, in seconds, after which the catalogue is refreshed from the API
+CATALOGUE_TTL = 7 * 86400
+
+# Languages offered until the catalogue has been fetched for the first time
+FALLBACK_LANGUAGES = [{'code': 'en', 'name': 'English', 'nativeName': 'English'}]
+
+
+class LanguageCatalogue(object):
+    """
+    The languages available for what3words addresses, persisted as a JSON file.
+
+    Reading the catalogue never touches the network: it is loaded from disk on
+    first use, and falls back to FALLBACK_LANGUAGES when it has never been
+    fetched. Callers check isStale() and refresh it in the background with
+    update() once the API has answered.
+    """
+
+    def __init__(self, path, ttl=CATALOGUE_TTL, clock=time.time):
+        self.path = path
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._languages = None
+        self._updated = 0
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+            languages = [lang for lang in data['languages'] if lang.get('code') and lang.get('name')]
+            if languages:
+                self._languages = languages
+                self._updated = float(data.get('updated', 0))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+
+    def _ensureLoaded(self):
+        if self._languages is None:
+            self._load()
+            if self._languages is None:
+                self._languages = []
+
+    def languages(self):
+        """
+        Returns the available languages, as dicts with 'code', 'name' and 'nativeName'.
+        """
+        with self._lock:
+            self._ensureLoaded()
+            return list(self._languages or FALLBACK_LANGUAGES)
+
+    def names(self):
+        return [lang['name'] for lang in self.languages()]
+
+    def codes(self):
+        return [lang['code'] for lang in self.languages()]
+
+    def isStale(self):
+        """
+        Returns True if the catalogue was never fetched or is older than the TTL.
+        """
+        with self._lock:
+            self._ensureLoaded()
+            return not self._languages or self._clock() - self._updated >= self.ttl
+
+    def update(self, languages):
+        """
+        Replaces the catalogue with a fresh list from the API and saves it to disk.
+
+        :param languages: The 'languages' list returned by the available-languages endpoint
+        :return: True if the list of languages changed
+        """
+        languages = [{'code': lang['code'], 'name': lang['name'], 'nativeName': lang.get('nativeName', lang['name'])}
+                     for lang in languages if lang.get('code') and lang.get('name')]
+        if not languages:
+            return False
+        with self._lock:
+            self._ensureLoaded()
+            changed = languages != self._languages
+            self._languages = languages
+            self._updated = self._clock()
+            self._save()
+        return changed
+
+    def _save(self):
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmpPath = self.path + '.tmp'
+        try:
+            with open(tmpPath, 'w', encoding='utf-8') as f:
+                json.dump({'updated': self._updated, 'languages': self._languages}, f)
+            os.replace(tmpPath, self.path)
+        except OSError:
+            pass
@@ -0,0 +1,42 @@
+from collections import deque
+
+
+class LatencyStats(object):
+    """
+    Keeps the most recent `size` latency samples and reports their percentiles.
+    """
+
+    def __init__(self, size=500):
+        self._samples = deque(maxlen=size)
+        self.count = 0
+
+    def __len__(self):
+        return len(self._samples)
+
+    def record(self, seconds):
+        self._samples.append(seconds)
+        self.count += 1
+
+    def percentile(self, p):
+        """
+        Returns the p-th percentile (0-100) of the recent samples, using the nearest-rank method,
+        or None if there are no samples.
+        """
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, -(-len(ordered) * p // 100))
+        return ordered[min(len(ordered), int(rank)) - 1]
+
+    def summary(self, percentiles=(50, 90, 99)):
+        """
+        Returns a one-line description of the recent samples, e.g. "p50=120ms p90=310ms p99=540ms (n=200)".
+        """
+        if not self._samples:
+            return "no samples"
+        values = " ".join(f"p{p}={self.percentile(p) * 1000:.0f}ms" for p in percentiles)
+        return f"{values} (n={len(self._samples)})"
+
+    def clear(self):
+        self._samples.clear()
+        self.count = 0
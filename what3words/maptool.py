@@ -9,7 +9,7 @@ from qgis.PyQt.QtWidgets import QApplication
 from qgis.utils import iface
 from what3words.w3w import GeoCodeException
 from what3words.shared_layer_point import W3WPointLayerManager
-from what3words.utils import get_w3w_instance
+from what3words.utils import get_w3w_instance, get_transform
 
 
 class W3WMapTool(QgsMapTool):
@@ -30,7 +30,7 @@ class W3WMapTool(QgsMapTool):
         """
         canvas = iface.mapCanvas()
         canvasCrs = canvas.mapSettings().destinationCrs()
-        transform = QgsCoordinateTransform(canvasCrs, self.epsg4326, QgsProject.instance())
+        transform = get_transform(canvasCrs, self.epsg4326)
         pt4326 = transform.transform(pt.x(), pt.y())
 
         try:
@@ -67,11 +67,8 @@ class W3WMapTool(QgsMapTool):
             # Emit the new signal for mapsite with the 3WA
             self.w3wAddressCapturedForMapsite.emit(w3w_info['words'])
 
-            # Add the marker on the map at the selected point
-            self.coordDialog.addMarker(pt)
-
             # Add the W3W address to the coord dialog's table
-            self.coordDialog.addRowToTable(
+            row_id = self.coordDialog.addRowToTable(
                 what3words=w3w_info['words'],
                 lat=pt4326.y(),
                 lon=pt4326.x(),
@@ -79,5 +76,8 @@ class W3WMapTool(QgsMapTool):
                 country=w3w_info.get('country', ''),
                 language=w3w_info.get('language', '')
             )
+
+            # Add the marker of the new row on the map at the selected point
+            self.coordDialog.addMarker(pt, row_id)
         except GeoCodeException as e:
             iface.messageBar().pushMessage("what3words", str(e), level=Qgis.Warning, duration=2)
\ No newline at end of file
@@ -0,0 +1,106 @@
+from qgis.core import QgsWkbTypes
+from qgis.gui import QgsRubberBand
+from qgis.PyQt.QtCore import Qt
+
+from what3words.pointstore import PointGrid
+
+
+class W3WMarkerLayer(object):
+    """
+    Draws the points of the coordinate dialog on the map canvas.
+
+    All the points share a single QgsRubberBand, so the canvas paints one
+    item however many points there are. Points are given in the canvas CRS,
+    and the rubber band follows panning and zooming by itself.
+
+    Points are keyed by the id of their table row, so deleting rows removes
+    their markers without comparing coordinates. Points added without a row
+    id are kept in a hash grid, to be matched by coordinates instead.
+    """
+
+    def __init__(self, canvas, tolerance=1e-6):
+        self.canvas = canvas
+        self.points = {}  # Row id (or negative key for points without one) -> point, in drawing order
+        self.unkeyed = PointGrid(tolerance)
+        self._nextKey = -1
+        self.rubberBand = QgsRubberBand(canvas, QgsWkbTypes.PointGeometry)
+        self.rubberBand.setIcon(QgsRubberBand.ICON_CROSS)
+        self.rubberBand.setColor(Qt.red)
+        self.rubberBand.setIconSize(18)
+        self.rubberBand.setWidth(2)
+
+    def __len__(self):
+        return len(self.points)
+
+    def addPoints(self, points, ids=None):
+        """
+        Adds points to the layer, redrawing the canvas once.
+
+        :param points: Points in the canvas CRS
+        :param ids: Ids of the table rows of the points, or None if they have no row
+        """
+        points = list(points)
+        if not points:
+            return
+        if ids is None:
+            ids = []
+            for point in points:
+                ids.append(self._nextKey)
+                self.unkeyed.add(self._nextKey, point.x(), point.y())
+                self._nextKey -= 1
+        for key, point in zip(ids, points):
+            self.points[key] = point
+            self.rubberBand.addPoint(point, False)
+        self.rubberBand.updatePosition()
+        self.rubberBand.update()
+
+    def setPoints(self, points, ids=None):
+        """
+        Replaces all the points of the layer.
+        """
+        self.rubberBand.reset(QgsWkbTypes.PointGeometry)
+        self.points = {}
+        self.unkeyed.clear()
+        self.addPoints(points, ids)
+
+    def removeIds(self, ids):
+        """
+        Removes the points of the given table rows.
+        """
+        removed = False
+        for key in ids:
+            removed = self.points.pop(key, None) is not None or removed
+        if removed:
+            self._redraw()
+
+    def removePoints(self, points):
+        """
+        Removes the points without a row id that match any of the given ones within tolerance.
+        """
+        removed = False
+        for point in points:
+            for key in self.unkeyed.near(point.x(), point.y()):
+                self.unkeyed.discard(key)
+                del self.points[key]
+                removed = True
+        if removed:
+            self._redraw()
+
+    def hasUnkeyedPoints(self):
+        return len(self.unkeyed) > 0
+
+    def clear(self):
+        self.setPoints([])
+
+    def remove(self):
+        """
+        Removes the layer from the canvas.
+        """
+        self.canvas.scene().removeItem(self.rubberBand)
+
+    def _redraw(self):
+        self.rubberBand.reset(QgsWkbTypes.PointGeometry)
+        for point in self.points.values():
+            self.rubberBand.addPoint(point, False)
+        self.rubberBand.updatePosition()
+        self.rubberBand.update()
@@ -16,6 +16,7 @@ from qgiscommons2.settings import readSettings
 from what3words.coorddialog_new_ui import W3WCoordInputDialog 
 from what3words.w3wfunctions import register_w3w_functions, unregister_w3w_functions 
 from what3words.processingprovider.w3wprovider import W3WProvider
+from what3words.utils import invalidate_w3w_instance
 
 
 class W3WTools(object):
@@ -95,6 +96,7 @@ class W3WTools(object):
         """
         Callback when the settings dialog is closed. Re-enables the settings button.
         """
+        invalidate_w3w_instance()
         self.settingsAction.setEnabled(True)
         self.coordDialog.settingsButton.setEnabled(True)  # Re-enable coordDialog button
         self.settingsDialog = None  # Reset dialog reference
@@ -134,8 +136,11 @@ class W3WTools(object):
             self.iface.removePluginMenu("what3words", self.settingsAction)
             del self.settingsAction
 
-        # Remove the dock widget
+        # Remove the dock widget and its markers, stopping any CSV import still running
         if self.coordDialog:
+            if self.coordDialog.importTask is not None:
+                self.coordDialog.importTask.cancel()
+            self.coordDialog.markers.remove()
             self.iface.removeDockWidget(self.coordDialog)
 
         if "what3words" in _settingActions:
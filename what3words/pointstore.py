@@ -0,0 +1,232 @@
+import math
+from array import array
+
+# Columns of the coordinate table, in display order
+COLUMNS = ["what3words", "Latitude", "Longitude", "Nearest Place", "Country", "Language"]
+WORDS, LAT, LON, PLACE, COUNTRY, LANGUAGE = range(len(COLUMNS))
+
+
+class StringColumn(object):
+    """
+    A column of strings stored as indices into a table of distinct values.
+
+    Places, countries and languages repeat a lot, so each distinct string is
+    stored once and every row only holds a 32 bit index.
+    """
+
+    def __init__(self):
+        self.values = []
+        self._index = {}
+        self.codes = array('I')
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, i):
+        return self.values[self.codes[i]]
+
+    def _code(self, value):
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def append(self, value):
+        self.codes.append(self._code(value or ''))
+
+    def take(self, order):
+        """
+        Keeps only the rows in `order`, in that order.
+        """
+        codes = self.codes
+        self.codes = array('I', (codes[i] for i in order))
+
+    def clear(self):
+        self.values = []
+        self._index = {}
+        self.codes = array('I')
+
+
+class W3WPointStore(object):
+    """
+    Columnar storage for the points listed in the coordinate dialog.
+
+    Coordinates are kept as floats in typed arrays and never re-parsed from
+    text; sorting and deleting rebuild every column in a single pass. Every row
+    gets an id that does not change when rows are sorted or deleted, so other
+    objects (e.g. map markers) can refer to rows without matching coordinates.
+    """
+
+    def __init__(self):
+        self.ids = array('Q')
+        self._nextId = 0
+        self.words = []
+        self.lats = array('d')
+        self.lons = array('d')
+        self.places = StringColumn()
+        self.countries = StringColumn()
+        self.languages = StringColumn()
+
+    def __len__(self):
+        return len(self.lats)
+
+    def append(self, words, lat, lon, nearest_place='', country='', language=''):
+        """
+        Appends a row.
+
+        :return: The id of the new row
+        """
+        rowId = self._nextId
+        self._nextId += 1
+        self.ids.append(rowId)
+        self.words.append(words)
+        self.lats.append(float(lat))
+        self.lons.append(float(lon))
+        self.places.append(nearest_place)
+        self.countries.append(country)
+        self.languages.append(language)
+        return rowId
+
+    def extend(self, rows):
+        """
+        Appends rows given as (words, lat, lon, nearest_place, country, language) tuples.
+
+        :return: The ids of the new rows
+        """
+        return [self.append(*row) for row in rows]
+
+    def value(self, row, column):
+        if column == WORDS:
+            return self.words[row]
+        if column == LAT:
+            return self.lats[row]
+        if column == LON:
+            return self.lons[row]
+        if column == PLACE:
+            return self.places[row]
+        if column == COUNTRY:
+            return self.countries[row]
+        return self.languages[row]
+
+    def row(self, row):
+        """
+        Returns a row as a (words, lat, lon, nearest_place, country, language) tuple.
+        """
+        return (self.words[row], self.lats[row], self.lons[row],
+                self.places[row], self.countries[row], self.languages[row])
+
+    def rows(self):
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def coordinates(self):
+        """
+        Returns an iterator over the (lat, lon) of every row.
+        """
+        return zip(self.lats, self.lons)
+
+    def _take(self, order):
+        self.ids = array('Q', (self.ids[i] for i in order))
+        self.words = [self.words[i] for i in order]
+        self.lats = array('d', (self.lats[i] for i in order))
+        self.lons = array('d', (self.lons[i] for i in order))
+        for column in (self.places, self.countries, self.languages):
+            column.take(order)
+
+    def remove(self, rows):
+        """
+        Removes the given row indices.
+
+        :return: The ids of the removed rows
+        """
+        rows = set(rows)
+        if not rows:
+            return []
+        removed = [self.ids[i] for i in sorted(rows)]
+        self._take([i for i in range(len(self)) if i not in rows])
+        return removed
+
+    def sort(self, column, descending=False):
+        """
+        Sorts all the rows by one column.
+
+        :return: The previous index of each row, in the new order
+        """
+        if column == WORDS:
+            keys = self.words
+        elif column == LAT:
+            keys = self.lats
+        elif column == LON:
+            keys = self.lons
+        else:
+            strings = (self.places, self.countries, self.languages)[column - PLACE]
+            keys = [strings.values[code] for code in strings.codes]
+        order = sorted(range(len(self)), key=keys.__getitem__, reverse=descending)
+        self._take(order)
+        return order
+
+    def clear(self):
+        self.ids = array('Q')
+        self.words = []
+        self.lats = array('d')
+        self.lons = array('d')
+        for column in (self.places, self.countries, self.languages):
+            column.clear()
+
+
+class PointGrid(object):
+    """
+    Hash grid of keyed (x, y) points, for finding the points at given
+    coordinates without comparing them with every point.
+
+    Cells are as large as the matching tolerance, so the points within
+    tolerance of a position are always in one of the 9 cells around it.
+    """
+
+    def __init__(self, tolerance=1e-6):
+        self.tolerance = tolerance
+        self._cells = {}
+        self._points = {}
+
+    def __len__(self):
+        return len(self._points)
+
+    def __contains__(self, key):
+        return key in self._points
+
+    def _cell(self, x, y):
+        return math.floor(x / self.tolerance), math.floor(y / self.tolerance)
+
+    def add(self, key, x, y):
+        self.discard(key)
+        self._points[key] = (x, y)
+        self._cells.setdefault(self._cell(x, y), set()).add(key)
+
+    def discard(self, key):
+        point = self._points.pop(key, None)
+        if point is None:
+            return
+        cell = self._cell(*point)
+        keys = self._cells[cell]
+        keys.discard(key)
+        if not keys:
+            del self._cells[cell]
+
+    def near(self, x, y):
+        """
+        Returns the keys of the points within tolerance of (x, y).
+        """
+        cx, cy = self._cell(x, y)
+        found = []
+        for i in (cx - 1, cx, cx + 1):
+            for j in (cy - 1, cy, cy + 1):
+                for key in self._cells.get((i, j), ()):
+                    px, py = self._points[key]
+                    if abs(px - x) <= self.tolerance and abs(py - y) <= self.tolerance:
+                        found.append(key)
+        return found
+
+    def clear(self):
+        self._cells = {}
+        self._points = {}
@@ -5,18 +5,16 @@
 
 import os
 from qgis.PyQt.QtCore import QVariant
-from qgis.core import (QgsCoordinateReferenceSystem,
-                       QgsProcessingException,
-                       QgsCoordinateTransform,
+from qgis.core import (QgsProcessingException,
                        QgsField,
-                       QgsProject,
                        QgsFeatureSink,
                        QgsProcessingParameterFeatureSource,
                        QgsProcessingParameterFeatureSink,
-                       QgsProcessingParameterEnum)
+                       QgsProcessingParameterEnum,
+                       QgsGeometry)
 from processing.algs.qgis.QgisAlgorithm import QgisAlgorithm
 
-from what3words.utils import get_w3w_instance
+from what3words.utils import get_w3w_instance, get_language_catalogue, get_transform, batched
 
 
 class Add3WordsFieldAlgorithm(QgisAlgorithm):
@@ -36,8 +34,7 @@ class Add3WordsFieldAlgorithm(QgisAlgorithm):
         self.addParameter(QgsProcessingParameterFeatureSource(self.INPUT, self.tr('Input point vector layer')))
         
         # Initialize languages and create LANGUAGE parameter
-        w3w = get_w3w_instance()
-        language_names = self.get_supported_language_names(w3w)
+        language_names = self.get_supported_language_names()
         self.addParameter(QgsProcessingParameterEnum(
             self.LANGUAGE,
             self.tr('Select Language'),
@@ -74,19 +71,56 @@ class Add3WordsFieldAlgorithm(QgisAlgorithm):
     def helpUrl(self):
         return "https://developer.what3words.com/tools/gis-extensions/qgis"
     
-    def get_supported_language_names(self, w3w_instance):
+    def get_supported_language_names(self):
         """
-        Retrieve supported languages from the what3words API.
+        Retrieve supported languages from the shared language catalogue.
 
-        :param w3w_instance: Configured what3words API instance.
         :return: List of supported language names.
         """
+        languages = get_language_catalogue(refresh=False).languages()
+        self.language_mapping = {lang["name"]: lang["code"] for lang in languages}
+        return list(self.language_mapping.keys())
+
+    def transform_centroids(self, features, transform, feedback):
+        """
+        Computes the centroids of a batch of features and reprojects them all at once.
+
+        :param features: The features of the batch
+        :param transform: Transform from the source CRS to EPSG:4326
+        :return: A list with, for each feature, its centroid as a (lat, lng) tuple, or
+        None if it has no usable geometry
+        """
+        centroids = []
+        for feat in features:
+            centroid = feat.geometry().centroid()
+            if centroid.isNull() or centroid.isEmpty():
+                feedback.pushDebugInfo("Failed to retrieve what3words address for feature {}:\nFeature has no geometry".format(feat.id()))
+                centroids.append(None)
+            else:
+                centroids.append(centroid.asPoint())
+
+        valid = [pt for pt in centroids if pt is not None]
         try:
-            languages = w3w_instance.getLanguages()
-            self.language_mapping = {lang["name"]: lang["code"] for lang in languages["languages"]}
-            return list(self.language_mapping.keys())
-        except Exception as e:
-            raise QgsProcessingException(f"Failed to retrieve supported languages: {str(e)}")
+            # A single multipoint transform instead of one call per feature
+            multipoint = QgsGeometry.fromMultiPointXY(valid)
+            multipoint.transform(transform)
+            transformed = iter(multipoint.asMultiPoint() if valid else [])
+        except Exception:
+            # Some point of the batch could not be reprojected; fall back to one transform per point
+            transformed = None
+
+        points = []
+        for feat, pt in zip(features, centroids):
+            if pt is None:
+                points.append(None)
+                continue
+            try:
+                pt4326 = next(transformed) if transformed is not None else transform.transform(pt.x(), pt.y())
+                points.append((pt4326.y(), pt4326.x()))
+            except Exception as e:
+                feedback.pushDebugInfo("Failed to retrieve what3words address for feature {}:\n{}".format(feat.id(), str(e)))
+                points.append(None)
+        return points
 
     def processAlgorithm(self, parameters, context, feedback):
         source = self.parameterAsSource(parameters, self.INPUT, context)   
@@ -109,26 +143,43 @@ class Add3WordsFieldAlgorithm(QgisAlgorithm):
         features = source.getFeatures()
         total = 100.0 / source.featureCount() if source.featureCount() else 0
 
-        epsg4326 = QgsCoordinateReferenceSystem('EPSG:4326')
-        transform = QgsCoordinateTransform(source.sourceCrs(), epsg4326, QgsProject.instance())
+        transform = get_transform(source.sourceCrs(), 'EPSG:4326')
         w3w = get_w3w_instance()
-            
-        for current, feat in enumerate(features):
+        lookupsBefore = w3w.squareIndex.hits if w3w.squareIndex is not None else 0
+        requestStats = w3w.scheduler.stats()
+        current = 0
+
+        for batch in batched(features):
             if feedback.isCanceled():
                 break
 
-            feedback.setProgress(int(current * total))
-            attrs = feat.attributes()
-            pt = feat.geometry().centroid().asPoint()
-            try:
-                pt4326 = transform.transform(pt.x(), pt.y())
-                threeWords = w3w.convertTo3wa(pt4326.y(), pt4326.x(), language=selected_language_code)["words"]
-            except Exception as e:
-                feedback.pushDebugInfo("Failed to retrieve what3words address for feature {}:\n{}".format(feat.id(), str(e)))
+            # Stage 1: centroids and reprojection of the whole batch, with no network waits in between
+            points = self.transform_centroids(batch, transform, feedback)
+
+            # Stage 2: concurrent requests for the distinct squares of the batch
+            valid = [point for point in points if point is not None]
+            converted = iter(w3w.convertTo3waMany(valid, language=selected_language_code))
+
+            # Stage 3: write the features
+            for feat, point in zip(batch, points):
                 threeWords = ""
+                if point is not None:
+                    result = next(converted)
+                    if isinstance(result, Exception):
+                        feedback.pushDebugInfo("Failed to retrieve what3words address for feature {}:\n{}".format(feat.id(), str(result)))
+                    else:
+                        threeWords = result["words"]
+
+                attrs = feat.attributes()
+                attrs.append(threeWords)
+                feat.setAttributes(attrs)
+                sink.addFeature(feat, QgsFeatureSink.FastInsert)
+
+            current += len(batch)
+            feedback.setProgress(int(current * total))
 
-            attrs.append(threeWords)
-            feat.setAttributes(attrs)
-            sink.addFeature(feat, QgsFeatureSink.FastInsert)
+        if w3w.squareIndex is not None:
+            feedback.pushInfo(f"{w3w.squareIndex.hits - lookupsBefore} features resolved from already known squares.")
+        feedback.pushInfo(w3w.scheduler.summary(requestStats))
 
         return {self.OUTPUT: dest_id}
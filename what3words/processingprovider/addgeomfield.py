@@ -7,11 +7,14 @@
 import os
 
 from qgis.PyQt.QtCore import QVariant
-from qgis.core import (QgsProcessingException,
+from qgis.core import (QgsProcessing,
+                       QgsProcessingException,
+                       QgsFields,
                        QgsCoordinateReferenceSystem,
                        QgsCoordinateTransform,
                        QgsField,
                        QgsProject,
+                       QgsFeature,
                        QgsFeatureSink,
                        QgsProcessingParameterFeatureSource,
                        QgsProcessingParameterString,
@@ -22,10 +25,13 @@ from qgis.core import (QgsProcessingException,
                        QgsGeometry,
                        QgsProcessingParameterField,
                        QgsPointXY,
-                       QgsProcessingParameterFeatureSink)
+                       QgsProcessingParameterFeatureSink,
+                       QgsProcessingMultiStepFeedback,
+                       QgsFeatureRequest)
 from processing.algs.qgis.QgisAlgorithm import QgisAlgorithm
 
-from what3words.utils import get_w3w_instance
+from what3words.utils import get_w3w_instance, resolve_distinct
+from what3words.validator import validate_3wa
 from qgiscommons2.settings import pluginSetting
 
 pluginPath = os.path.split(os.path.dirname(__file__))[0]
@@ -35,6 +41,7 @@ class Add3WordsGeomFieldAlgorithm(QgisAlgorithm):
     INPUT = 'INPUT'
     W3WFIELD = 'WHAT3WORDS ADDRESS'
     OUTPUT = 'OUTPUT'
+    REJECTS = 'REJECTS'
 
     def __init__(self):
         super().__init__()
@@ -46,6 +53,11 @@ class Add3WordsGeomFieldAlgorithm(QgisAlgorithm):
                 self.INPUT))
         self.addParameter(QgsProcessingParameterFeatureSink(self.OUTPUT,
                                                             self.tr('Output')))
+        self.addParameter(QgsProcessingParameterFeatureSink(self.REJECTS,
+                                                            self.tr('Rejected features'),
+                                                            QgsProcessing.TypeVector,
+                                                            optional=True,
+                                                            createByDefault=False))
 
     def name(self):
         return 'addw3wgeomfield'
@@ -66,6 +78,7 @@ class Add3WordsGeomFieldAlgorithm(QgisAlgorithm):
           <li><b>CSV file:</b> The input vector layer containing features with what3words addresses.</li>
           <li><b>What3words address field:</b> The field in the input layer that contains the what3words addresses.</li>
           <li><b>Output layer:</b> The resulting layer with point geometries based on the geocoded what3words addresses.</li>
+          <li><b>Rejected features:</b> Optional table with the features that could not be geocoded, and the reason in a <i>reject_reason</i> field.</li>
         </ul>
 
         <h3>Notes:</h3>
@@ -73,6 +86,7 @@ class Add3WordsGeomFieldAlgorithm(QgisAlgorithm):
           <li>The field containing what3words addresses must be specified and valid.</li>
           <li>An API key must be configured in the plugin settings.</li>
           <li>All geometries are transformed to EPSG:4326 (WGS84) for consistency.</li>
+          <li>Addresses are normalized (leading ///, surrounding whitespace and case) and checked locally first; features with missing or malformed addresses are rejected without calling the API.</li>
           <li>Features with invalid or missing what3words addresses will not be geocoded and will generate debug information.</li>
         </ul>
         """)
@@ -95,28 +109,45 @@ class Add3WordsGeomFieldAlgorithm(QgisAlgorithm):
             w3w = get_w3w_instance()  # Use centralized function to get API instance
         except ValueError as e:
             raise QgsProcessingException(f"Error initializing what3words API: {str(e)}")
+        requestStats = w3w.scheduler.stats()
 
         (sink, dest_id) = self.parameterAsSink(parameters, self.OUTPUT, context,
                                             fields, QgsWkbTypes.Point, QgsCoordinateReferenceSystem('EPSG:4326'))
-        features = source.getFeatures()
-        total = 100.0 / source.featureCount() if source.featureCount() else 0
 
+        # Features that can't be geocoded go to the optional rejects table, with the reason
+        rejectFields = QgsFields(fields)
+        rejectFields.append(QgsField('reject_reason', QVariant.String))
+        (rejects, rejects_id) = self.parameterAsSink(parameters, self.REJECTS, context,
+                                                     rejectFields, QgsWkbTypes.NoGeometry, QgsCoordinateReferenceSystem())
+
+        # First pass: collect the distinct addresses, so each one is geocoded only once.
+        # Values that are not possible addresses are rejected here and never requested.
+        steps = QgsProcessingMultiStepFeedback(2, feedback)
+        request = QgsFeatureRequest().setFlags(QgsFeatureRequest.NoGeometry).setSubsetOfAttributes([idxFieldId])
+        addresses = (validate_3wa(feat.attributes()[idxFieldId]) for feat in source.getFeatures(request))
+        valid = [words for words, reason in addresses if words]
+        converted = resolve_distinct(valid, w3w.convertToCoordinatesMany, steps)
+
+        # Second pass: fan the results out to the features
+        steps.setCurrentStep(1)
+        total = 100.0 / source.featureCount() if source.featureCount() else 0
         geocoded_count = 0
         skipped_count = 0
+        invalid_count = 0
 
-        for current, feat in enumerate(features):
+        for current, feat in enumerate(source.getFeatures()):
             if feedback.isCanceled():
                 break
 
-            feedback.setProgress(int(current * total))
-            attrs = feat.attributes()
-            threewa = attrs[idxFieldId]
-
+            words, reason = validate_3wa(feat.attributes()[idxFieldId])
             try:
-                if not threewa or not isinstance(threewa, str):
-                    raise ValueError("Missing or invalid what3words address.")
+                if reason is not None:
+                    invalid_count += 1
+                    raise ValueError(reason)
 
-                data = w3w.convertToCoordinates(threewa)
+                data = converted[words]
+                if isinstance(data, Exception):
+                    raise data
                 lat = data["coordinates"]["lat"]
                 lng = data["coordinates"]["lng"]
                 feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(lng, lat)))
@@ -124,13 +155,23 @@ class Add3WordsGeomFieldAlgorithm(QgisAlgorithm):
             except Exception as e:
                 feedback.pushDebugInfo(f"Failed to geocode feature {feat.id()}: {str(e)}")
                 skipped_count += 1
+                if rejects is not None:
+                    rejected = QgsFeature(rejectFields)
+                    rejected.setAttributes(feat.attributes() + [str(e)])
+                    rejects.addFeature(rejected, QgsFeatureSink.FastInsert)
                 continue
 
-            feat.setAttributes(attrs)
             sink.addFeature(feat, QgsFeatureSink.FastInsert)
+            steps.setProgress(int(current * total))
 
         feedback.pushInfo(f"Geocoded {geocoded_count} features.")
         feedback.pushInfo(f"Skipped {skipped_count} features due to errors or missing addresses.")
-
-        return {self.OUTPUT: dest_id}
- 
\ No newline at end of file
+        feedback.pushInfo(f"Rejected {invalid_count} features without calling the API, "
+                          f"as they have no valid what3words address.")
+        feedback.pushInfo(f"Resolved {len(converted)} distinct addresses for {len(valid)} features.")
+        feedback.pushInfo(w3w.scheduler.summary(requestStats))
+
+        results = {self.OUTPUT: dest_id}
+        if rejects is not None:
+            results[self.REJECTS] = rejects_id
+        return results
@@ -14,10 +14,14 @@ from qgis.core import (
     QgsProcessingParameterField,
     QgsFeature,
     QgsProcessingException,
+    QgsProcessingMultiStepFeedback,
+    QgsFeatureRequest,
 )
 from processing.algs.qgis.QgisAlgorithm import QgisAlgorithm
 
-from what3words.utils import get_w3w_instance
+from what3words.utils import get_w3w_instance, get_language_catalogue, resolve_distinct
+from what3words.validator import validate_3wa
+
 
 class ConvertWhat3WordsLanguageAlgorithm(QgisAlgorithm):
     """
@@ -46,8 +50,7 @@ class ConvertWhat3WordsLanguageAlgorithm(QgisAlgorithm):
             )
         )
         # Language selection
-        w3w = get_w3w_instance()
-        languages = self.get_supported_languages(w3w)
+        languages = self.get_supported_languages()
         self.addParameter(
             QgsProcessingParameterEnum(
                 self.LANGUAGE,
@@ -93,18 +96,16 @@ class ConvertWhat3WordsLanguageAlgorithm(QgisAlgorithm):
     def helpUrl(self):
         return "https://developer.what3words.com/tools/gis-extensions/qgis"
 
-    def get_supported_languages(self, w3w_instance):
+    def get_supported_languages(self):
         """
-        Retrieve supported languages from the what3words API.
+        Retrieve supported languages from the shared language catalogue.
 
-        :param w3w_instance: Configured what3words API instance.
         :return: List of supported language names.
         """
-        try:
-            languages = w3w_instance.getLanguages()
-            return [lang['name'] for lang in languages['languages']]
-        except Exception as e:
-            raise QgsProcessingException(f"Failed to retrieve supported languages: {str(e)}")
+        languages = get_language_catalogue(refresh=False).languages()
+        # Kept so processAlgorithm() maps the selected index to the list the user chose from
+        self.languageCodes = [lang['code'] for lang in languages]
+        return [lang['name'] for lang in languages]
 
     def processAlgorithm(self, parameters, context, feedback):
         source = self.parameterAsSource(parameters, self.INPUT, context)
@@ -113,10 +114,11 @@ class ConvertWhat3WordsLanguageAlgorithm(QgisAlgorithm):
 
         try:
             w3w = get_w3w_instance()
-            languages = w3w.getLanguages()
-            target_language_code = languages['languages'][target_language_index]['code']
+            languageCodes = getattr(self, 'languageCodes', None) or get_language_catalogue().codes()
+            target_language_code = languageCodes[target_language_index]
         except Exception as e:
             raise QgsProcessingException(f"Error retrieving target language: {str(e)}")
+        requestStats = w3w.scheduler.stats()
 
         # Define fields for the output layer
         fields = source.fields()
@@ -128,25 +130,32 @@ class ConvertWhat3WordsLanguageAlgorithm(QgisAlgorithm):
         (sink, dest_id) = self.parameterAsSink(parameters, self.OUTPUT, context,
                                             fields, source.wkbType(), source.sourceCrs())
 
-        features = source.getFeatures()
+        # First pass: translate each distinct address once, both hops of different addresses overlapping
+        steps = QgsProcessingMultiStepFeedback(2, feedback)
+        request = QgsFeatureRequest().setFlags(QgsFeatureRequest.NoGeometry).setSubsetOfAttributes([w3w_field], source.fields())
+        originals = (validate_3wa(feature[w3w_field]) for feature in source.getFeatures(request))
+        addresses = [words for words, reason in originals if words]
+        translations = resolve_distinct(addresses, lambda batch: w3w.convertLanguageMany(batch, target_language_code),
+                                        steps)
+
+        # Second pass: fan the translations out to the features
+        steps.setCurrentStep(1)
         total_features = source.featureCount()
 
-        for current, feature in enumerate(features):
+        for current, feature in enumerate(source.getFeatures()):
             if feedback.isCanceled():
                 break
 
             original_w3w = feature[w3w_field]
             converted_w3w = None
+            words, reason = validate_3wa(original_w3w)
             try:
-                if original_w3w and original_w3w.strip():
-                    # Fetch the coordinates of the original what3words address
-                    original_coords = w3w.convertToCoordinates(original_w3w.strip())
-                    lat = original_coords['coordinates']['lat']
-                    lon = original_coords['coordinates']['lng']
-
-                    # Convert the address to the target language
-                    converted_result = w3w.convertTo3wa(lat, lon, language=target_language_code)
-                    converted_w3w = converted_result['words']
+                if reason is not None:
+                    raise ValueError(reason)
+                converted_result = translations[words]
+                if isinstance(converted_result, Exception):
+                    raise converted_result
+                converted_w3w = converted_result['words']
             except Exception as e:
                 feedback.pushDebugInfo(f"Failed to convert what3words address '{original_w3w}': {str(e)}")
 
@@ -157,6 +166,8 @@ class ConvertWhat3WordsLanguageAlgorithm(QgisAlgorithm):
             sink.addFeature(new_feature, QgsFeatureSink.FastInsert)
 
             # Update progress
-            feedback.setProgress(int((current / total_features) * 100))
+            steps.setProgress(int((current / total_features) * 100))
 
+        feedback.pushInfo(f"Translated {len(translations)} distinct addresses for {len(addresses)} features.")
+        feedback.pushInfo(w3w.scheduler.summary(requestStats))
         return {self.OUTPUT: dest_id}
\ No newline at end of file
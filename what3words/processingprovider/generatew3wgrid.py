@@ -7,6 +7,7 @@ from qgis.core import (
     QgsProcessingAlgorithm,
     QgsProcessingParameterExtent,
     QgsProcessingParameterFeatureSink,
+    QgsProcessingParameterBoolean,
     QgsFeature,
     QgsFields,
     QgsField,
@@ -19,7 +20,15 @@ from qgis.core import (
     QgsPointXY,
     QgsFeatureSink
 )
-from what3words.utils import get_w3w_instance
+from what3words.utils import get_w3w_instance, batched
+from what3words.gridtiles import compactLines
+from what3words.gridgen import (calibrate, refine, calibrationSamples, verificationSamples, gridLines,
+                                linesMatch, LINE_TOLERANCE)
+
+# Height, in degrees, of the bands in which the grid is generated locally from one calibration
+BAND_HEIGHT = 0.1
+# Number of random grid sections requested to check the lines generated for each band
+VERIFICATION_SAMPLES = 2
 
 
 class GenerateW3WGridAlgorithm(QgisAlgorithm):
@@ -28,6 +37,7 @@ class GenerateW3WGridAlgorithm(QgisAlgorithm):
     """
 
     EXTENT = 'EXTENT'
+    GENERATE_LOCALLY = 'GENERATE_LOCALLY'
     OUTPUT = 'OUTPUT'
 
     def __init__(self):
@@ -48,14 +58,17 @@ class GenerateW3WGridAlgorithm(QgisAlgorithm):
         <h3>Inputs:</h3>
         <ul>
           <li><b>Bounding Box:</b> Specify the extent for which the grid will be created.</li>
+          <li><b>Generate Lines Locally:</b> Compute the grid lines from a few small grid sections instead of requesting the whole extent. Off by default.</li>
         </ul>
         <h3>Output:</h3>
         <ul>
           <li>A GeoJSON layer of lines representing what3words grid sections with attributes for the south, west, north, and east coordinates of each line.</li>
+          <li>When the lines are generated locally, each line runs across a whole band of the extent instead of a single grid section, so the layer has far fewer and longer lines. Bands that can't be generated locally are requested as usual.</li>
         </ul>
         <h3>Notes:</h3>
         <ul>
           <li>The bounding box will be split into smaller areas, with up to 10 API calls per area.</li>
+          <li>When generating lines locally, each band of the bounding box is calibrated with a few small grid sections and checked against random ones. Bands that do not pass the check are requested from the API.</li>
           <li>An API key must be configured in the plugin settings.</li>
           <li>Input coordinates will be transformed to EPSG:4326 (WGS84) if they are in a different CRS.</li>
         </ul>
@@ -73,6 +86,13 @@ class GenerateW3WGridAlgorithm(QgisAlgorithm):
                 defaultValue=None
             )
         )
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.GENERATE_LOCALLY,
+                self.tr('Generate Lines Locally'),
+                defaultValue=False
+            )
+        )
         self.addParameter(
             QgsProcessingParameterFeatureSink(
                 self.OUTPUT,
@@ -83,12 +103,14 @@ class GenerateW3WGridAlgorithm(QgisAlgorithm):
     def processAlgorithm(self, parameters, context, feedback):
         # Retrieve the extent parameter
         extent = self.parameterAsExtent(parameters, self.EXTENT, context)
+        generate_locally = self.parameterAsBool(parameters, self.GENERATE_LOCALLY, context)
 
         # Check API key and initialize `what3words`
         try:
             w3w = get_w3w_instance()
         except Exception as e:
             raise QgsProcessingException(f"Error initializing what3words API: {str(e)}")
+        requestStats = w3w.scheduler.stats()
 
         # Transform the input extent to WGS84 if needed
         project_crs = QgsProject.instance().crs()
@@ -135,53 +157,114 @@ class GenerateW3WGridAlgorithm(QgisAlgorithm):
                 x += tile_size * max_tiles**0.5
             return areas
 
-        # Split the bounding box into areas limited to 10 API calls
-        areas = split_bbox_into_areas(bbox)
+        if generate_locally:
+            # Generate the lines of each band from its lattice, and request the bands whose lattice could not be checked
+            areas = []
+            bands = self.splitBboxIntoBands(bbox)
+            feedback.pushInfo(f"Total bands to generate: {len(bands)}")
+            for i, band in enumerate(bands):
+                if feedback.isCanceled():
+                    break
+                lines = self.generateBand(w3w, band, last=i == len(bands) - 1)
+                if lines is None:
+                    feedback.pushInfo(f"Could not generate the grid locally for band {band}, requesting it instead")
+                    areas.extend(split_bbox_into_areas(band))
+                    continue
+                sink.addFeatures([self.lineFeature(fields, *line) for line in lines], QgsFeatureSink.FastInsert)
+                feedback.setProgress(int((i + 1) * 100.0 / len(bands)))
+        else:
+            # Split the bounding box into areas limited to 10 API calls
+            areas = split_bbox_into_areas(bbox)
 
         feedback.pushInfo(f"Total areas to process: {len(areas)}")
 
-        # Iterate through each area and call the `what3words` API
+        # Request the areas in batches, with concurrent calls to the `what3words` API
         total = 100.0 / len(areas) if areas else 1
-        for current, area in enumerate(areas):
+        current = 0
+        for batch in batched(areas, w3w.maxConcurrentRequests * 4):
             if feedback.isCanceled():
                 break
 
-            # Retrieve grid section from API
-            try:
-                response = w3w.getGridSection(f"{area[1]},{area[0]},{area[3]},{area[2]}")
-                if 'lines' not in response:
-                    raise QgsProcessingException(f"No grid data returned for area: {area}")
-            except Exception as e:
-                feedback.pushDebugInfo(f"Failed to retrieve grid for area {area}: {str(e)}")
-                continue
-
-            # Process lines
-            for line in response['lines']:
-                start = line['start']
-                end = line['end']
+            responses = w3w.getGridSectionMany([f"{area[1]},{area[0]},{area[3]},{area[2]}" for area in batch])
+            for area, response in zip(batch, responses):
+                # Retrieve grid section from API
                 try:
-                    # Form a line geometry
-                    line_geom = QgsGeometry.fromPolylineXY([
-                        QgsPointXY(start['lng'], start['lat']),
-                        QgsPointXY(end['lng'], end['lat'])
-                    ])
-
-                    # Create a new feature with lat/lng attributes
-                    feature = QgsFeature(fields)
-                    feature.setGeometry(line_geom)
-                    feature.setAttributes([
-                        start['lat'],  # South latitude
-                        start['lng'],  # West longitude
-                        end['lat'],    # North latitude
-                        end['lng']     # East longitude
-                    ])
-                    sink.addFeature(feature, QgsFeatureSink.FastInsert)
+                    if isinstance(response, Exception):
+                        raise response
+                    if 'lines' not in response:
+                        raise QgsProcessingException(f"No grid data returned for area: {area}")
                 except Exception as e:
-                    feedback.pushDebugInfo(f"Error processing line: {str(e)}")
+                    feedback.pushDebugInfo(f"Failed to retrieve grid for area {area}: {str(e)}")
                     continue
 
+                # Process lines
+                for line in response['lines']:
+                    start = line['start']
+                    end = line['end']
+                    try:
+                        feature = self.lineFeature(fields, start['lat'], start['lng'], end['lat'], end['lng'])
+                        sink.addFeature(feature, QgsFeatureSink.FastInsert)
+                    except Exception as e:
+                        feedback.pushDebugInfo(f"Error processing line: {str(e)}")
+                        continue
+
             # Update progress
+            current += len(batch)
             feedback.setProgress(int(current * total))
 
+        feedback.pushInfo(w3w.scheduler.summary(requestStats))
         feedback.pushInfo("Grid generation complete.")
-        return {self.OUTPUT: dest_id}
\ No newline at end of file
+        return {self.OUTPUT: dest_id}
+
+    def lineFeature(self, fields, lat1, lng1, lat2, lng2):
+        """
+        Creates the feature of a grid line, with its start and end coordinates as south, west, north and east attributes.
+        """
+        feature = QgsFeature(fields)
+        feature.setGeometry(QgsGeometry.fromPolylineXY([QgsPointXY(lng1, lat1), QgsPointXY(lng2, lat2)]))
+        feature.setAttributes([lat1, lng1, lat2, lng2])
+        return feature
+
+    def splitBboxIntoBands(self, bbox):
+        """
+        Splits a (min_x, min_y, max_x, max_y) bounding box into bands of BAND_HEIGHT degrees of latitude.
+        """
+        min_x, min_y, max_x, max_y = bbox
+        bands = []
+        y = min_y
+        while y < max_y:
+            bands.append((min_x, y, max_x, min(y + BAND_HEIGHT, max_y)))
+            y += BAND_HEIGHT
+        return bands
+
+    def generateBand(self, w3w, band, last=True):
+        """
+        Generates the grid lines of a band from the lattice of a few grid sections, checked against random ones.
+
+        :param band: The (min_x, min_y, max_x, max_y) bounds of the band
+        :param last: False to leave out the line on the north edge, which the next band generates
+        :return: The lines, as (lat1, lng1, lat2, lng2) tuples, or None if they could not be generated
+        """
+        west, south, east, north = band
+        calibration = calibrationSamples(south, west, north, east)
+        verification = verificationSamples(south, west, north, east, VERIFICATION_SAMPLES)
+        responses = w3w.getGridSectionMany(["%s,%s,%s,%s" % box for box in calibration + verification])
+        if any(isinstance(response, Exception) or 'lines' not in response for response in responses):
+            return None
+        samples = [compactLines(response) for response in responses]
+
+        lattice = calibrate(samples[0])
+        for lines in samples[1:len(calibration)]:
+            if lattice is None:
+                break
+            lattice = refine(lattice, lines)
+        if lattice is None:
+            return None
+        for lines, box in zip(samples[len(calibration):], verification):
+            if not linesMatch(lattice, lines, *box):
+                return None
+
+        lines = gridLines(lattice, south, west, north, east)
+        if not last:
+            lines = [line for line in lines if line[0] != line[2] or line[0] < north - LINE_TOLERANCE]
+        return lines
@@ -5,6 +5,7 @@
 
 import os
 
+from qgis.PyQt.QtCore import QTimer
 from qgis.PyQt.QtGui import QIcon
 
 from qgis.core import QgsProcessingProvider
@@ -14,6 +15,7 @@ from what3words.processingprovider.add3wordsfield import Add3WordsFieldAlgorithm
 from what3words.processingprovider.addgeomfield import Add3WordsGeomFieldAlgorithm
 from what3words.processingprovider.generatew3wgrid import GenerateW3WGridAlgorithm
 from what3words.processingprovider.convertw3wlanguage import ConvertWhat3WordsLanguageAlgorithm
+from what3words.utils import get_language_catalogue
 
 pluginPath = os.path.split(os.path.dirname(__file__))[0]
 
@@ -28,6 +30,8 @@ class W3WProvider(QgsProcessingProvider):
                                             'Activate', True))
         ProcessingConfig.readSettings()
         self.refreshAlgorithms()
+        # Algorithms are registered with the languages known on disk; update them once QGIS is idle
+        QTimer.singleShot(0, get_language_catalogue)
         return True
 
     def unload(self):
@@ -0,0 +1,172 @@
+from collections import deque, namedtuple
+from functools import partial
+
+from qgis.PyQt.QtCore import QObject, QUrl, QEventLoop, QTimer
+from qgis.PyQt.QtNetwork import QNetworkRequest, QNetworkReply
+from qgis.core import QgsNetworkAccessManager
+
+# Outcome of a request issued through W3WRequestPool
+W3WReply = namedtuple('W3WReply', ['status', 'headers', 'content', 'error'])
+# Error of the W3WReply delivered for an aborted request that run() is waiting on
+ABORTED_ERROR = "Request aborted"
+
+
+class W3WPendingRequest(object):
+    """
+    A request queued or running in a W3WRequestPool.
+    """
+
+    def __init__(self, url, headers, callback, callOnAbort=False):
+        self.url = url
+        self.headers = headers or {}
+        self.callback = callback
+        self.callOnAbort = callOnAbort
+        self.reply = None
+        self.aborted = False
+        self.attempt = 0
+
+
+class W3WRequestPool(QObject):
+    """
+    Issues GET requests through QgsNetworkAccessManager without blocking on each one.
+
+    Up to `maxInFlight` requests run at the same time; the rest wait in a queue
+    and are started as soon as a running request finishes. Each request reports
+    its W3WReply to its own callback, in whatever order the server answers.
+
+    If a RequestScheduler is given, requests are only started when the
+    scheduler hands out a token, and requests failing with a retryable status
+    are queued again after the backoff delay it returns.
+
+    The pool belongs to the thread that created it, as QgsNetworkAccessManager
+    instances are per thread.
+    """
+
+    def __init__(self, maxInFlight=8, scheduler=None, parent=None):
+        super().__init__(parent)
+        self.maxInFlight = max(1, int(maxInFlight))
+        self.scheduler = scheduler
+        self._queue = deque()
+        self._running = set()
+        self._retrying = set()
+        self._throttleTimer = QTimer(self)
+        self._throttleTimer.setSingleShot(True)
+        self._throttleTimer.timeout.connect(self._dispatch)
+
+    def pending(self):
+        """
+        Returns the number of requests queued, running or waiting to be retried.
+        """
+        return len(self._queue) + len(self._running) + len(self._retrying)
+
+    def submit(self, url, callback, headers=None, callOnAbort=False):
+        """
+        Queues a GET request and returns immediately.
+
+        :param url: The full URL to request
+        :param callback: Called with a W3WReply once the request has finished
+        :param headers: Optional dict of raw headers to send
+        :param callOnAbort: Whether the callback is also called, with an ABORTED_ERROR
+        reply, if the request is aborted
+        :return: A W3WPendingRequest that can be passed to abort()
+        """
+        request = W3WPendingRequest(url, headers, callback, callOnAbort)
+        self._queue.append(request)
+        self._dispatch()
+        return request
+
+    def abort(self, request):
+        """
+        Cancels a queued or running request.
+
+        Its callback is not called, unless the request was submitted with callOnAbort,
+        in which case it is called at once with an ABORTED_ERROR reply.
+        """
+        if request.aborted:
+            return
+        request.aborted = True
+        self._retrying.discard(request)
+        if request.reply is not None:
+            request.reply.abort()
+        else:
+            try:
+                self._queue.remove(request)
+            except ValueError:
+                pass
+        if request.callOnAbort:
+            request.callback(W3WReply(None, {}, b'', ABORTED_ERROR))
+
+    def run(self, urls, headers=None):
+        """
+        Requests all the given URLs concurrently and waits until every one has finished.
+
+        Requests aborted while waiting finish with an ABORTED_ERROR reply, so the wait always ends.
+
+        :param urls: List of full URLs to request
+        :param headers: Optional dict of raw headers to send with every request
+        :return: A list of W3WReply, in the same order as `urls`
+        """
+        results = [None] * len(urls)
+        if not urls:
+            return results
+        remaining = [len(urls)]
+        loop = QEventLoop()
+
+        def collect(index, reply):
+            results[index] = reply
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                loop.quit()
+
+        for index, url in enumerate(urls):
+            self.submit(url, partial(collect, index), headers, callOnAbort=True)
+        if remaining[0]:
+            loop.exec_(QEventLoop.ExcludeUserInputEvents)
+        return results
+
+    def _dispatch(self):
+        while self._queue and len(self._running) < self.maxInFlight:
+            if self.scheduler is not None:
+                delay = self.scheduler.acquire()
+                if delay > 0:
+                    if not self._throttleTimer.isActive():
+                        self.scheduler.noteDelay(delay)
+                        self._throttleTimer.start(int(delay * 1000) + 1)
+                    return
+            request = self._queue.popleft()
+            networkRequest = QNetworkRequest(QUrl(request.url))
+            for k, v in request.headers.items():
+                networkRequest.setRawHeader(k.encode(), v.encode())
+            request.reply = QgsNetworkAccessManager.instance().get(networkRequest)
+            request.reply.finished.connect(partial(self._finished, request))
+            self._running.add(request)
+
+    def _finished(self, request):
+        reply = request.reply
+        self._running.discard(request)
+        request.reply = None
+
+        status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+        headers = {bytes(k).decode().lower(): bytes(v).decode() for k, v in reply.rawHeaderPairs()}
+        content = bytes(reply.readAll())
+        error = reply.errorString() if reply.error() != QNetworkReply.NoError else None
+        reply.deleteLater()
+
+        if not request.aborted and self.scheduler is not None:
+            delay = self.scheduler.retryDelay(request.attempt, status, headers.get('retry-after'))
+            if delay is not None:
+                request.attempt += 1
+                self._retrying.add(request)
+                QTimer.singleShot(int(delay * 1000), partial(self._retry, request))
+                self._dispatch()
+                return
+
+        self._dispatch()
+        if not request.aborted:
+            request.callback(W3WReply(status, headers, content, error))
+
+    def _retry(self, request):
+        if request in self._retrying:
+            self._retrying.discard(request)
+            self._queue.appendleft(request)
+            self._dispatch()
@@ -0,0 +1,171 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+
+def parseRetryAfter(value, now=None):
+    """
+    Parses the value of a Retry-After header.
+
+    :param value: The header value, either a number of seconds or an HTTP date
+    :param now: Current time as a UNIX timestamp, used for HTTP dates
+    :return: The number of seconds to wait, or None if the value can't be parsed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if date is None:
+        return None
+    return max(0.0, date.timestamp() - (time.time() if now is None else now))
+
+
+class RequestScheduler(object):
+    """
+    Shared scheduler for what3words API requests.
+
+    Requests are paced by a token bucket refilled at `requestsPerSecond` tokens
+    per second (0 disables pacing), holding at most `burst` tokens. Requests
+    rejected with 429 or a 5xx status are retried up to `maxRetries` times with
+    exponential backoff, honouring the Retry-After header when the server sends
+    one. A 429 also pauses the whole bucket, so every pending request backs off
+    instead of adding to the overload.
+    """
+
+    def __init__(self, requestsPerSecond=0, burst=None, maxRetries=3, backoffBase=0.5, maxBackoff=60.0,
+                 clock=time.monotonic):
+        self.requestsPerSecond = requestsPerSecond
+        self.burst = burst or max(1.0, float(requestsPerSecond))
+        self.maxRetries = maxRetries
+        self.backoffBase = backoffBase
+        self.maxBackoff = maxBackoff
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+        self._pausedUntil = 0.0
+        self.resetStats()
+
+    def resetStats(self):
+        self.requests = 0
+        self.throttled = 0
+        self.waited = 0.0
+        self.retries = 0
+        self.rateLimited = 0
+        self.serverErrors = 0
+
+    def configure(self, requestsPerSecond, maxRetries):
+        """
+        Updates the rate and retry limits, keeping the statistics.
+        """
+        with self._lock:
+            if requestsPerSecond != self.requestsPerSecond:
+                self.requestsPerSecond = requestsPerSecond
+                self.burst = max(1.0, float(requestsPerSecond))
+                self._tokens = min(self._tokens, self.burst)
+            self.maxRetries = maxRetries
+
+    def acquire(self):
+        """
+        Tries to take a token for a new request.
+
+        :return: 0 if the request can be sent now, otherwise the number of
+        seconds to wait before calling acquire() again
+        """
+        with self._lock:
+            now = self._clock()
+            if now < self._pausedUntil:
+                return self._pausedUntil - now
+            if self.requestsPerSecond > 0:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.requestsPerSecond)
+                self._updated = now
+                if self._tokens < 1:
+                    return (1 - self._tokens) / self.requestsPerSecond
+                self._tokens -= 1
+            self.requests += 1
+            return 0
+
+    def wait(self):
+        """
+        Blocks the calling thread until a token is available and takes it.
+        """
+        delay = self.acquire()
+        if delay > 0:
+            self.throttled += 1
+        while delay > 0:
+            self.waited += delay
+            time.sleep(delay)
+            delay = self.acquire()
+
+    def noteDelay(self, delay):
+        """
+        Records that a request was held back for `delay` seconds by a non-blocking caller.
+        """
+        self.throttled += 1
+        self.waited += delay
+
+    @staticmethod
+    def isRetryable(status):
+        return status == 429 or (status is not None and 500 <= status < 600)
+
+    def retryDelay(self, attempt, status, retryAfter=None, maxDelay=None):
+        """
+        Decides whether a failed request should be retried.
+
+        :param attempt: Number of retries already made for the request
+        :param status: HTTP status of the failed request
+        :param retryAfter: Value of the Retry-After header of the response, if any
+        :param maxDelay: Longest acceptable wait, in seconds; requests that would have to wait longer are not retried
+        :return: Seconds to wait before retrying, or None if it should not be retried
+        """
+        if not self.isRetryable(status):
+            return None
+        with self._lock:
+            if status == 429:
+                self.rateLimited += 1
+            else:
+                self.serverErrors += 1
+            if attempt >= self.maxRetries:
+                return None
+            delay = parseRetryAfter(retryAfter)
+            if delay is None:
+                delay = min(self.maxBackoff, self.backoffBase * (2 ** attempt))
+            if maxDelay is not None and delay > maxDelay:
+                return None
+            if status == 429:
+                self._pausedUntil = max(self._pausedUntil, self._clock() + delay)
+            self.retries += 1
+            return delay
+
+    def stats(self):
+        """
+        Returns the throttling statistics gathered since the last reset.
+        """
+        return {
+            'requests': self.requests,
+            'throttled': self.throttled,
+            'waited': self.waited,
+            'retries': self.retries,
+            'rateLimited': self.rateLimited,
+            'serverErrors': self.serverErrors
+        }
+
+    def summary(self, since=None):
+        """
+        Returns the throttling statistics as a human readable sentence.
+
+        :param since: Optional result of an earlier call to stats(); if given, only
+        the activity after that call is reported
+        """
+        stats = self.stats()
+        if since is not None:
+            stats = {k: v - since.get(k, 0) for k, v in stats.items()}
+        return (f"{stats['requests']} API requests sent, {stats['throttled']} held back by the rate limit "
+                f"for {stats['waited']:.1f}s in total, {stats['retries']} retries "
+                f"({stats['rateLimited']} rate limited, {stats['serverErrors']} server errors).")
@@ -0,0 +1,80 @@
+from qgis.PyQt.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from what3words.pointstore import W3WPointStore, COLUMNS
+
+
+class W3WPointTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a W3WPointStore.
+
+    Views only ask for the cells they paint, so the cost of showing the table
+    does not grow with the number of points.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = W3WPointStore()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.store)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        return str(self.store.value(index.row(), index.column()))
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return COLUMNS[section]
+        return str(section + 1)
+
+    def flags(self, index):
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        previous = self.store.sort(column, descending=order == Qt.DescendingOrder)
+
+        # Keep selections and other persistent indices on the same points
+        persistent = self.persistentIndexList()
+        if persistent:
+            newRows = {oldRow: newRow for newRow, oldRow in enumerate(previous)}
+            self.changePersistentIndexList(persistent, [self.index(newRows[index.row()], index.column())
+                                                        for index in persistent])
+        self.layoutChanged.emit()
+
+    def appendRows(self, rows):
+        """
+        Appends rows given as (words, lat, lon, nearest_place, country, language) tuples.
+
+        :return: The ids of the new rows
+        """
+        rows = list(rows)
+        if not rows:
+            return []
+        first = len(self.store)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        ids = self.store.extend(rows)
+        self.endInsertRows()
+        return ids
+
+    def removeRowIndices(self, rows):
+        """
+        Removes the given rows, wherever they are in the table.
+
+        :return: The ids of the removed rows
+        """
+        self.beginResetModel()
+        removed = self.store.remove(rows)
+        self.endResetModel()
+        return removed
+
+    def clear(self):
+        self.beginResetModel()
+        self.store.clear()
+        self.endResetModel()
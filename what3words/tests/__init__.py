@@ -3,3 +3,9 @@
 # (c) 2016 Boundless, http://boundlessgeo.com
 # This code is licensed under the GPL 2.0 license.
 #
+
+import os
+import unittest
+
+# Wall-clock benchmarks depend on the machine and its load, so they only run when W3W_BENCHMARKS is set
+benchmark = unittest.skipUnless(os.environ.get('W3W_BENCHMARKS'), "set W3W_BENCHMARKS=1 to run the benchmarks")
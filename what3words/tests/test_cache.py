@@ -0,0 +1,147 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from what3words.cache import W3WCache, SquareIndex, AutosuggestCache, cellsForSquare, squareCellFor
+
+
+def _result(words, south, west, language='en'):
+    return {
+        'square': {
+            'southwest': {'lat': south, 'lng': west},
+            'northeast': {'lat': south + 0.000027, 'lng': west + 0.000042}
+        },
+        'coordinates': {'lat': south + 0.0000135, 'lng': west + 0.000021},
+        'words': words,
+        'nearestPlace': 'Bayswater, London',
+        'country': 'GB',
+        'language': language
+    }
+
+
+class TestW3WCache(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.cache = W3WCache(os.path.join(self.folder, "cache.sqlite"))
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.folder)
+
+    def test_square_lookup(self):
+        self.cache.put(_result('filled.count.soap', 51.520833, -0.195543))
+
+        hit = self.cache.getSquare(51.520847, -0.195521, 'EN')
+        self.assertEqual(hit['words'], 'filled.count.soap')
+        self.assertIsNone(self.cache.getSquare(51.520847, -0.195521, 'es'))
+        self.assertIsNone(self.cache.getSquare(51.5209, -0.195521, 'en'))
+        self.assertEqual(self.cache.stats(), {'hits': 1, 'misses': 2, 'entries': 1})
+
+    def test_words_lookup(self):
+        self.cache.put(_result('filled.count.soap', 51.520833, -0.195543))
+
+        self.assertEqual(self.cache.getWords('///Filled.Count.Soap')['country'], 'GB')
+        self.assertIsNone(self.cache.getWords('index.home.raft'))
+
+    def test_square_spanning_cells(self):
+        result = _result('index.home.raft', 51.52119, -0.20001)
+        self.assertGreater(len(cellsForSquare(result['square'])), 1)
+        self.cache.put(result)
+
+        self.assertIsNotNone(self.cache.getSquare(51.5212, -0.200005, 'en'))
+        self.assertIsNotNone(self.cache.getSquare(51.5212, -0.19998, 'en'))
+
+    def test_persistence(self):
+        self.cache.put(_result('filled.count.soap', 51.520833, -0.195543))
+        self.cache.close()
+
+        self.cache = W3WCache(os.path.join(self.folder, "cache.sqlite"))
+        self.assertIsNotNone(self.cache.getWords('filled.count.soap'))
+
+    def test_closed(self):
+        self.cache.put(_result('filled.count.soap', 51.520833, -0.195543))
+        self.cache.close()
+
+        # A client in another thread may still hold the cache
+        self.assertIsNone(self.cache.getWords('filled.count.soap'))
+        self.cache.put(_result('index.home.raft', 51.52119, -0.20001))
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_ttl(self):
+        self.cache.ttl = -1
+        self.cache.put(_result('filled.count.soap', 51.520833, -0.195543))
+
+        self.assertIsNone(self.cache.getWords('filled.count.soap'))
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_lru_eviction(self):
+        self.cache.maxEntries = 2
+        self.cache.putMany([_result('a.a.a', 10.0, 10.0), _result('b.b.b', 20.0, 20.0)])
+        self.cache.getWords('a.a.a')
+        self.cache.put(_result('c.c.c', 30.0, 30.0))
+        self.cache.prune()
+
+        self.assertIsNotNone(self.cache.getWords('a.a.a'))
+        self.assertIsNone(self.cache.getWords('b.b.b'))
+        self.assertIsNotNone(self.cache.getWords('c.c.c'))
+
+
+class TestSquareIndex(unittest.TestCase):
+
+    def test_find(self):
+        index = SquareIndex()
+        index.add(_result('filled.count.soap', 51.520833, -0.195543))
+
+        self.assertEqual(index.find(51.520847, -0.195521, 'en')['words'], 'filled.count.soap')
+        self.assertEqual(index.find(51.52085, -0.19551, 'EN')['words'], 'filled.count.soap')
+        self.assertIsNone(index.find(51.520847, -0.195521, 'de'))
+        self.assertIsNone(index.find(51.520870, -0.195521, 'en'))
+        self.assertEqual(index.findWords('filled.count.soap')['country'], 'GB')
+        self.assertEqual((index.hits, index.misses), (3, 2))
+
+    def test_eviction(self):
+        index = SquareIndex(maxSquares=2)
+        index.add(_result('a.a.a', 10.0, 10.0))
+        index.add(_result('b.b.b', 20.0, 20.0))
+        index.find(10.00001, 10.00001, 'en')
+        index.add(_result('c.c.c', 30.0, 30.0))
+
+        self.assertEqual(len(index), 2)
+        self.assertIsNotNone(index.findWords('a.a.a'))
+        self.assertIsNone(index.find(20.00001, 20.00001, 'en'))
+        self.assertIsNotNone(index.findWords('c.c.c'))
+
+    def test_square_cells(self):
+        self.assertEqual(squareCellFor(51.520847, -0.195521), squareCellFor(51.520850, -0.195515))
+        self.assertNotEqual(squareCellFor(51.520847, -0.195521), squareCellFor(51.520880, -0.195521))
+        self.assertNotEqual(squareCellFor(51.520847, -0.195521), squareCellFor(51.520847, -0.195570))
+
+
+class TestAutosuggestCache(unittest.TestCase):
+
+    def test_keys(self):
+        cache = AutosuggestCache()
+        key = AutosuggestCache.key({'input': 'filled.count.so', 'language': 'en', 'key': 'A'})
+        self.assertEqual(key, AutosuggestCache.key({'language': 'en', 'input': 'filled.count.so', 'key': 'B'}))
+        self.assertNotEqual(key, AutosuggestCache.key({'input': 'filled.count.so', 'language': 'en',
+                                                       'focus': '51.5,-0.12'}))
+        self.assertIsNone(cache.get(key))
+        cache.put(key, {'suggestions': []})
+        self.assertEqual(cache.get(key), {'suggestions': []})
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_expiry_and_eviction(self):
+        now = [0]
+        cache = AutosuggestCache(maxEntries=2, ttl=10, clock=lambda: now[0])
+        for text in ('a.b.c', 'a.b.cd', 'a.b.cde'):
+            cache.put((('input', text),), text)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get((('input', 'a.b.c'),)))
+        now[0] = 11
+        self.assertIsNone(cache.get((('input', 'a.b.cd'),)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import math
+import random
+import unittest
+
+from what3words.gridgen import (GridLattice, axisLattice, calibrate, refine, calibrationSamples,
+                                verificationSamples, gridLines, linesMatch, SAMPLE_SIZE)
+from what3words.gridtiles import tileFor, tileBounds
+
+# A made up lattice, with squares about 3m high and 3m wide at 51 degrees north
+LATTICE = GridLattice(51.5000112, 0.0000269494, -0.2000057, 0.0000428211)
+
+
+def apiLines(south, west, north, east, lattice=LATTICE):
+    """
+    Returns the lines of a grid section the way the API does: clipped to the box and with 6 decimals.
+    """
+    return [tuple(round(value, 6) for value in line) for line in gridLines(lattice, south, west, north, east)]
+
+
+class TestGridGen(unittest.TestCase):
+
+    def test_axis(self):
+        origin, step = axisLattice([1.0, 1.5, 2.5, 3.0])
+        self.assertEqual((origin, step), (1.0, 0.5))
+        self.assertIsNone(axisLattice([1.0, 1.5, 2.2]))
+        self.assertIsNone(axisLattice([1.0, 2.0]))
+
+    def test_calibrate_and_refine(self):
+        extent = (51.52, -0.2, 51.57, -0.1)
+        samples = calibrationSamples(*extent)
+        self.assertEqual(samples[0][:2], (51.52, -0.2))
+        self.assertAlmostEqual(samples[-1][3], -0.1)
+
+        lattice = calibrate(apiLines(*samples[0]))
+        for sample in samples[1:]:
+            lattice = refine(lattice, apiLines(*sample))
+        self.assertIsNotNone(lattice)
+
+        # Lines generated for the whole extent are those the API would return,
+        # up to the last decimal, which may be rounded the other way
+        generated = gridLines(lattice, *extent)
+        expected = apiLines(*extent)
+        self.assertEqual(len(generated), len(expected))
+        for a, b in zip(generated, expected):
+            self.assertTrue(all(abs(x - y) <= 2e-6 for x, y in zip(a, b)), (a, b))
+
+        for sample in verificationSamples(*extent, 5, rng=random.Random(0)):
+            self.assertTrue(linesMatch(lattice, apiLines(*sample), *sample))
+
+    def test_extrapolate_tiles(self):
+        # Like the live grid: fit the rounded lines of some tiles of a row, and generate the tiles
+        # up to as many columns away as the fitted tiles span
+        rng = random.Random(0)
+        for _ in range(100):
+            lat = rng.uniform(-70, 70)
+            latStep = 3 / 111320 * rng.uniform(0.95, 1.05)
+            lattice = GridLattice(lat, latStep, rng.uniform(-170, 170), latStep / math.cos(math.radians(lat)))
+            row, col = tileFor(lattice.latOrigin, lattice.lngOrigin)
+            for cols in ([0], [0, 1], [0, 3]):
+                fitted = calibrate([line for c in cols for line in apiLines(*tileBounds((row, col + c)), lattice=lattice)])
+                self.assertIsNotNone(fitted)
+                span = cols[-1] - cols[0] + 1
+                for c in range(cols[0] - span, cols[-1] + span + 1):
+                    bounds = tileBounds((row, col + c))
+                    self.assertTrue(linesMatch(fitted, apiLines(*bounds, lattice=lattice), *bounds), (lattice, cols, c))
+
+    def test_mismatch(self):
+        box = (51.52, -0.2, 51.52 + SAMPLE_SIZE, -0.2 + SAMPLE_SIZE)
+        lattice = calibrate(apiLines(*box))
+        other = LATTICE._replace(lngStep=LATTICE.lngStep * 1.01)
+        self.assertFalse(linesMatch(lattice, apiLines(*box, lattice=other), *box))
+        self.assertFalse(linesMatch(lattice, apiLines(*box)[1:-1], *box))
+        self.assertIsNone(calibrate([(51.52, -0.2, 51.521, -0.199)]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from what3words.gridtiles import (GridTileCache, TILE_SIZE, tileFor, tilesForExtent, tileBounds,
+                                  tileBoundingBox, compactLines, endpointFolder)
+
+LINES = [(51.5207, -0.1962, 51.5207, -0.1935), (51.5207, -0.1962, 51.5234, -0.1962)]
+
+
+class TestTiles(unittest.TestCase):
+
+    def test_tiles(self):
+        tile = tileFor(51.520847, -0.195521)
+        south, west, north, east = tileBounds(tile)
+        self.assertTrue(south <= 51.520847 < north and west <= -0.195521 < east)
+        self.assertAlmostEqual(north - south, TILE_SIZE)
+        self.assertEqual(tileBoundingBox(tile), f"{south},{west},{north},{east}")
+
+        tiles = tilesForExtent(south, west, north + TILE_SIZE / 2, east + TILE_SIZE * 1.5)
+        self.assertEqual(len(tiles), 6)
+        self.assertEqual(tiles[0], tile)
+
+    def test_compact_lines(self):
+        grid = {'lines': [{'start': {'lat': 1.0, 'lng': 2.0}, 'end': {'lat': 3.0, 'lng': 4.0}}]}
+        self.assertEqual(compactLines(grid), [(1.0, 2.0, 3.0, 4.0)])
+
+
+class TestGridTileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_memory_lru(self):
+        cache = GridTileCache(maxTiles=2)
+        for i in range(3):
+            cache.put((i, 0), LINES)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get((0, 0)))
+        self.assertEqual(cache.get((2, 0)), LINES)
+
+    def test_disk(self):
+        GridTileCache(folder=self.folder).put((10, -20), LINES)
+        cache = GridTileCache(folder=self.folder)
+        self.assertEqual(cache.get((10, -20)), LINES)
+        self.assertIsNone(cache.get((10, -21)))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_memory_only(self):
+        cache = GridTileCache(folder=self.folder)
+        cache.put((10, -20), LINES, persist=False)
+        self.assertEqual(cache.get((10, -20)), LINES)
+        cache.discard((10, -20))
+        self.assertIsNone(cache.get((10, -20)))
+        self.assertIsNone(GridTileCache(folder=self.folder).get((10, -20)))
+
+    def test_disk_limits(self):
+        cache = GridTileCache(maxTiles=2, folder=self.folder, maxDiskTiles=10)
+        for i in range(11):
+            cache.put((i, 0), LINES)
+        self.assertEqual(len(os.listdir(self.folder)), 9)
+
+        cache = GridTileCache(folder=self.folder, ttl=60)
+        old = time.time() - 120
+        os.utime(os.path.join(self.folder, "10_0.json"), (old, old))
+        self.assertIsNone(cache.get((10, 0)))
+        self.assertEqual(cache.get((9, 0)), LINES)
+
+    def test_endpoint_folder(self):
+        self.assertEqual(endpointFolder("https://api.what3words.com/"), endpointFolder("https://api.what3words.com"))
+        self.assertNotEqual(endpointFolder("https://api.what3words.com"), endpointFolder("http://localhost:8080"))
+
+
+if __name__ == '__main__':
+    unittest.main()
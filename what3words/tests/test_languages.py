@@ -0,0 +1,61 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from what3words.languages import LanguageCatalogue, FALLBACK_LANGUAGES
+
+LANGUAGES = [
+    {'code': 'en', 'name': 'English', 'nativeName': 'English'},
+    {'code': 'es', 'name': 'Spanish', 'nativeName': 'Español'}
+]
+
+
+class TestLanguageCatalogue(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, "what3words", "languages.json")
+        self.now = 1000.0
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def _catalogue(self):
+        return LanguageCatalogue(self.path, ttl=100, clock=lambda: self.now)
+
+    def test_fallback(self):
+        catalogue = self._catalogue()
+        self.assertEqual(catalogue.languages(), FALLBACK_LANGUAGES)
+        self.assertTrue(catalogue.isStale())
+
+    def test_persistence(self):
+        self.assertTrue(self._catalogue().update(LANGUAGES))
+
+        catalogue = self._catalogue()
+        self.assertEqual(catalogue.codes(), ['en', 'es'])
+        self.assertEqual(catalogue.names(), ['English', 'Spanish'])
+        self.assertFalse(catalogue.isStale())
+        self.assertFalse(catalogue.update(LANGUAGES))
+
+    def test_ttl(self):
+        catalogue = self._catalogue()
+        catalogue.update(LANGUAGES)
+        self.now += 100
+        self.assertTrue(catalogue.isStale())
+        self.assertEqual(catalogue.codes(), ['en', 'es'])
+
+    def test_corrupt_file(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as f:
+            f.write("{not json")
+        self.assertEqual(self._catalogue().languages(), FALLBACK_LANGUAGES)
+
+        with open(self.path, 'w') as f:
+            json.dump({'languages': [{'code': 'de'}]}, f)
+        self.assertEqual(self._catalogue().languages(), FALLBACK_LANGUAGES)
+
+
+if __name__ == '__main__':
+    unittest.main()
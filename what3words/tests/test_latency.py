@@ -0,0 +1,29 @@
+import unittest
+
+from what3words.latency import LatencyStats
+
+
+class TestLatencyStats(unittest.TestCase):
+
+    def test_percentiles(self):
+        stats = LatencyStats()
+        self.assertIsNone(stats.percentile(50))
+        self.assertEqual(stats.summary(), "no samples")
+        for ms in range(1, 101):
+            stats.record(ms / 1000)
+        self.assertEqual(stats.percentile(50), 0.05)
+        self.assertEqual(stats.percentile(90), 0.09)
+        self.assertEqual(stats.percentile(100), 0.1)
+        self.assertEqual(stats.summary(), "p50=50ms p90=90ms p99=99ms (n=100)")
+
+    def test_window(self):
+        stats = LatencyStats(size=10)
+        for ms in range(100):
+            stats.record(ms / 1000)
+        self.assertEqual(len(stats), 10)
+        self.assertEqual(stats.count, 100)
+        self.assertEqual(stats.percentile(0), 0.09)
+
+
+if __name__ == '__main__':
+    unittest.main()
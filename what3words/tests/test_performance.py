@@ -0,0 +1,107 @@
+import subprocess
+import sys
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from qgis.core import QgsApplication
+from qgis.gui import QgsMapCanvas
+from qgis.PyQt.QtWidgets import QMainWindow
+
+from what3words.tests import benchmark
+
+# Seconds allowed for importing the plugin, initGui() and registering the processing provider
+STARTUP_BUDGET = 2.0
+
+# Measures the import of the plugin in a fresh interpreter, so modules already loaded by the tests don't count
+IMPORT_TIME_SCRIPT = "import time; start = time.perf_counter(); import what3words.plugin; print(time.perf_counter() - start)"
+
+
+class TestStartupPerformance(unittest.TestCase):
+    def setUp(self):
+        # Mock iface, with a real map canvas for the coordinate dock
+        self.iface = MagicMock()
+        self.iface.mainWindow.return_value = QMainWindow()
+        self.canvas = QgsMapCanvas()
+        self.iface.mapCanvas.return_value = self.canvas
+
+    def tearDown(self):
+        if getattr(self, 'plugin', None) is not None:
+            QgsApplication.processingRegistry().removeProvider(self.plugin.provider)
+
+    def startPlugin(self):
+        """
+        Loads the plugin, failing on any request to the API, or what3words instance built for the coordinate dock.
+        """
+        import what3words.plugin as plugin_module
+        import what3words.w3w as w3w_module
+        import what3words.coorddialog_new_ui as dialog_module
+
+        network = MagicMock(side_effect=AssertionError("The what3words API was called while loading the plugin"))
+        with patch.object(w3w_module.what3words, 'postRequest', network), \
+             patch.object(w3w_module.what3words, 'postRequests', network), \
+             patch.object(w3w_module.what3words, '_requestAsync', network), \
+             patch.object(dialog_module, 'get_w3w_instance', network):
+            self.plugin = plugin_module.W3WTools(self.iface)
+            self.plugin.initGui()
+        return network, dialog_module
+
+    def test_startup(self):
+        network, dialog_module = self.startPlugin()
+
+        provider = QgsApplication.processingRegistry().providerById('what3words')
+        self.assertIsNotNone(provider)
+        self.assertEqual(len(provider.algorithms()), 4)
+        network.assert_not_called()
+        self.assertIsInstance(self.plugin.coordDialog, dialog_module.W3WCoordInputDialog)
+        self.assertIsNone(self.plugin.coordDialog.w3w)
+
+    @benchmark
+    def test_startup_benchmark(self):
+        output = subprocess.run([sys.executable, '-c', IMPORT_TIME_SCRIPT], check=True,
+                                capture_output=True, text=True).stdout
+        importTime = float(output.strip().splitlines()[-1])
+
+        start = time.perf_counter()
+        self.startPlugin()
+        elapsed = importTime + time.perf_counter() - start
+        self.assertLess(elapsed, STARTUP_BUDGET, f"Plugin startup took {elapsed:.2f}s")
+
+    @benchmark
+    def test_provider_refresh_benchmark(self):
+        from what3words.processingprovider.w3wprovider import W3WProvider
+        provider = W3WProvider()
+
+        start = time.perf_counter()
+        for _ in range(10):
+            provider.refreshAlgorithms()
+        elapsed = (time.perf_counter() - start) / 10
+
+        self.assertEqual(len(provider.algorithms()), 4)
+        self.assertLess(elapsed, STARTUP_BUDGET / 10, f"Provider refresh took {elapsed:.3f}s")
+
+
+class TestTransformCachePerformance(unittest.TestCase):
+    POINTS = 2000
+
+    def test_transform_built_once(self):
+        import what3words.utils as utils
+
+        # transform_coords used to build a new transform for every point; the cache builds one per CRS pair
+        utils.invalidate_transforms()
+        with patch.object(utils, 'QgsCoordinateTransform', wraps=utils.QgsCoordinateTransform) as constructor:
+            for i in range(self.POINTS):
+                utils.get_transform('EPSG:3857', 'EPSG:4326').transform(i, i)
+        self.assertEqual(constructor.call_count, 1)
+
+    def test_invalidation(self):
+        from qgis.core import QgsProject
+        from what3words.utils import get_transform
+
+        transform = get_transform('EPSG:3857', 'EPSG:4326')
+        self.assertIs(get_transform('EPSG:3857', 'EPSG:4326'), transform)
+        QgsProject.instance().transformContextChanged.emit()
+        self.assertIsNot(get_transform('EPSG:3857', 'EPSG:4326'), transform)
+
+
+if __name__ == '__main__':
+    unittest.main()
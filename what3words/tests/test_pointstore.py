@@ -0,0 +1,107 @@
+import random
+import time
+import unittest
+
+from what3words.pointstore import W3WPointStore, PointGrid, LAT, COUNTRY
+from what3words.tests import benchmark
+
+# Seconds allowed for deleting a 10k-row selection and matching its markers
+DELETE_BUDGET = 1.0
+
+ROWS = [
+    ('filled.count.soap', 51.520847, -0.195521, 'Bayswater, London', 'GB', 'en'),
+    ('index.home.raft', 51.521251, -0.203586, 'Bayswater, London', 'GB', 'en'),
+    ('caja.contar.jabón', 51.520847, -0.195521, 'Bayswater, Londres', 'GB', 'es'),
+    ('daring.lion.race', 40.750000, -73.990000, 'New York', 'US', 'en')
+]
+
+
+class TestW3WPointStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = W3WPointStore()
+        self.store.extend(ROWS)
+
+    def test_rows(self):
+        self.assertEqual(len(self.store), 4)
+        self.assertEqual(list(self.store.rows()), ROWS)
+        self.assertEqual(self.store.value(1, LAT), 51.521251)
+        self.assertEqual(self.store.countries.values, ['GB', 'US'])
+
+    def test_remove(self):
+        self.store.remove([0, 2])
+        self.assertEqual(list(self.store.rows()), [ROWS[1], ROWS[3]])
+        self.assertEqual(list(self.store.coordinates()), [(51.521251, -0.203586), (40.75, -73.99)])
+
+    def test_sort(self):
+        order = self.store.sort(LAT)
+        self.assertEqual(order, [3, 0, 2, 1])
+        self.assertEqual(self.store.row(0), ROWS[3])
+
+        self.store.sort(COUNTRY, descending=True)
+        self.assertEqual(self.store.value(0, COUNTRY), 'US')
+
+    def test_ids(self):
+        self.assertEqual(list(self.store.ids), [0, 1, 2, 3])
+        self.store.sort(LAT)
+        self.assertEqual(list(self.store.ids), [3, 0, 2, 1])
+        self.assertEqual(self.store.remove([0, 1]), [3, 0])
+        self.assertEqual(self.store.append(*ROWS[0]), 4)
+
+    def test_clear(self):
+        self.store.clear()
+        self.assertEqual(len(self.store), 0)
+        self.store.append('filled.count.soap', '51.520847', '-0.195521')
+        self.assertEqual(self.store.row(0), ('filled.count.soap', 51.520847, -0.195521, '', '', ''))
+
+
+class TestPointGrid(unittest.TestCase):
+
+    def test_near(self):
+        grid = PointGrid(tolerance=1e-6)
+        grid.add('a', -0.195521, 51.520847)
+        grid.add('b', -0.1955215, 51.5208475)
+        grid.add('c', -0.203586, 51.521251)
+        self.assertEqual(sorted(grid.near(-0.195521, 51.520847)), ['a', 'b'])
+        grid.discard('a')
+        self.assertEqual(grid.near(-0.195521, 51.520847), ['b'])
+        self.assertEqual(grid.near(-0.2, 51.5), [])
+        self.assertEqual(len(grid), 2)
+
+    def deleteSelection(self):
+        """
+        Deletes a random 10k-row selection from a 20k-row store, and the markers of its rows from a grid.
+        """
+        rng = random.Random(0)
+        store = W3WPointStore()
+        ids = store.extend(('index.home.raft', rng.uniform(-80, 80), rng.uniform(-180, 180), '', 'GB', 'en')
+                           for _ in range(20000))
+        grid = PointGrid()
+        for rowId, (lat, lon) in zip(ids, store.coordinates()):
+            grid.add(rowId, lon, lat)
+        selection = rng.sample(range(len(store)), 10000)
+
+        start = time.perf_counter()
+        points = [(store.lons[row], store.lats[row]) for row in selection]
+        removed = store.remove(selection)
+        for x, y in points:
+            for key in grid.near(x, y):
+                grid.discard(key)
+        elapsed = time.perf_counter() - start
+        return store, grid, removed, elapsed
+
+    def test_delete_selection(self):
+        store, grid, removed, _ = self.deleteSelection()
+        self.assertEqual(len(removed), 10000)
+        self.assertEqual(len(store), 10000)
+        self.assertEqual(len(grid), 10000)
+        self.assertEqual(sorted(grid.near(lon, lat)[0] for lat, lon in store.coordinates()), sorted(store.ids))
+
+    @benchmark
+    def test_delete_selection_benchmark(self):
+        _, _, _, elapsed = self.deleteSelection()
+        self.assertLess(elapsed, DELETE_BUDGET, f"Deleting 10k rows took {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    unittest.main()
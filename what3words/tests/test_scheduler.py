@@ -0,0 +1,76 @@
+import unittest
+
+from what3words.scheduler import RequestScheduler, parseRetryAfter
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRequestScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_unlimited(self):
+        scheduler = RequestScheduler(clock=self.clock)
+        self.assertTrue(all(scheduler.acquire() == 0 for _ in range(1000)))
+        self.assertEqual(scheduler.requests, 1000)
+
+    def test_token_bucket(self):
+        scheduler = RequestScheduler(requestsPerSecond=10, clock=self.clock)
+        for _ in range(10):
+            self.assertEqual(scheduler.acquire(), 0)
+        self.assertAlmostEqual(scheduler.acquire(), 0.1)
+
+        self.clock.now += 0.1
+        self.assertEqual(scheduler.acquire(), 0)
+        self.assertGreater(scheduler.acquire(), 0)
+
+    def test_backoff(self):
+        scheduler = RequestScheduler(maxRetries=3, backoffBase=0.5, clock=self.clock)
+        self.assertEqual(scheduler.retryDelay(0, 503), 0.5)
+        self.assertEqual(scheduler.retryDelay(1, 503), 1.0)
+        self.assertEqual(scheduler.retryDelay(2, 500), 2.0)
+        self.assertIsNone(scheduler.retryDelay(3, 500))
+        self.assertIsNone(scheduler.retryDelay(0, 400))
+        self.assertEqual((scheduler.retries, scheduler.serverErrors), (3, 4))
+
+    def test_retry_after_pauses_bucket(self):
+        scheduler = RequestScheduler(clock=self.clock)
+        self.assertEqual(scheduler.retryDelay(0, 429, '5'), 5.0)
+        self.assertEqual(scheduler.acquire(), 5.0)
+
+        self.clock.now += 5
+        self.assertEqual(scheduler.acquire(), 0)
+        self.assertEqual(scheduler.rateLimited, 1)
+
+    def test_max_delay(self):
+        scheduler = RequestScheduler(clock=self.clock)
+        self.assertIsNone(scheduler.retryDelay(0, 429, '30', maxDelay=2))
+        self.assertEqual(scheduler.acquire(), 0)
+        self.assertEqual(scheduler.retryDelay(0, 429, '1', maxDelay=2), 1.0)
+        self.assertEqual(scheduler.retries, 1)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parseRetryAfter('120'), 120.0)
+        self.assertEqual(parseRetryAfter('Wed, 21 Oct 2015 07:28:10 GMT', now=1445412480), 10.0)
+        self.assertIsNone(parseRetryAfter('soon'))
+        self.assertIsNone(parseRetryAfter(None))
+
+    def test_summary_since(self):
+        scheduler = RequestScheduler(clock=self.clock)
+        scheduler.acquire()
+        before = scheduler.stats()
+        scheduler.acquire()
+        scheduler.acquire()
+        self.assertTrue(scheduler.summary(before).startswith("2 API requests sent"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import random
+import re
+import time
+import unittest
+
+from what3words.validator import is_possible_3wa, filter_possible_3wa, validate_3wa, POSSIBLE_3WA_PATTERN, SEPARATORS
+from what3words.tests import benchmark
+
+# Minimum number of strings checked per second by filter_possible_3wa
+THROUGHPUT_BUDGET = 200000
+
+SAMPLES = [
+    'filled.count.soap', '///index.home.raft', 'caja.contar.jabón', 'produkt。dom。raft',
+    'filled.count', 'filled.count.so', 'index home raft', '51.520847', '12 High Street',
+    'the quick brown fox jumps over the lazy dog', 'a.b.c.d', '', '   ', 'fill3d.count.soap'
+]
+
+
+class TestValidator(unittest.TestCase):
+
+    def test_possible_3wa(self):
+        self.assertTrue(is_possible_3wa('filled.count.soap'))
+        self.assertTrue(is_possible_3wa('///index.home.raft'))
+        self.assertTrue(is_possible_3wa('produkt。dom。raft'))
+        self.assertFalse(is_possible_3wa('index home raft'))
+        self.assertFalse(is_possible_3wa('51.520847'))
+        self.assertFalse(is_possible_3wa(''))
+        self.assertFalse(is_possible_3wa(None))
+
+    def test_same_as_pattern(self):
+        # The pre-check must never reject a string the full pattern accepts
+        pattern = re.compile(POSSIBLE_3WA_PATTERN)
+        rng = random.Random(0)
+        alphabet = 'abcxyzé /' + SEPARATORS + '0,-'
+        strings = SAMPLES + [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 20))) for _ in range(20000)]
+        for text in strings:
+            self.assertEqual(is_possible_3wa(text), pattern.match(text) is not None, text)
+
+    def test_filter(self):
+        self.assertEqual(list(filter_possible_3wa(SAMPLES)),
+                         ['filled.count.soap', '///index.home.raft', 'caja.contar.jabón', 'produkt。dom。raft',
+                          'filled.count.so'])
+
+    def test_validate(self):
+        self.assertEqual(validate_3wa(' ///Filled.Count.Soap '), ('filled.count.soap', None))
+        self.assertEqual(validate_3wa(None), (None, "Missing what3words address."))
+        self.assertEqual(validate_3wa('  '), (None, "Missing what3words address."))
+        self.assertEqual(validate_3wa(42), (None, "Not a text value: 42."))
+        self.assertEqual(validate_3wa(0), (None, "Not a text value: 0."))
+
+        class Null(object):
+            # Like the NULL QVariant of a layer attribute
+            def isNull(self):
+                return True
+        self.assertEqual(validate_3wa(Null()), (None, "Missing what3words address."))
+        self.assertEqual(validate_3wa('12 High Street'),
+                         (None, "'12 High Street' is not in the form of a what3words address."))
+
+    @benchmark
+    def test_throughput_benchmark(self):
+        # About a million mixed strings, 5 in 14 of them possible addresses
+        repeats = 1000000 // len(SAMPLES) + 1
+        strings = SAMPLES * repeats
+        start = time.perf_counter()
+        count = sum(1 for _ in filter_possible_3wa(strings))
+        throughput = len(strings) / (time.perf_counter() - start)
+        self.assertEqual(count, 5 * repeats)
+        self.assertGreater(throughput, THROUGHPUT_BUDGET, f"Validated {throughput:.0f} strings/s")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -165,12 +165,10 @@ class Ui_discoverToWhat3words(object):
         self.addLineEdit.setClearButtonEnabled(True)
         self.addLineEdit.setObjectName("addLineEdit")
         self.inputField.addWidget(self.addLineEdit, 0, 0, 1, 1)
-        self.tableWidget = QtWidgets.QTableWidget(self.dockWidgetContents)
-        self.tableWidget.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-        self.tableWidget.setObjectName("tableWidget")
-        self.tableWidget.setColumnCount(0)
-        self.tableWidget.setRowCount(0)
-        self.inputField.addWidget(self.tableWidget, 2, 0, 1, 1)
+        self.tableView = QtWidgets.QTableView(self.dockWidgetContents)
+        self.tableView.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.tableView.setObjectName("tableView")
+        self.inputField.addWidget(self.tableView, 2, 0, 1, 1)
         spacerItem3 = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
         self.inputField.addItem(spacerItem3, 1, 0, 1, 1)
         self.verticalLayout.addLayout(self.inputField)
@@ -220,7 +218,7 @@ class Ui_discoverToWhat3words(object):
         self.w3wLabel.setText(_translate("discoverToWhat3words", "Enter what3words address"))
         self.addLineEdit.setToolTip(_translate("discoverToWhat3words", "Enter what3words address here e.g.  ///index.home.raft"))
         self.addLineEdit.setPlaceholderText(_translate("discoverToWhat3words", "  e.g. ///index.home.raft"))
-        self.tableWidget.setToolTip(_translate("discoverToWhat3words", "List of what3words address"))
+        self.tableView.setToolTip(_translate("discoverToWhat3words", "List of what3words address"))
         self.showAllMarkersCheckBox.setToolTip(_translate("discoverToWhat3words", "Show All Markers"))
         self.showAllMarkersCheckBox.setText(_translate("discoverToWhat3words", "Show All Markers"))
         self.clearMarkersButton.setToolTip(_translate("discoverToWhat3words", "Clear Markers"))
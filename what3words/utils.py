@@ -1,15 +1,290 @@
 # utils.py
 
+import os
+import threading
+import time
+from itertools import islice
+
+from qgis.core import Qgis, QgsApplication, QgsMessageLog, QgsTask, QgsCoordinateReferenceSystem, QgsCoordinateTransform, QgsProject
 from what3words.w3w import what3words
+from what3words.cache import W3WCache, SquareIndex, AutosuggestCache
+from what3words.gridtiles import GridTileCache, TILE_SQUARES, endpointFolder
+from what3words.languages import LanguageCatalogue
+from what3words.scheduler import RequestScheduler
 from qgiscommons2.settings import pluginSetting
 
+# Number of features read and converted at a time by the processing algorithms
+BATCH_SIZE = 500
+
+_cache = None
+_cacheLock = threading.Lock()
+_squareIndex = SquareIndex()
+# Autosuggest responses, shared by every client and kept while QGIS runs
+_suggestionCache = AutosuggestCache()
+_gridTileCache = GridTileCache()
+_gridTileEndpoint = None  # API base URL of the tiles in _gridTileCache
+_scheduler = RequestScheduler()
+
+# Pooled what3words API instances, one per thread
+_clients = threading.local()
+_clientStats = {'created': 0, 'reused': 0}
+_settingsVersion = 0
+
+# Coordinate transforms, one cache per thread as transforms are not shared between threads
+_transforms = threading.local()
+_transformsVersion = 0
+_transformSignalsConnected = False
+
+# Seconds to wait before retrying a failed refresh of the language catalogue
+LANGUAGE_RETRY_INTERVAL = 600
+
+_languageCatalogue = None
+_languageRefresh = None
+_languageRefreshAttempt = None
+
+def batched(iterable, size=BATCH_SIZE):
+    """
+    Splits an iterable into lists of at most `size` items.
+    """
+    iterator = iter(iterable)
+    batch = list(islice(iterator, size))
+    while batch:
+        yield batch
+        batch = list(islice(iterator, size))
+
+def resolve_distinct(keys, resolveMany, feedback=None, size=BATCH_SIZE):
+    """
+    Resolves each distinct key once, in batches.
+
+    :param keys: Iterable of hashable keys, possibly repeated
+    :param resolveMany: Callable taking a list of distinct keys and returning the list of their results
+    :param feedback: Optional QgsProcessingFeedback used to stop on cancellation and report progress
+    :return: A dict of key -> result for every key resolved before any cancellation
+    """
+    distinct = list(dict.fromkeys(keys))
+    resolved = {}
+    for batch in batched(distinct, size):
+        if feedback is not None and feedback.isCanceled():
+            break
+        resolved.update(zip(batch, resolveMany(batch)))
+        if feedback is not None:
+            feedback.setProgress(int(len(resolved) * 100 / len(distinct)))
+    return resolved
+
+def _crsKey(crs):
+    if isinstance(crs, str):
+        return crs
+    return crs.authid() or crs.toWkt()
+
+def invalidate_transforms():
+    """
+    Discards the cached coordinate transforms, in every thread.
+
+    Called when the project CRS or transform context changes, or the project is cleared.
+    """
+    global _transformsVersion
+    _transformsVersion += 1
+
+def get_transform(source, destination):
+    """
+    Returns a coordinate transform between two CRSs, using the transform context of the current project.
+
+    Transforms are built once per (source CRS, destination CRS) pair and reused until
+    the project transform context changes, instead of being rebuilt for every point.
+
+    Args:
+        source: Source CRS, as a QgsCoordinateReferenceSystem or an identifier such as 'EPSG:3857'.
+        destination: Destination CRS, as a QgsCoordinateReferenceSystem or an identifier.
+
+    Returns:
+        QgsCoordinateTransform: The transform.
+    """
+    global _transformSignalsConnected
+    if not _transformSignalsConnected:
+        project = QgsProject.instance()
+        project.crsChanged.connect(invalidate_transforms)
+        project.transformContextChanged.connect(invalidate_transforms)
+        project.cleared.connect(invalidate_transforms)
+        _transformSignalsConnected = True
+
+    if getattr(_transforms, 'version', None) != _transformsVersion:
+        _transforms.cache = {}
+        _transforms.version = _transformsVersion
+    key = (_crsKey(source), _crsKey(destination))
+    transform = _transforms.cache.get(key)
+    if transform is None:
+        if isinstance(source, str):
+            source = QgsCoordinateReferenceSystem(source)
+        if isinstance(destination, str):
+            destination = QgsCoordinateReferenceSystem(destination)
+        transform = QgsCoordinateTransform(source, destination, QgsProject.instance())
+        _transforms.cache[key] = transform
+    return transform
+
+def get_w3w_cache():
+    """
+    Returns the shared conversion cache configured in the plugin settings.
+
+    The cache is only reopened when its location or limits change.
+
+    Returns:
+        W3WCache: The conversion cache, or None if caching is disabled.
+    """
+    global _cache
+    if not pluginSetting("cacheEnabled", namespace="what3words"):
+        return None
+
+    folder = pluginSetting("cacheLocation", namespace="what3words") or \
+        os.path.join(QgsApplication.qgisSettingsDirPath(), "what3words")
+    path = os.path.join(folder, "cache.sqlite")
+    maxEntries = int(pluginSetting("cacheMaxEntries", namespace="what3words") or 0)
+    ttl = int(float(pluginSetting("cacheTTLDays", namespace="what3words") or 0) * 86400)
+
+    # Several threads may get the cache at once: only one reopens it, and a cache
+    # replaced here stays usable, as an empty one, by the clients still holding it
+    with _cacheLock:
+        if _cache is None or _cache.path != path:
+            if _cache is not None:
+                _cache.close()
+            _cache = W3WCache(path, maxEntries=maxEntries, ttl=ttl)
+        else:
+            _cache.maxEntries = maxEntries
+            _cache.ttl = ttl
+        return _cache
+
+def get_grid_tile_cache():
+    """
+    Returns the shared cache of live grid tiles.
+
+    Tiles are kept in memory and, when the conversion cache is enabled, also in
+    a "grid" folder next to it, with one subfolder per API base URL. The disk
+    side follows the size and expiry limits of the conversion cache.
+
+    Returns:
+        GridTileCache: The grid tile cache.
+    """
+    global _gridTileEndpoint
+    apiBaseUrl = pluginSetting("apiBaseUrl", namespace="what3words")
+    folder = None
+    if pluginSetting("cacheEnabled", namespace="what3words"):
+        folder = os.path.join(pluginSetting("cacheLocation", namespace="what3words") or
+                              os.path.join(QgsApplication.qgisSettingsDirPath(), "what3words"),
+                              "grid", endpointFolder(apiBaseUrl))
+        maxEntries = int(pluginSetting("cacheMaxEntries", namespace="what3words") or 0)
+        _gridTileCache.maxDiskTiles = max(_gridTileCache.maxTiles, maxEntries // TILE_SQUARES) if maxEntries else 0
+        _gridTileCache.ttl = int(float(pluginSetting("cacheTTLDays", namespace="what3words") or 0) * 86400)
+    if apiBaseUrl != _gridTileEndpoint:
+        # Tiles in memory came from another endpoint
+        _gridTileEndpoint = apiBaseUrl
+        _gridTileCache.clear()
+    _gridTileCache.folder = folder
+    return _gridTileCache
+
+def get_language_catalogue(refresh=True):
+    """
+    Returns the shared catalogue of available languages, the single source for all language lists.
+
+    The catalogue is read from disk and never blocks on the network; when it is
+    missing or out of date and `refresh` is set, a refresh is started in the background.
+    Code running while the plugin loads, such as initAlgorithm(), passes refresh=False
+    so that loading never touches the network.
+
+    Returns:
+        LanguageCatalogue: The language catalogue.
+    """
+    global _languageCatalogue
+    if _languageCatalogue is None:
+        _languageCatalogue = LanguageCatalogue(
+            os.path.join(QgsApplication.qgisSettingsDirPath(), "what3words", "languages.json"))
+    if refresh and _languageCatalogue.isStale():
+        refresh_language_catalogue()
+    return _languageCatalogue
+
+def refresh_language_catalogue(force=False):
+    """
+    Fetches the available languages from the API in a background task and updates the catalogue.
+
+    When the list of languages changes, the processing algorithms are reloaded so their
+    language parameters offer the new list. Failed refreshes are retried after
+    LANGUAGE_RETRY_INTERVAL seconds, unless `force` is set.
+    """
+    global _languageRefresh, _languageRefreshAttempt
+    now = time.monotonic()
+    if _languageRefresh is not None:
+        return
+    if not force and _languageRefreshAttempt is not None and now - _languageRefreshAttempt < LANGUAGE_RETRY_INTERVAL:
+        return
+    _languageRefreshAttempt = now
+
+    def fetch(task):
+        return get_w3w_instance().getLanguages()['languages']
+
+    def finished(exception, languages=None):
+        global _languageRefresh
+        _languageRefresh = None
+        if exception is not None or languages is None:
+            QgsMessageLog.logMessage(f"Could not update the what3words languages: {exception}", "what3words", Qgis.Warning)
+            return
+        if _languageCatalogue.update(languages):
+            provider = QgsApplication.processingRegistry().providerById("what3words")
+            if provider is not None:
+                provider.refreshAlgorithms()
+
+    _languageRefresh = QgsTask.fromFunction("Updating what3words languages", fetch, on_finished=finished)
+    QgsApplication.taskManager().addTask(_languageRefresh)
+
+def get_request_scheduler():
+    """
+    Returns the request scheduler shared by all what3words API instances,
+    updated with the rate and retry limits from the plugin settings.
+
+    Returns:
+        RequestScheduler: The shared request scheduler.
+    """
+    requestsPerSecond = float(pluginSetting("requestsPerSecond", namespace="what3words") or 0)
+    maxRetries = int(pluginSetting("maxRetries", namespace="what3words") or 0)
+    _scheduler.configure(requestsPerSecond, maxRetries)
+    return _scheduler
+
+def invalidate_w3w_instance():
+    """
+    Marks the pooled what3words API instances as outdated.
+
+    Must be called whenever the plugin settings may have changed. The next call
+    to get_w3w_instance() in each thread reads the settings again, and only builds
+    a new instance if the API key, address language or API base URL changed.
+    The memoized results of the expression functions are forgotten.
+    """
+    global _settingsVersion, _languageRefreshAttempt
+    _settingsVersion += 1
+    _languageRefreshAttempt = None  # A new API key may fix a failed language refresh
+    # Results and errors of the expression functions may depend on the old settings.
+    # Imported here as the expression functions module imports this one.
+    from what3words.w3wfunctions import clear_w3w_function_cache
+    clear_w3w_function_cache()
+
+def w3w_instance_stats():
+    """
+    Returns how many what3words API instances were built and how many times one was reused.
+    """
+    return dict(_clientStats)
+
 def get_w3w_instance():
     """
-    Creates and returns a what3words API instance based on the current settings.
+    Returns the what3words API instance for the calling thread, configured from the current settings.
+
+    Instances are pooled per thread, so repeated calls reuse the same instance,
+    together with its network connections and request pool, until the settings
+    are invalidated with invalidate_w3w_instance().
 
     Returns:
         what3words: A configured what3words API instance.
     """
+    client = getattr(_clients, 'client', None)
+    if client is not None and _clients.version == _settingsVersion:
+        _clientStats['reused'] += 1
+        return client
+
     apiKey = pluginSetting("apiKey", namespace="what3words")
     addressLanguage = pluginSetting("addressLanguage", namespace="what3words")
     apiBaseUrl = pluginSetting("apiBaseUrl", namespace="what3words")  # Add apiBaseUrl if applicable
@@ -17,4 +292,22 @@ def get_w3w_instance():
     if not apiKey:
         raise ValueError("API key is not set. Please configure the plugin settings.")
 
-    return what3words(apikey=apiKey, addressLanguage=addressLanguage, apiBaseUrl=apiBaseUrl)
\ No newline at end of file
+    maxConcurrentRequests = int(pluginSetting("maxConcurrentRequests", namespace="what3words") or 1)
+
+    if client is not None and (client.apikey, client.addressLanguage, client.apiBaseUrl) == (apiKey, addressLanguage, apiBaseUrl):
+        # Same endpoint and credentials: keep the instance, refresh the other settings
+        _clientStats['reused'] += 1
+        client.cache = get_w3w_cache()
+        client.scheduler = get_request_scheduler()
+        if client.maxConcurrentRequests != maxConcurrentRequests:
+            client.maxConcurrentRequests = maxConcurrentRequests
+            client.pool().maxInFlight = max(1, maxConcurrentRequests)
+    else:
+        _clientStats['created'] += 1
+        client = what3words(apikey=apiKey, addressLanguage=addressLanguage, apiBaseUrl=apiBaseUrl,
+                            cache=get_w3w_cache(), squareIndex=_squareIndex,
+                            maxConcurrentRequests=maxConcurrentRequests, scheduler=get_request_scheduler(),
+                            suggestionCache=_suggestionCache)
+        _clients.client = client
+    _clients.version = _settingsVersion
+    return client
@@ -0,0 +1,56 @@
+import re
+
+from what3words.cache import normalizeWords
+
+# Characters that may separate the words of a what3words address, in any language
+SEPARATORS = ".｡。･・︒។։။۔።।"
+
+# Pattern of a possible what3words address, as documented by the what3words API
+POSSIBLE_3WA_PATTERN = r"^\/*(?:[^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]{1,}[.｡。･・︒។։။۔።।][^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]{1,}[.｡。･・︒។։۔።।][^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]{1,}|[<.,>?\/\";:£§º©®\s]+[.｡。･・︒។։။۔።।][^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]+|[^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]+([\u0020\u00A0][^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]+){1,3}[.｡。･・︒។։۔።।][^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]+([\u0020\u00A0][^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]+){1,3}[.｡。･・︒។։။۔።।][^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]+([\u0020\u00A0][^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]+){1,3})$"
+
+_match = re.compile(POSSIBLE_3WA_PATTERN).match
+_separator = re.compile(f"[{SEPARATORS}]")
+
+
+def is_possible_3wa(text):
+    """
+    Determines if a string is in the form of a possible three word address, without calling the API.
+
+    Every form accepted by the full pattern contains a separator, so strings
+    without one (e.g. free text) are rejected before the pattern is tried.
+
+    :param text: Text to check
+    :return: True if possible 3 word address, False otherwise
+    """
+    if not text or not isinstance(text, str):
+        return False
+    if '.' not in text and _separator.search(text) is None:
+        return False
+    return _match(text) is not None
+
+
+def filter_possible_3wa(texts):
+    """
+    Returns an iterator over the strings of `texts` that are possible three word addresses.
+    """
+    return filter(is_possible_3wa, texts)
+
+
+def validate_3wa(value):
+    """
+    Normalizes a value read from a layer or file and checks it is a possible three word address.
+
+    :param value: The value to check
+    :return: A tuple (address, reason): the normalized address and None if it is a
+    possible three word address, or None and the reason why it is not
+    """
+    if value is None or getattr(value, 'isNull', lambda: False)():  # None, or a NULL attribute
+        return None, "Missing what3words address."
+    if not isinstance(value, str):
+        return None, f"Not a text value: {value!r}."
+    words = normalizeWords(value)
+    if not words:
+        return None, "Missing what3words address."
+    if not is_possible_3wa(words):
+        return None, f"'{value}' is not in the form of a what3words address."
+    return words, None
@@ -23,28 +23,168 @@ SOFTWARE.
 
 import urllib.parse
 import json
-import re
+import time
 from qgiscommons2.network.networkaccessmanager import NetworkAccessManager
+from what3words.requestpool import W3WRequestPool
+from what3words.cache import squareCellFor, AutosuggestCache
+from what3words.validator import is_possible_3wa
 from qgiscommons2.settings import pluginSetting
 from qgis.utils import iface
 from qgis.core import Qgis
+from qgis.PyQt.QtCore import QCoreApplication, QEventLoop, QThread, QTimer
 
 W3W_PLUGIN_VERSION_NUMBER = '4.4'
 W3W_PLUGIN_VERSION = f'what3words-QGIS/{W3W_PLUGIN_VERSION_NUMBER} ()'
 
+QUOTA_EXCEEDED_MESSAGE = ("Quota exceeded or API plan does not have access to this feature. "
+                          "Please change your plan at https://accounts.what3words.com/select-plan, "
+                          "or contact support@what3words.com.")
+
+# Minimum number of seconds between two identical API error messages in the message bar
+ERROR_NOTIFICATION_INTERVAL = 10
+
+# Longest wait before retrying a request made from the main thread, in seconds
+MAIN_THREAD_MAX_RETRY_DELAY = 2
+
+_lastErrorNotification = {'message': None, 'time': 0}
+
 class GeoCodeException(Exception):
     pass
+
+def notifyApiError(message):
+    """
+    Shows an API error in the QGIS message bar.
+
+    Repeated errors are shown only once every ERROR_NOTIFICATION_INTERVAL seconds,
+    and errors raised outside the main thread (e.g. by processing algorithms) are
+    not shown, as they are already reported by the caller.
+    """
+    if not _onMainThread():
+        return
+    now = time.time()
+    if message == _lastErrorNotification['message'] and now - _lastErrorNotification['time'] < ERROR_NOTIFICATION_INTERVAL:
+        return
+    _lastErrorNotification['message'] = message
+    _lastErrorNotification['time'] = now
+    iface.messageBar().pushMessage("what3words", message, level=Qgis.Critical, duration=5)
+
+def _onMainThread():
+    app = QCoreApplication.instance()
+    return app is not None and QThread.currentThread() == app.thread()
+
+def _waitBeforeRetry(delay):
+    """
+    Waits before retrying a request. On the main thread, events other than user
+    input keep being processed, as NetworkAccessManager does while waiting for a reply.
+    """
+    if _onMainThread():
+        loop = QEventLoop()
+        QTimer.singleShot(int(delay * 1000), loop.quit)
+        loop.exec_(QEventLoop.ExcludeUserInputEvents)
+    else:
+        time.sleep(delay)
+
+def _retryAfterHeader(headers):
+    """
+    Finds the Retry-After value in the headers collected by NetworkAccessManager.
+    """
+    for k, v in headers.items():
+        if 'retry-after' in k.lower():
+            return v[2:-1] if v.startswith("b'") else v
+    return None
 		
 
 class what3words(object):
     """what3words API"""
 
-    def __init__(self, apikey='', addressLanguage='', apiBaseUrl='https://api.what3words.com'):
+    def __init__(self, apikey='', addressLanguage='', apiBaseUrl='https://api.what3words.com', cache=None, squareIndex=None,
+                 maxConcurrentRequests=8, scheduler=None, suggestionCache=None):
         # Retrieve the API base URL from the plugin settings
         self.apiBaseUrl = apiBaseUrl
         self.apikey = apikey
         self.addressLanguage = addressLanguage
+        self.cache = cache  # Optional W3WCache consulted before calling the API
+        self.squareIndex = squareIndex  # Optional in-memory SquareIndex consulted before the cache
+        self.maxConcurrentRequests = maxConcurrentRequests
+        self.scheduler = scheduler  # Optional RequestScheduler pacing and retrying requests
+        self.suggestionCache = suggestionCache  # Optional AutosuggestCache consulted before calling the API
         self.nam = NetworkAccessManager()
+        self._pool = None
+
+    def pool(self):
+        """
+        Returns the request pool used for concurrent requests, creating it on first use.
+        """
+        if self._pool is None:
+            self._pool = W3WRequestPool(self.maxConcurrentRequests, self.scheduler)
+        return self._pool
+
+    def _lookupSquare(self, lat, lng, language):
+        """
+        Looks up a coordinate in the in-memory square index and then in the persistent cache.
+
+        :return: The known conversion for the square containing the point, or None
+        """
+        if self.squareIndex is not None:
+            result = self.squareIndex.find(lat, lng, language)
+            if result is not None:
+                return result
+        if self.cache is not None:
+            result = self.cache.getSquare(lat, lng, language)
+            if result is not None:
+                if self.squareIndex is not None:
+                    self.squareIndex.add(result)
+                return result
+        return None
+
+    def _lookupWords(self, words):
+        """
+        Looks up a what3words address in the in-memory square index and then in the persistent cache.
+
+        :return: The known conversion for the address, or None
+        """
+        if self.squareIndex is not None:
+            result = self.squareIndex.findWords(words)
+            if result is not None:
+                return result
+        if self.cache is not None:
+            result = self.cache.getWords(words)
+            if result is not None:
+                if self.squareIndex is not None:
+                    self.squareIndex.add(result)
+                return result
+        return None
+
+    def _remember(self, result):
+        """
+        Stores a conversion returned by the API in the square index and the persistent cache.
+        """
+        self._rememberMany([result])
+
+    def _rememberMany(self, results):
+        if not results:
+            return
+        if self.squareIndex is not None:
+            for result in results:
+                self.squareIndex.add(result)
+        if self.cache is not None:
+            self.cache.putMany(results)
+
+    def _conversionResult(self, response_json, error_message):
+        """
+        Extracts the conversion from a convert-to-3wa or convert-to-coordinates response.
+        """
+        if 'square' in response_json:
+            return {
+                'square': response_json['square'],
+                'words': response_json.get('words', ''),
+                'nearestPlace': response_json.get('nearestPlace', ''),
+                'country': response_json.get('country', ''),
+                'language': response_json.get('language', ''),
+                'coordinates': response_json['coordinates']
+            }
+        else:
+            raise GeoCodeException(response_json.get('error', error_message))
 
     def convertToCoordinates(self, words='index.home.raft', format='json'):
         """
@@ -56,22 +196,60 @@ class what3words(object):
         """
         if isinstance(words, list):
             words = "%s.%s.%s" % (words[0], words[1], words[2])
+        if format == 'json':
+            cached = self._lookupWords(words)
+            if cached is not None:
+                return cached
         params = {'words': words, 'format': format}
         url = f"{self.apiBaseUrl}/v3/convert-to-coordinates"
         response_json = self.postRequest(url, params)
 
-        if 'square' in response_json:
-            return {
-                'square': response_json['square'],
-                'coordinates': response_json['coordinates'],
-                'nearestPlace': response_json.get('nearestPlace', ''),
-                'words': response_json.get('words', ''),
-                'country': response_json.get('country', ''),
-                'language': response_json.get('language', '')
-            }
-        else:
-            error_message = response_json.get('error', 'Failed to retrieve the what3words address square')
-            raise GeoCodeException(error_message)
+        result = self._conversionResult(response_json, 'Failed to retrieve the what3words address square')
+        if format == 'json':
+            self._remember(result)
+        return result
+
+    def convertToCoordinatesMany(self, words_list):
+        """
+        Convert several what3words addresses to coordinates, issuing the API requests concurrently.
+
+        Addresses already known to the square index or the cache are not requested,
+        and each distinct address is requested only once.
+
+        :param words_list: The what3words addresses to convert
+        :return: A list with, for each address, either its conversion (as returned by
+        convertToCoordinates) or the GeoCodeException raised while converting it
+        """
+        results = [None] * len(words_list)
+        pending = {}
+        for i, words in enumerate(words_list):
+            cached = self._lookupWords(words)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(words, []).append(i)
+
+        keys = list(pending)
+        url = f"{self.apiBaseUrl}/v3/convert-to-coordinates"
+        responses = self.postRequests(url, [{'words': words, 'format': 'json'} for words in keys])
+        self._fanOut(keys, responses, pending, results, 'Failed to retrieve the what3words address square')
+        return results
+
+    def _fanOut(self, keys, responses, pending, results, error_message):
+        """
+        Converts batch responses into conversions and copies each one to all the inputs that requested it.
+        """
+        converted = []
+        for key, response in zip(keys, responses):
+            if not isinstance(response, Exception):
+                try:
+                    response = self._conversionResult(response, error_message)
+                    converted.append(response)
+                except GeoCodeException as e:
+                    response = e
+            for i in pending[key]:
+                results[i] = response
+        self._rememberMany(converted)
 
     def convertTo3wa(self, lat='', lng='', format='json', language=None):
         """
@@ -83,23 +261,166 @@ class what3words(object):
         :param language: The language for the what3words address (optional)
         :return: The square, what3words address, and coordinates
         """
+        language = language or self.addressLanguage
+        if format == 'json':
+            cached = self._lookupSquare(float(lat), float(lng), language)
+            if cached is not None:
+                return cached
         coords = "%s,%s" % (lat, lng)
-        params = {'coordinates': coords, 'format': format, 'language': language or self.addressLanguage}
+        params = {'coordinates': coords, 'format': format, 'language': language}
         url = f"{self.apiBaseUrl}/v3/convert-to-3wa"
         response_json = self.postRequest(url, params)
 
-        if 'square' in response_json:
-            return {
-                'square': response_json['square'],
-                'words': response_json['words'],
-                'nearestPlace': response_json.get('nearestPlace', ''),
-                'country': response_json.get('country', ''),
-                'language': response_json.get('language', ''),
-                'coordinates': response_json['coordinates'] 
-            }
-        else:
-            error_message = response_json.get('error', 'Failed to retrieve the coordinates for what3words address')
-            raise GeoCodeException(error_message)
+        result = self._conversionResult(response_json, 'Failed to retrieve the coordinates for what3words address')
+        if format == 'json':
+            self._remember(result)
+        return result
+
+    def convertTo3waMany(self, points, language=None):
+        """
+        Convert several coordinates to what3words addresses, issuing the API requests concurrently.
+
+        Points falling in squares already known to the square index or the cache are
+        not requested, and each distinct point is requested only once.
+
+        When a square index or cache is available, points are requested in two waves:
+        first one point per 3m cell, then only the points that did not fall in any of
+        the squares returned by the first wave.
+
+        :param points: A list of (lat, lng) tuples
+        :param language: The language for the what3words addresses (optional)
+        :return: A list with, for each point, either its conversion (as returned by
+        convertTo3wa) or the GeoCodeException raised while converting it
+        """
+        language = language or self.addressLanguage
+        results = [None] * len(points)
+        pending = {}
+        for i, (lat, lng) in enumerate(points):
+            lat, lng = float(lat), float(lng)
+            cached = self._lookupSquare(lat, lng, language)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault((lat, lng), []).append(i)
+
+        url = f"{self.apiBaseUrl}/v3/convert-to-3wa"
+
+        def request(keys):
+            responses = self.postRequests(url, [{'coordinates': "%s,%s" % (lat, lng), 'format': 'json', 'language': language}
+                                                for lat, lng in keys])
+            self._fanOut(keys, responses, pending, results, 'Failed to retrieve the coordinates for what3words address')
+
+        if self.squareIndex is None and self.cache is None:
+            request(list(pending))
+            return results
+
+        representatives = {}
+        for key in pending:
+            representatives.setdefault(squareCellFor(*key), key)
+        request(list(representatives.values()))
+
+        # Most of the remaining points fall in a square returned by the first wave
+        leftovers = []
+        for key in set(pending) - set(representatives.values()):
+            cached = self._lookupSquare(key[0], key[1], language)
+            if cached is not None:
+                for i in pending[key]:
+                    results[i] = cached
+            else:
+                leftovers.append(key)
+        request(leftovers)
+        return results
+
+    def convertLanguageMany(self, words_list, language=None):
+        """
+        Translate several what3words addresses to another language, issuing the API requests concurrently.
+
+        Each address is located from the square index, the cache or the API, and its
+        square is converted to the target language as soon as its coordinates are known,
+        so the two hops of different addresses overlap instead of running one after the
+        other. Addresses already in the target language need no second request, and
+        squares already known in the target language need no request at all.
+
+        :param words_list: The what3words addresses to translate
+        :param language: The target language (optional)
+        :return: A list with, for each address, either its conversion in the target
+        language (as returned by convertTo3wa) or the GeoCodeException raised while translating it
+        """
+        language = language or self.addressLanguage
+        results = [None] * len(words_list)
+        pending = {}
+        for i, words in enumerate(words_list):
+            pending.setdefault(words, []).append(i)
+
+        headers = {'X-W3W-Plugin': W3W_PLUGIN_VERSION}
+        loop = QEventLoop()
+        outstanding = [0]
+
+        def finish(words, result):
+            for i in pending[words]:
+                results[i] = result
+
+        def submit(endpoint, params, words, callback):
+            outstanding[0] += 1
+
+            def done(reply):
+                # Whatever the callback raises, the address gets a result and the loop is left
+                # once no request is outstanding
+                try:
+                    callback(reply)
+                except Exception as e:
+                    finish(words, e if isinstance(e, GeoCodeException) else GeoCodeException(f"Request failed: {e}"))
+                finally:
+                    outstanding[0] -= 1
+                    if outstanding[0] == 0:
+                        loop.quit()
+
+            self.pool().submit(self._requestUrl(f"{self.apiBaseUrl}/v3/{endpoint}", params), done, headers)
+
+        def convert(reply, error_message):
+            result = self._conversionResult(self._parseReply(reply), error_message)
+            self._remember(result)
+            return result
+
+        def translate(words, located):
+            if located.get('language', '').lower() == language.lower():
+                finish(words, located)
+                return
+            lat, lng = located['coordinates']['lat'], located['coordinates']['lng']
+            cached = self._lookupSquare(lat, lng, language)
+            if cached is not None:
+                finish(words, cached)
+                return
+            params = {'coordinates': "%s,%s" % (lat, lng), 'format': 'json', 'language': language}
+            submit('convert-to-3wa', params, words, lambda reply: translated(words, reply))
+
+        def located(words, reply):
+            try:
+                result = convert(reply, 'Failed to retrieve the what3words address square')
+            except GeoCodeException as e:
+                finish(words, e)
+                return
+            translate(words, result)
+
+        def translated(words, reply):
+            try:
+                finish(words, convert(reply, 'Failed to retrieve the coordinates for what3words address'))
+            except GeoCodeException as e:
+                finish(words, e)
+
+        for words in pending:
+            cached = self._lookupWords(words)
+            if cached is not None:
+                try:
+                    translate(words, cached)
+                except Exception as e:
+                    finish(words, GeoCodeException(f"Request failed: {e}"))
+            else:
+                submit('convert-to-coordinates', {'words': words, 'format': 'json'}, words,
+                       lambda reply, words=words: located(words, reply))
+        if outstanding[0]:
+            loop.exec_(QEventLoop.ExcludeUserInputEvents)
+        return results
 
     def getLanguages(self):
         """
@@ -122,6 +443,29 @@ class what3words(object):
         url = f"{self.apiBaseUrl}/v3/grid-section"
         return self.postRequest(url, params)
 
+    def getGridSectionMany(self, bounding_boxes):
+        """
+        Fetches the what3words grid for several bounding boxes, issuing the API requests concurrently.
+
+        :param bounding_boxes: A list of strings in the format 'lat1,lng1,lat2,lng2'
+        :return: A list with, for each bounding box, either the grid data or the
+        GeoCodeException raised while fetching it
+        """
+        url = f"{self.apiBaseUrl}/v3/grid-section"
+        return self.postRequests(url, [{'bounding-box': bounding_box, 'format': 'json'} for bounding_box in bounding_boxes])
+
+    def getGridSectionAsync(self, callback, bounding_box):
+        """
+        Fetches the grid section of a bounding box without blocking.
+
+        :param callback: Called with the JSON response containing the grid lines,
+        or with the GeoCodeException raised while fetching them
+        :param bounding_box: The bounding box, as south_lat,west_lng,north_lat,east_lng
+        :return: A W3WPendingRequest that can be passed to pool().abort()
+        """
+        url = f"{self.apiBaseUrl}/v3/grid-section"
+        return self._requestAsync(url, {'bounding-box': bounding_box, 'format': 'json'}, callback)
+
     def autosuggest(self, input_text, format='json', language=None, focus=None, clip_to_country=None, clip_to_bounding_box=None, clip_to_circle=None, clip_to_polygon=None, input_type=None, prefer_land=None, locale=None):
         """
         Fetches suggestions for a partial what3words address.
@@ -141,6 +485,106 @@ class what3words(object):
         Returns:
         - JSON response containing the suggestions.
         """
+        params = self._autosuggestParams(input_text, format, language, focus, clip_to_country, clip_to_bounding_box,
+                                         clip_to_circle, clip_to_polygon, input_type, prefer_land, locale)
+        key = self._suggestionKey(params)
+        cached = self._cachedSuggestions(key)
+        if cached is not None:
+            return cached
+        url = f"{self.apiBaseUrl}/v3/autosuggest"
+        response = self.postRequest(url, params)
+        self._rememberSuggestions(key, response)
+        return response
+
+    def autosuggestMany(self, requests):
+        """
+        Fetches suggestions for several partial what3words addresses, issuing the API requests concurrently.
+
+        :param requests: A list of dicts, each with the keyword arguments of one autosuggest() call
+        :return: A list with, for each request, either the JSON response containing the
+        suggestions or the GeoCodeException raised while fetching them
+        """
+        results = [None] * len(requests)
+        pending = {}
+        for i, kwargs in enumerate(requests):
+            params = self._autosuggestParams(**kwargs)
+            key = self._suggestionKey(params)
+            cached = self._cachedSuggestions(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(key, (params, []))[1].append(i)
+
+        keys = list(pending)
+        url = f"{self.apiBaseUrl}/v3/autosuggest"
+        responses = self.postRequests(url, [pending[key][0] for key in keys])
+        for key, response in zip(keys, responses):
+            if not isinstance(response, Exception):
+                self._rememberSuggestions(key, response)
+            for i in pending[key][1]:
+                results[i] = response
+        return results
+
+    def autosuggestAsync(self, callback, input_text, **kwargs):
+        """
+        Fetches suggestions for a partial what3words address without blocking.
+
+        :param callback: Called with the JSON response containing the suggestions,
+        or with the GeoCodeException raised while fetching them
+        :param input_text: The full or partial 3 word address to obtain suggestions for
+        :param kwargs: The other keyword arguments accepted by autosuggest()
+        :return: A W3WPendingRequest that can be passed to pool().abort(), or None if
+        the suggestions were cached, in which case the callback has already been called
+        """
+        params = self._autosuggestParams(input_text, **kwargs)
+        key = self._suggestionKey(params)
+        cached = self._cachedSuggestions(key)
+        if cached is not None:
+            callback(cached)
+            return None
+
+        def done(response):
+            if not isinstance(response, Exception):
+                self._rememberSuggestions(key, response)
+            callback(response)
+
+        return self._requestAsync(f"{self.apiBaseUrl}/v3/autosuggest", params, done)
+
+    def _requestAsync(self, url, params, callback):
+        """
+        Queues a request on the request pool and returns immediately.
+
+        :param callback: Called with the JSON response from the API, or with the GeoCodeException describing its failure
+        :return: A W3WPendingRequest that can be passed to pool().abort()
+        """
+        def done(reply):
+            try:
+                response = self._parseReply(reply)
+            except GeoCodeException as e:
+                response = e
+            callback(response)
+
+        return self.pool().submit(self._requestUrl(url, params), done, {'X-W3W-Plugin': W3W_PLUGIN_VERSION})
+
+    def _suggestionKey(self, params):
+        return (self.apiBaseUrl,) + AutosuggestCache.key(params)
+
+    def _cachedSuggestions(self, key):
+        if self.suggestionCache is None:
+            return None
+        return self.suggestionCache.get(key)
+
+    def _rememberSuggestions(self, key, response):
+        """
+        Caches a successful autosuggest response; responses reporting an error are not cached.
+        """
+        if self.suggestionCache is not None and 'error' not in response:
+            self.suggestionCache.put(key, response)
+
+    def _autosuggestParams(self, input_text, format='json', language=None, focus=None, clip_to_country=None, clip_to_bounding_box=None, clip_to_circle=None, clip_to_polygon=None, input_type=None, prefer_land=None, locale=None):
+        """
+        Builds the query parameters of an autosuggest request.
+        """
         params = {
             'input': input_text,
             'format': format,
@@ -164,9 +608,7 @@ class what3words(object):
             params['prefer-land'] = str(prefer_land).lower()  # Convert boolean to string
         if locale:
             params['locale'] = locale
-
-        url = f"{self.apiBaseUrl}/v3/autosuggest"
-        return self.postRequest(url, params)
+        return params
     
     def is_possible_3wa(self, text: str) -> bool:
         """
@@ -174,16 +616,20 @@ class what3words(object):
         :param text: Text to check
         :return: True if possible 3 word address, False otherwise
         """
-        regex_match = r"^\/*(?:[^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]{1,}[.｡。･・︒។։။۔።।][^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]{1,}[.｡。･・︒។։۔።।][^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]{1,}|[<.,>?\/\";:£§º©®\s]+[.｡。･・︒។։။۔።।][^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]+|[^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]+([\u0020\u00A0][^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]+){1,3}[.｡。･・︒។։۔።।][^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]+([\u0020\u00A0][^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]+){1,3}[.｡。･・︒។։။۔።।][^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]+([\u0020\u00A0][^0-9`~!@#$%^&*()+\-_=\[\{\]}\\|'<>.,?\/\";:£§º©®\s]+){1,3})$"
-        return re.match(regex_match, text) is not None
+        return is_possible_3wa(text)
 
     def is_valid_3wa(self, text: str) -> bool:
         """
-        Determines if the string passed in is a real three-word address by calling the API.
+        Determines if the string passed in is a real three-word address.
+
+        Addresses known to the square index or the cache are valid without a request;
+        otherwise the API is called.
         :param text: Text to check
         :return: True if valid 3 word address, False otherwise
         """
-        if self.is_possible_3wa(text):
+        if is_possible_3wa(text):
+            if self._lookupWords(text) is not None:
+                return True
             try:
                 result = self.autosuggest(text) # Call autosuggest to validate the 3 word address
                 if result.get("suggestions") and result["suggestions"][0]["words"] == text:
@@ -205,30 +651,100 @@ class what3words(object):
         url = url + '?' + encparams
         headers = {'X-W3W-Plugin': W3W_PLUGIN_VERSION}  # Use the centralized plugin version
 
-        try:
-            response, content = self.nam.request(url, headers=headers)
-            response_json = json.loads(content)
-            
-            if response.status == 200:
-                return response_json
-            else:
-                if 'error' in response_json:
-                    error_code = response_json['error'].get('code', 'UnknownError')
-                    error_message = response_json['error'].get('message', 'Unknown error occurred')
-                    full_error_message = f"{error_code}: {error_message}"
+        attempt = 0
+        while True:
+            if self.scheduler is not None:
+                self.scheduler.wait()
+            # The network manager keeps the result of the previous request and only adds headers to it
+            result = self.nam.httpResult()
+            result.headers = {}
+            result.status_code = 0
+            try:
+                response, content = self.nam.request(url, headers=headers)
+                response_json = json.loads(content)
+
+                if response.status == 200:
+                    return response_json
                 else:
-                    full_error_message = response.reason
-
-                iface.messageBar().pushMessage("what3words", f"API error: {full_error_message}", level=Qgis.Critical, duration=5)
-                raise GeoCodeException(f"API error: {full_error_message}")
-
-        except Exception as e:
-            error_message = str(e)
-            if "Payment Required" in error_message:
-                raise GeoCodeException(
-                    "Quota exceeded or API plan does not have access to this feature. "
-                    "Please change your plan at https://accounts.what3words.com/select-plan, "
-                    "or contact support@what3words.com."
-                )
-            else:
-                raise GeoCodeException(f"Request failed: {error_message}")
\ No newline at end of file
+                    if 'error' in response_json:
+                        error_code = response_json['error'].get('code', 'UnknownError')
+                        error_message = response_json['error'].get('message', 'Unknown error occurred')
+                        full_error_message = f"{error_code}: {error_message}"
+                    else:
+                        full_error_message = response.reason
+
+                    raise GeoCodeException(f"API error: {full_error_message}")
+
+            except Exception as e:
+                # Retry rate limited requests and server errors after a backoff delay,
+                # unless the main thread would be kept waiting too long
+                if self.scheduler is not None:
+                    result = self.nam.httpResult()
+                    maxDelay = MAIN_THREAD_MAX_RETRY_DELAY if _onMainThread() else None
+                    delay = self.scheduler.retryDelay(attempt, result.status_code,
+                                                      _retryAfterHeader(result.headers), maxDelay)
+                    if delay is not None:
+                        attempt += 1
+                        _waitBeforeRetry(delay)
+                        continue
+
+                # Only errors that are not retried, or still failing after the last retry, are shown
+                if isinstance(e, GeoCodeException):
+                    notifyApiError(str(e))
+                error_message = str(e)
+                if "Payment Required" in error_message:
+                    raise GeoCodeException(QUOTA_EXCEEDED_MESSAGE)
+                else:
+                    raise GeoCodeException(f"Request failed: {error_message}")
+
+    def postRequests(self, url, params_list):
+        """
+        Makes several HTTP requests to the same what3words API endpoint concurrently.
+
+        At most `maxConcurrentRequests` requests are in flight at any time. Errors are
+        returned rather than raised, so a failed request does not stop the others.
+
+        :param url: The URL for the API endpoint
+        :param params_list: A list with the parameters for each request
+        :return: A list with, for each request, either the JSON response from the API
+        or the GeoCodeException describing its failure
+        """
+        headers = {'X-W3W-Plugin': W3W_PLUGIN_VERSION}
+        urls = [self._requestUrl(url, params) for params in params_list]
+
+        results = []
+        for reply in self.pool().run(urls, headers=headers):
+            try:
+                results.append(self._parseReply(reply))
+            except GeoCodeException as e:
+                results.append(e)
+        return results
+
+    def _requestUrl(self, url, params):
+        """
+        Returns the full URL of a request, including the API key.
+        """
+        params.update({'key': self.apikey})
+        return url + '?' + urllib.parse.urlencode(params)
+
+    def _parseReply(self, reply):
+        """
+        Converts a W3WReply from the request pool into the JSON response from the API.
+
+        :param reply: The W3WReply to parse
+        :return: The JSON response from the API or raises GeoCodeException on failure
+        """
+        try:
+            response_json = json.loads(reply.content) if reply.content else {}
+        except ValueError:
+            response_json = {}
+
+        if reply.status == 200 and reply.error is None:
+            return response_json
+        if reply.status == 402:
+            raise GeoCodeException(QUOTA_EXCEEDED_MESSAGE)
+        if isinstance(response_json.get('error'), dict):
+            error_code = response_json['error'].get('code', 'UnknownError')
+            error_message = response_json['error'].get('message', 'Unknown error occurred')
+            raise GeoCodeException(f"API error: {error_code}: {error_message}")
+        raise GeoCodeException(f"Request failed: {reply.error or reply.status}")
\ No newline at end of file
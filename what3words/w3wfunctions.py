@@ -1,13 +1,42 @@
-from qgis.core import Qgis, QgsExpression, QgsGeometry, QgsPointXY, QgsMessageLog, QgsCoordinateReferenceSystem, QgsCoordinateTransform, QgsProject
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from qgis.core import (Qgis, QgsExpression, QgsExpressionContext, QgsExpressionNode, QgsFeatureRequest, QgsGeometry,
+                       QgsPointXY, QgsMessageLog, QgsCoordinateReferenceSystem, QgsCoordinateTransform, QgsProject)
 from qgis.utils import qgsfunction
 from qgis.PyQt.QtCore import QVariant
 from qgiscommons2.settings import pluginSetting
 from what3words.w3w import what3words
-from what3words.utils import get_w3w_instance  # Import the new utility function
+from what3words.utils import get_w3w_instance, get_transform  # Import the new utility function
 
 
 group_name = "what3words Tools"
 
+# Maximum number of function results kept in memory
+MEMO_SIZE = 100000
+# Seconds during which an error raised while prefetching is returned instead of requesting again
+MEMO_ERROR_TTL = 60
+# Seconds during which an expression is not prefetched again for the same layer
+PREFETCH_INTERVAL = 300
+# An expression is only prefetched once it has been evaluated for this many distinct features of a layer
+# within PREFETCH_WINDOW seconds, as in a field calculation. Previews evaluate a single feature.
+PREFETCH_MIN_FEATURES = 3
+PREFETCH_WINDOW = 2
+# Layers, or selections, with more features than this are never prefetched
+PREFETCH_MAX_FEATURES = 50000
+
+# Results of the what3words functions, shared by all expressions. Values are either
+# the result or a _MemoError holding the exception raised while prefetching it.
+_memo = OrderedDict()
+_memoLock = threading.Lock()
+# (function name, expression, layer id) -> time of the last prefetch
+_prefetched = {}
+# (function name, expression, layer id) -> (time of the first evaluation, ids of the features evaluated)
+_evaluated = {}
+
+_MemoError = namedtuple('_MemoError', ['error', 'expires'])
+
 # Define EPSG:4326 for transformations
 epsg4326 = QgsCoordinateReferenceSystem("EPSG:4326")
 
@@ -23,13 +52,187 @@ def transform_coords(y, x, crs):
     Returns:
     - Transformed (lat, lon) as (y, x) in EPSG:4326.
     """
-    coord_crs = QgsCoordinateReferenceSystem(crs)
-    transform = QgsCoordinateTransform(coord_crs, epsg4326, QgsProject.instance())
+    transform = get_transform(crs, epsg4326)
     transformed_pt = transform.transform(x, y)
     return transformed_pt.y(), transformed_pt.x()  # Return lat, lon (y, x in EPSG:4326)
 
+def clear_w3w_function_cache():
+    """
+    Forgets the memoized results of the what3words expression functions.
+    """
+    with _memoLock:
+        _memo.clear()
+        _prefetched.clear()
+        _evaluated.clear()
+
+def _memoKey(w3w, *parts):
+    """
+    Returns the memo key of a function result, which depends on the endpoint and address language of the instance.
+    """
+    return (w3w.apiBaseUrl, w3w.addressLanguage) + parts
+
+def _memoGet(key):
+    with _memoLock:
+        value = _memo.get(key)
+        if isinstance(value, _MemoError) and value.expires <= time.monotonic():
+            del _memo[key]
+            value = None
+        if value is not None:
+            _memo.move_to_end(key)
+        return value
+
+def _memoPut(key, value):
+    if isinstance(value, Exception):
+        value = _MemoError(value, time.monotonic() + MEMO_ERROR_TTL)
+    with _memoLock:
+        _memo[key] = value
+        _memo.move_to_end(key)
+        while len(_memo) > MEMO_SIZE:
+            _memo.popitem(last=False)
+
+def _memoized(key, compute):
+    """
+    Returns the memoized result for `key`, computing and storing it on a miss.
+    Errors stored by a prefetch are raised again for MEMO_ERROR_TTL seconds, instead of
+    being requested once per feature. Errors raised by `compute` are not stored.
+    """
+    value = _memoGet(key)
+    if isinstance(value, _MemoError):
+        raise value.error
+    if value is None:
+        value = compute()
+        _memoPut(key, value)
+    return value
+
+def _isNull(value):
+    return value is None or (isinstance(value, QVariant) and value.isNull())
+
+def _unconditionalCalls(node, name):
+    """
+    Yields the nodes calling the function `name` that are evaluated for every feature,
+    that is, not inside a CASE branch.
+    """
+    if node is None:
+        return
+    nodeType = node.nodeType()
+    if nodeType == QgsExpressionNode.ntFunction:
+        args = node.args().list() if node.args() else []
+        if QgsExpression.Functions()[node.fnIndex()].name() == name:
+            yield node
+        children = args
+    elif nodeType == QgsExpressionNode.ntUnaryOperator:
+        children = [node.operand()]
+    elif nodeType == QgsExpressionNode.ntBinaryOperator:
+        children = [node.opLeft(), node.opRight()]
+    elif nodeType == QgsExpressionNode.ntInOperator:
+        children = [node.node()] + node.list().list()
+    elif nodeType == QgsExpressionNode.ntIndexOperator:
+        children = [node.container(), node.index()]
+    else:
+        children = []
+    for child in children:
+        yield from _unconditionalCalls(child, name)
+
+def _startsRun(key, feature, now):
+    """
+    Records the evaluation of an expression for a feature, and tells whether the
+    evaluations so far look like a run over the layer rather than a preview.
+
+    :return: The ids of the features evaluated, once there are PREFETCH_MIN_FEATURES of them, otherwise None
+    """
+    with _memoLock:
+        for expired in [k for k, (start, _) in _evaluated.items() if now - start > PREFETCH_WINDOW]:
+            del _evaluated[expired]
+        if now - _prefetched.get(key, -PREFETCH_INTERVAL) < PREFETCH_INTERVAL:
+            return None
+        start, fids = _evaluated.setdefault(key, (now, set()))
+        fids.add(feature.id())
+        if len(fids) < PREFETCH_MIN_FEATURES:
+            return None
+        del _evaluated[key]
+        _prefetched[key] = now
+        return fids
+
+def _prefetch(name, feature, parent, context, resolve):
+    """
+    Resolves in one pass all the distinct arguments the function `name` is called with
+    when `parent` is evaluated over the features of the layer in `context`, and stores
+    the results in the memo.
+
+    This runs once per expression and layer when a field calculation starts, that is once
+    it has been evaluated for PREFETCH_MIN_FEATURES features within PREFETCH_WINDOW seconds. The per-feature
+    evaluation that follows is answered from memory rather than with one blocking API
+    request per feature. When all the features evaluated so far are selected, only the
+    selected features are prefetched, as for "Only update selected features".
+
+    Only field calculations are prefetched: the Field Calculator, its attribute table bar
+    and the processing algorithm all set the row_number variable. Map and layout
+    rendering, which sets map_id, is never prefetched, nor are layers or selections of
+    more than PREFETCH_MAX_FEATURES features.
+
+    :param resolve: Callable taking the what3words instance and a set of argument
+    tuples, returning a dict of memo key -> result or exception
+    """
+    if context is None or parent is None or feature is None:
+        return
+    if not context.hasVariable('row_number') or context.hasVariable('map_id'):
+        return
+    layer = QgsProject.instance().mapLayer(context.variable('layer_id') or '')
+    if layer is None or not hasattr(layer, 'getFeatures'):
+        return
+    fids = _startsRun((name, parent.expression(), layer.id()), feature, time.monotonic())
+    if fids is None:
+        return
+    selected = layer.selectedFeatureIds() if hasattr(layer, 'selectedFeatureIds') else []
+    onlySelected = bool(selected) and fids.issubset(selected)
+    if (len(selected) if onlySelected else layer.featureCount()) > PREFETCH_MAX_FEATURES:
+        return
+
+    expressions = []
+    for node in _unconditionalCalls(parent.rootNode(), name):
+        expressions.append([QgsExpression(arg.dump()) for arg in node.args().list()])
+    if not expressions:
+        return
+
+    evalContext = QgsExpressionContext(context)
+    columns = set()
+    needsGeometry = False
+    for exps in expressions:
+        for exp in exps:
+            exp.prepare(evalContext)
+            columns.update(exp.referencedColumns())
+            needsGeometry = needsGeometry or exp.needsGeometry()
+    request = QgsFeatureRequest()
+    if onlySelected:
+        request.setFilterFids(selected)
+    if QgsFeatureRequest.ALL_ATTRIBUTES not in columns:
+        request.setSubsetOfAttributes(list(columns), layer.fields())
+    if not needsGeometry:
+        request.setFlags(QgsFeatureRequest.NoGeometry)
+
+    distinct = set()
+    for feature in layer.getFeatures(request):
+        evalContext.setFeature(feature)
+        for exps in expressions:
+            args = tuple(exp.evaluate(evalContext) for exp in exps)
+            if not any(_isNull(arg) for arg in args):
+                distinct.add(args)
+
+    try:
+        results = resolve(get_w3w_instance(), distinct)
+    except Exception as e:
+        QgsMessageLog.logMessage(f"Could not prefetch {name} results: {e}", "what3words", Qgis.Warning)
+        return
+    for memoKey, value in results.items():
+        _memoPut(memoKey, value)
+
+def _resolveCoordinates(w3w, distinct):
+    words_list = list({str(args[0]) for args in distinct})
+    results = w3w.convertToCoordinatesMany(words_list)
+    return {_memoKey(w3w, 'convert_to_coord', words): result for words, result in zip(words_list, results)}
+
 @qgsfunction(-1, group=group_name)
-def convert_to_coord(values, feature, parent):
+def convert_to_coord(values, feature, parent, context=None):
     """
     Convert a what3words address to latitude and longitude.
 
@@ -68,8 +271,10 @@ def convert_to_coord(values, feature, parent):
         delimiter = values[2] if num_args > 2 else ', '
         crs = values[3] if num_args > 3 else 'EPSG:4326'
         
+        _prefetch('convert_to_coord', feature, parent, context, _resolveCoordinates)
         w3w = get_w3w_instance()
-        result = w3w.convertToCoordinates(what3words)
+        result = _memoized(_memoKey(w3w, 'convert_to_coord', str(what3words)),
+                           lambda: w3w.convertToCoordinates(what3words))
         lat = result['coordinates']['lat']
         lon = result['coordinates']['lng']
         
@@ -87,8 +292,24 @@ def convert_to_coord(values, feature, parent):
         return None
 
 
+def _resolveAddresses(w3w, distinct):
+    byLanguage = {}
+    for args in distinct:
+        try:
+            point = (float(args[0]), float(args[1]))
+        except (IndexError, TypeError, ValueError):
+            continue  # Reported when the feature itself is evaluated
+        language = args[2] if len(args) > 2 else "en"
+        byLanguage.setdefault(language, set()).add(point)
+    resolved = {}
+    for language, points in byLanguage.items():
+        points = list(points)
+        for (lat, lon), result in zip(points, w3w.convertTo3waMany(points, language=language)):
+            resolved[_memoKey(w3w, 'convert_to_3wa', lat, lon, language)] = result
+    return resolved
+
 @qgsfunction(-1, group=group_name)
-def convert_to_3wa(values, feature, parent):
+def convert_to_3wa(values, feature, parent, context=None):
     """
     Convert latitude and longitude to a what3words address (3 word address).
 
@@ -121,8 +342,10 @@ def convert_to_3wa(values, feature, parent):
         lon = values[1]
         language = values[2] if len(values) > 2 else "en"  # Default to English if no language provided
 
+        _prefetch('convert_to_3wa', feature, parent, context, _resolveAddresses)
         w3w = get_w3w_instance()
-        result = w3w.convertTo3wa(lat, lon, language=language)
+        result = _memoized(_memoKey(w3w, 'convert_to_3wa', float(lat), float(lon), language),
+                           lambda: w3w.convertTo3wa(lat, lon, language=language))
         return result['words']  # Return the 3 word address
 
     except Exception as e:
@@ -130,8 +353,20 @@ def convert_to_3wa(values, feature, parent):
         return None
 
 
+def _resolveLanguageChanges(w3w, distinct):
+    byLanguage = {}
+    for args in distinct:
+        if len(args) >= 2:
+            byLanguage.setdefault(args[1], set()).add(str(args[0]))
+    resolved = {}
+    for target_language, words_list in byLanguage.items():
+        words_list = list(words_list)
+        for what3words, result in zip(words_list, w3w.convertLanguageMany(words_list, target_language)):
+            resolved[_memoKey(w3w, 'change_w3w_language', what3words, target_language)] = result
+    return resolved
+
 @qgsfunction(-1, group="what3words Tools")
-def change_w3w_language(values, feature, parent):
+def change_w3w_language(values, feature, parent, context=None):
     """
     Change the language of a what3words address.
 
@@ -162,15 +397,18 @@ def change_w3w_language(values, feature, parent):
         what3words = values[0]
         target_language = values[1]  # Target language code (e.g., 'es', 'fr')
 
+        _prefetch('change_w3w_language', feature, parent, context, _resolveLanguageChanges)
         w3w = get_w3w_instance()
 
-        # Step 1: Convert the original w3w address back to coordinates
-        result = w3w.convertToCoordinates(what3words)
-        lat = result['coordinates']['lat']
-        lon = result['coordinates']['lng']
+        def translate():
+            # Locates the address and converts its square, skipping the second request
+            # when the address is already in the target language
+            result = w3w.convertLanguageMany([what3words], target_language)[0]
+            if isinstance(result, Exception):
+                raise result
+            return result
 
-        # Step 2: Convert the coordinates back to a what3words address in the target language
-        translated_result = w3w.convertTo3wa(lat, lon, language=target_language)
+        translated_result = _memoized(_memoKey(w3w, 'change_w3w_language', str(what3words), target_language), translate)
         return translated_result['words']
 
     except Exception as e:
@@ -178,8 +416,21 @@ def change_w3w_language(values, feature, parent):
         return None
 
 
+def _autosuggestKey(w3w, args):
+    """
+    Returns the memo key of an autosuggest_w3w call, ignoring the rank and empty options.
+    """
+    options = tuple((list(args[2:7]) + [None] * 5)[:5])
+    return _memoKey(w3w, 'autosuggest_w3w', str(args[0]), *(option or None for option in options))
+
+def _resolveSuggestions(w3w, distinct):
+    keys = list({_autosuggestKey(w3w, args) for args in distinct})
+    requests = [dict(input_text=key[3], clip_to_country=key[4], clip_to_bounding_box=key[5], clip_to_circle=key[6],
+                     clip_to_polygon=key[7], focus=key[8]) for key in keys]
+    return dict(zip(keys, w3w.autosuggestMany(requests)))
+
 @qgsfunction(-1, group=group_name)
-def autosuggest_w3w(values, feature, parent):
+def autosuggest_w3w(values, feature, parent, context=None):
     """
     Get autosuggestions for an incomplete what3words address, allowing additional options for country, focus, bounding box, circle, and polygon.
 
@@ -239,15 +490,16 @@ def autosuggest_w3w(values, feature, parent):
 
     # Construct API parameters
     try:
+        _prefetch('autosuggest_w3w', feature, parent, context, _resolveSuggestions)
         w3w = get_w3w_instance()
-        response = w3w.autosuggest(
+        response = _memoized(_autosuggestKey(w3w, values), lambda: w3w.autosuggest(
             input_address,
             clip_to_country=country,
             clip_to_bounding_box=bbox,
             clip_to_circle=circle,
             clip_to_polygon=polygon,
             focus=focus
-        )
+        ))
 
         # Check if suggestions exist
         if 'suggestions' not in response or len(response['suggestions']) < rank: